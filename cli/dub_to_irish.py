@@ -1,32 +1,152 @@
 """CLI entrypoint for the dubbing pipeline.
 
 This lets users run `python -m cli.dub_to_irish <video> <eng_srt> <gael_srt> <output>`.
+Add `--resume` to continue an interrupted job from its checkpoint, or to
+re-dub only the lines changed in a corrected Irish SRT. Ctrl+C stops the
+job cleanly (closing the browser and keeping finished clips); press it
+again to exit at once.
 """
 
+import argparse
+import signal
 import sys
 from dubbing_core import run_dub
+from services import CancellationToken
+from services.timeline import OVERLAP_POLICIES, SHIFT
 
 
 def main():
     """CLI entry point for dubbing."""
-    if len(sys.argv) < 5:
-        print("Usage: python -m cli.dub_to_irish <video.mp4> <eng.srt> <gael.srt> <output.mp4>")
-        sys.exit(1)
-    
-    video_path = sys.argv[1]
-    eng_srt_path = sys.argv[2]
-    gael_srt_path = sys.argv[3]
-    output_filename = sys.argv[4]
-    
+    parser = argparse.ArgumentParser(
+        prog="python -m cli.dub_to_irish",
+        description="Dub a video into Irish using its English and Irish subtitles.",
+    )
+    parser.add_argument("video", help="Input video, e.g. video.mp4")
+    parser.add_argument("eng_srt", help="English subtitles (.srt)")
+    parser.add_argument("gael_srt", help="Irish subtitles (.srt)")
+    parser.add_argument("output", help="Output filename, saved next to the video")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=(
+            "Reuse the clips of a previous run and only synthesize missing "
+            "or corrected lines"
+        ),
+    )
+    parser.add_argument(
+        "--fit",
+        action="store_true",
+        help="Trim and speed up clips that would run into the next subtitle",
+    )
+    parser.add_argument(
+        "--solve-placement",
+        action="store_true",
+        help="Place all clips at once to minimize drift and skipped lines",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        metavar="N",
+        help=(
+            "Synthesize up to N lines at once, each in its own headless "
+            "browser (fewer if memory is short)"
+        ),
+    )
+    parser.add_argument(
+        "--readiness",
+        action="store_true",
+        help="Wait for the Abair page to be ready instead of fixed pauses",
+    )
+    parser.add_argument(
+        "--batch-by-voice",
+        action="store_true",
+        help="Synthesize each voice's lines together to switch voices less",
+    )
+    parser.add_argument(
+        "--pack-lines",
+        action="store_true",
+        help="Synthesize short consecutive lines of one voice in one request",
+    )
+    parser.add_argument(
+        "--lookahead",
+        type=int,
+        metavar="N",
+        help="Synthesize up to N lines ahead of the one being placed",
+    )
+    parser.add_argument(
+        "--overlap",
+        choices=OVERLAP_POLICIES,
+        default=SHIFT,
+        help=(
+            "What a clip does to the previous one if it is still playing: "
+            "wait for it (shift, the default), cut it off, or mix both"
+        ),
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        metavar="SECONDS",
+        help="Stop the job if it is still running after this many seconds",
+    )
+    args = parser.parse_args()
+    if args.solve_placement and args.overlap != SHIFT:
+        parser.error("--solve-placement only works with --overlap shift")
+
+    cancellation = CancellationToken()
+
+    def interrupt(signum, frame):
+        print("\nStopping - press Ctrl+C again to exit at once")
+        cancellation.cancel("Interrupted")
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+
+    signal.signal(signal.SIGINT, interrupt)
+
     print(f"Starting dubbing process...")
-    print(f"  Video: {video_path}")
-    print(f"  English SRT: {eng_srt_path}")
-    print(f"  Irish SRT: {gael_srt_path}")
-    print(f"  Output: {output_filename}")
+    print(f"  Video: {args.video}")
+    print(f"  English SRT: {args.eng_srt}")
+    print(f"  Irish SRT: {args.gael_srt}")
+    print(f"  Output: {args.output}")
+    if args.resume:
+        print("  Resuming from checkpoint")
+    if args.fit:
+        print("  Fitting clips to their subtitles")
+    if args.solve_placement:
+        print("  Solving clip placement")
+    if args.concurrency > 1:
+        print(f"  Synthesizing up to {args.concurrency} lines at once")
+    if args.readiness:
+        print("  Waiting on page readiness")
+    if args.batch_by_voice:
+        print("  Grouping lines by voice")
+    if args.pack_lines:
+        print("  Packing short lines")
+    if args.lookahead:
+        print(f"  Looking {args.lookahead} lines ahead")
+    if args.overlap != SHIFT:
+        print(f"  Overlapping clips: {args.overlap}")
+    if args.deadline:
+        print(f"  Deadline: {args.deadline:g} seconds")
     print()
-    
-    result = run_dub(video_path, eng_srt_path, gael_srt_path, output_filename)
-    
+
+    result = run_dub(
+        args.video,
+        args.eng_srt,
+        args.gael_srt,
+        args.output,
+        resume=args.resume,
+        time_fit=args.fit,
+        solve_placement=args.solve_placement,
+        cancellation=cancellation,
+        deadline_sec=args.deadline,
+        concurrency=args.concurrency,
+        readiness_mode=args.readiness,
+        batch_by_voice=args.batch_by_voice,
+        pack_lines=args.pack_lines,
+        lookahead=args.lookahead,
+        overlap_policy=args.overlap,
+    )
+
     if result.startswith("ERROR:"):
         print(f"\n{result}")
         sys.exit(1)
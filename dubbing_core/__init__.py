@@ -9,22 +9,40 @@ provides a stable import path for frontends (GUI/CLI) to call the core
 pipeline from a single place.
 """
 
-from typing import Optional
+from typing import Iterable, List, Optional, Tuple
 
+from .core import run_dubbing_batch as _run_dubbing_batch
 from .core import run_dubbing_process as _run_dubbing_process
 
 
 def run_dub(
-    video_path: str, eng_srt_path: str, gael_srt_path: str, output_filename: str
+    video_path: str,
+    eng_srt_path: str,
+    gael_srt_path: str,
+    output_filename: str,
+    **options,
 ) -> str:
     """Run the dubbing pipeline via the consolidated core implementation.
 
     This calls the implementation in `dubbing_core.core` and returns
     the same status string as the original `run_dubbing_process`.
+    Keyword options (e.g. `audio_backend`) are passed through unchanged.
     """
     try:
         return _run_dubbing_process(
-            video_path, eng_srt_path, gael_srt_path, output_filename
+            video_path, eng_srt_path, gael_srt_path, output_filename, **options
         )
     except Exception as e:
         raise RuntimeError(f"dubbing_core.run_dub failed: {e}")
+
+
+def run_dub_batch(jobs: Iterable[Tuple[str, str, str, str]], **options) -> List:
+    """Run the dubbing pipeline for several videos with shared services.
+
+    Each job is a (video, eng_srt, gael_srt, output_filename) tuple. Returns
+    one `models.JobResult` per job; keyword options apply to every job.
+    """
+    try:
+        return _run_dubbing_batch(jobs, **options)
+    except Exception as e:
+        raise RuntimeError(f"dubbing_core.run_dub_batch failed: {e}")
@@ -6,18 +6,119 @@ delegating responsibilities to specialized services following SOLID principles.
 """
 
 from pathlib import Path
+import os
 
 from models import DubbingJob
 from services import (
+    AudioClipCache,
     AbairAudioService,
     MoviePyVideoService,
     SRTSubtitleService,
     ConsoleProgressObserver,
     DubbingOrchestrator,
+    HttpAudioService,
+    PooledAbairAudioService,
 )
+from services.audio_cache import default_cache_dir
+from services.rate_limiter import AdaptiveRateLimiter
+from services.placement import PlacementSolver
+from services.request_packer import RequestPacker
+from services.time_fit import TimeFitter
 
+AUDIO_BACKENDS = ("browser", "http")
 
-def run_dubbing_process(video_path, eng_srt_path, gael_srt_path, output_filename):
+
+def create_audio_service(
+    audio_backend,
+    job,
+    observer,
+    synthesis_url=None,
+    browser_daemon=None,
+    concurrency=1,
+    readiness_mode=False,
+):
+    """
+    Create the audio service for the requested backend.
+
+    Args:
+        audio_backend (str): "browser" drives Abair.ie with Selenium,
+            "http" calls the synthesis endpoint directly
+        job (DubbingJob): Job the service will synthesize for
+        observer (ProgressObserver): Observer shared by all services
+        synthesis_url (str): Endpoint override for the "http" backend
+        browser_daemon (str): "host:port" of a `services.browser_daemon` for
+            the "browser" backend to borrow a warm browser from; defaults to
+            the ABAIR_BROWSER_DAEMON environment variable
+        concurrency (int): Syntheses the service must serve at once; above 1
+            the "browser" backend runs a pool of that many headless browsers
+            (fewer if memory is short, and without the daemon)
+        readiness_mode (bool): Have the "browser" backend wait on the page
+            being ready instead of fixed sleeps
+
+    Returns:
+        AudioService: Configured (not yet set up) audio service
+    """
+    cache = AudioClipCache(default_cache_dir())
+
+    if audio_backend == "browser" and concurrency > 1:
+        return PooledAbairAudioService(
+            observer, size=concurrency, cache=cache, readiness_mode=readiness_mode
+        )
+    if audio_backend == "browser":
+        return AbairAudioService(
+            job.current_folder,
+            observer,
+            cache=cache,
+            readiness_mode=readiness_mode,
+            daemon_address=browser_daemon or os.environ.get("ABAIR_BROWSER_DAEMON"),
+        )
+    if audio_backend == "http":
+        pool = {"pool_size": concurrency} if concurrency > 1 else {}
+        return HttpAudioService(
+            observer,
+            endpoint=synthesis_url or HttpAudioService.DEFAULT_ENDPOINT,
+            cache=cache,
+            **pool,
+        )
+
+    raise ValueError(
+        f"Unknown audio backend '{audio_backend}' (expected one of {AUDIO_BACKENDS})"
+    )
+
+
+def create_rate_limiter(audio_backend, observer):
+    """
+    Create the request pacing for the requested backend.
+
+    Returns:
+        AdaptiveRateLimiter for the "http" backend, or None to let the
+        orchestrator start from its browser-friendly default
+    """
+    if audio_backend == "http":
+        return AdaptiveRateLimiter(2.0, max_rate=20.0, observer=observer)
+    return None
+
+
+def run_dubbing_process(
+    video_path,
+    eng_srt_path,
+    gael_srt_path,
+    output_filename,
+    audio_backend="browser",
+    synthesis_url=None,
+    browser_daemon=None,
+    resume=False,
+    time_fit=False,
+    solve_placement=False,
+    cancellation=None,
+    deadline_sec=None,
+    concurrency=1,
+    readiness_mode=False,
+    batch_by_voice=False,
+    pack_lines=False,
+    lookahead=None,
+    overlap_policy="shift",
+):
     """
     Execute the entire dubbing pipeline.
 
@@ -29,6 +130,35 @@ def run_dubbing_process(video_path, eng_srt_path, gael_srt_path, output_filename
         eng_srt_path (str): Full path to English SRT subtitle file
         gael_srt_path (str): Full path to Irish SRT subtitle file
         output_filename (str): Desired output filename (saved next to input video)
+        audio_backend (str): "browser" (default) or "http"
+        synthesis_url (str): Endpoint override for the "http" backend, e.g. a
+            local `services.synthesis_stand_in` server
+        browser_daemon (str): Address of a running `services.browser_daemon`
+            to borrow a warm browser from (see create_audio_service)
+        resume (bool): Reuse the clips checkpointed by an interrupted run of
+            the same job and only synthesize the missing segments
+        time_fit (bool): Trim and speed up (by at most 30%) clips that would
+            run into the next subtitle instead of letting the track fall behind
+        solve_placement (bool): Place all clips once every one is synthesized,
+            minimizing total drift and skipped segments
+        cancellation (CancellationToken): Cancel it (e.g. from a UI thread) to
+            stop the job; the browser is closed and finished clips are kept
+            for `resume`
+        deadline_sec (float): Cancel the job once it has run this many seconds
+        concurrency (int): Lines synthesized at once; for the "browser"
+            backend each runs in its own headless Chrome, as many as memory
+            allows
+        readiness_mode (bool): Wait on the Abair page being ready instead of
+            fixed sleeps ("browser" backend)
+        batch_by_voice (bool): Synthesize each voice's lines together so the
+            voice is switched as rarely as possible
+        pack_lines (bool): Join short consecutive same-voice lines into one
+            synthesis request and split the audio back at the pauses
+        lookahead (int): Lines synthesized ahead of the one being placed
+            (by default 8 with concurrency above 1, otherwise none)
+        overlap_policy (str): What a clip does to the previous clip if it is
+            still playing: "shift" waits for it, "truncate" cuts it off, "mix"
+            plays both
 
     Returns:
         str: Success message with output path, or error message prefixed with 'ERROR:'
@@ -43,20 +173,140 @@ def run_dubbing_process(video_path, eng_srt_path, gael_srt_path, output_filename
     job = DubbingJob.from_paths(
         video_path, eng_srt_path, gael_srt_path, output_filename
     )
+    job.deadline_sec = deadline_sec
+
+    # Create orchestrator with dependency injection
+    orchestrator = create_orchestrator(
+        job,
+        audio_backend=audio_backend,
+        synthesis_url=synthesis_url,
+        browser_daemon=browser_daemon,
+        time_fit=time_fit,
+        solve_placement=solve_placement,
+        concurrency=concurrency,
+        readiness_mode=readiness_mode,
+        batch_by_voice=batch_by_voice,
+        pack_lines=pack_lines,
+        lookahead=lookahead,
+        overlap_policy=overlap_policy,
+    )
+
+    # Execute dubbing workflow
+    return orchestrator.execute(job, resume=resume, cancellation=cancellation)
 
+
+def run_dubbing_batch(
+    jobs,
+    audio_backend="browser",
+    synthesis_url=None,
+    browser_daemon=None,
+    resume=False,
+    time_fit=False,
+    solve_placement=False,
+    cancellation=None,
+    deadline_sec=None,
+    concurrency=1,
+    readiness_mode=False,
+    batch_by_voice=False,
+    pack_lines=False,
+    lookahead=None,
+    overlap_policy="shift",
+):
+    """
+    Dub several videos with one set of services.
+
+    The audio service (the browser, for Abair) is started once for the
+    whole batch, and each video is encoded while the next one is dubbed.
+
+    Args:
+        jobs: (video_path, eng_srt_path, gael_srt_path, output_filename)
+            tuples, dubbed in order
+        audio_backend, synthesis_url, browser_daemon, resume, time_fit,
+        solve_placement, concurrency, readiness_mode, batch_by_voice,
+        pack_lines, lookahead, overlap_policy: As for run_dubbing_process,
+            applied to every job
+        cancellation (CancellationToken): Cancel it to stop the batch
+        deadline_sec (float): Cancel any job once it has run this many seconds
+
+    Returns:
+        list[JobResult]: One result per job, in order; print
+        `JobResult.table(results)` for a summary
+    """
+    jobs = [DubbingJob.from_paths(*paths) for paths in jobs]
+    for job in jobs:
+        job.deadline_sec = deadline_sec
+    if not jobs:
+        return []
+
+    orchestrator = create_orchestrator(
+        jobs[0],
+        audio_backend=audio_backend,
+        synthesis_url=synthesis_url,
+        browser_daemon=browser_daemon,
+        time_fit=time_fit,
+        solve_placement=solve_placement,
+        concurrency=concurrency,
+        readiness_mode=readiness_mode,
+        batch_by_voice=batch_by_voice,
+        pack_lines=pack_lines,
+        lookahead=lookahead,
+        overlap_policy=overlap_policy,
+    )
+    return orchestrator.execute_many(jobs, resume=resume, cancellation=cancellation)
+
+
+def create_orchestrator(
+    job,
+    audio_backend="browser",
+    synthesis_url=None,
+    browser_daemon=None,
+    time_fit=False,
+    solve_placement=False,
+    concurrency=1,
+    readiness_mode=False,
+    batch_by_voice=False,
+    pack_lines=False,
+    lookahead=None,
+    overlap_policy="shift",
+):
+    """
+    Create the services for a job and the orchestrator coordinating them.
+
+    Args:
+        job (DubbingJob): Job (the first, for a batch) the audio service is
+            created for
+        audio_backend, synthesis_url, browser_daemon, time_fit,
+        solve_placement, concurrency, readiness_mode, batch_by_voice,
+        pack_lines, lookahead, overlap_policy: As for run_dubbing_process
+
+    Returns:
+        DubbingOrchestrator: Orchestrator ready to execute jobs
+    """
     # Initialize services
     observer = ConsoleProgressObserver()
-    audio_service = AbairAudioService(job.current_folder, observer)
+    audio_service = create_audio_service(
+        audio_backend,
+        job,
+        observer,
+        synthesis_url=synthesis_url,
+        browser_daemon=browser_daemon,
+        concurrency=concurrency,
+        readiness_mode=readiness_mode,
+    )
     video_service = MoviePyVideoService(observer)
     subtitle_service = SRTSubtitleService(observer)
 
-    # Create orchestrator with dependency injection
-    orchestrator = DubbingOrchestrator(
+    return DubbingOrchestrator(
         audio_service=audio_service,
         video_service=video_service,
         subtitle_service=subtitle_service,
         observer=observer,
+        concurrency=concurrency,
+        batch_by_voice=batch_by_voice,
+        rate_limiter=create_rate_limiter(audio_backend, observer),
+        request_packer=RequestPacker() if pack_lines else None,
+        lookahead=lookahead,
+        overlap_policy=overlap_policy,
+        time_fitter=TimeFitter() if time_fit else None,
+        placement_solver=PlacementSolver() if solve_placement else None,
     )
-
-    # Execute dubbing workflow
-    return orchestrator.execute(job)
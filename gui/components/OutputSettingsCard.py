@@ -11,17 +11,26 @@ from gui.localization import t
 class OutputSettingsCard:
     """Output settings card component"""
 
-    def __init__(self, parent, colors, output_name_var, spacing=20, padding=20):
+    def __init__(
+        self, parent, colors, output_name_var, resume_var=None, spacing=20, padding=20
+    ):
         self.parent = parent
         self.colors = colors
         self.output_name_var = output_name_var
+        self.resume_var = resume_var or tk.BooleanVar(value=False)
         self.spacing = spacing
         self.padding = padding
 
     def render(self):
         """Render the output settings card"""
         # Create card
-        card = CardComponent(self.parent, t("output_settings_title"), self.colors, self.spacing, self.padding)
+        card = CardComponent(
+            self.parent,
+            t("output_settings_title"),
+            self.colors,
+            self.spacing,
+            self.padding,
+        )
         card_frame = card.render()
 
         # Output filename input
@@ -49,4 +58,30 @@ class OutputSettingsCard:
         )
         output_entry.pack(fill="x", ipady=2, ipadx=2)
 
+        # --- Resume checkbox ---
+        resume_frame = tk.Frame(card_frame, bg=self.colors["card"])
+        resume_frame.pack(fill="x", padx=self.padding, pady=(8, 0))
+
+        resume_cb = tk.Checkbutton(
+            resume_frame,
+            text=t("resume_label"),
+            variable=self.resume_var,
+            bg=self.colors["card"],
+            fg=self.colors["primary"],
+            activebackground=self.colors["card"],
+            activeforeground=self.colors["primary"],
+            selectcolor=self.colors["card"],
+            font=("Segoe UI", 9, "bold"),
+            cursor="hand2",
+        )
+        resume_cb.pack(side="left")
+
+        tk.Label(
+            resume_frame,
+            text=t("resume_description"),
+            bg=self.colors["card"],
+            fg=self.colors["text_light"],
+            font=("Segoe UI", 8),
+        ).pack(side="left", padx=(6, 0))
+
         return card_frame
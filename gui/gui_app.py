@@ -7,6 +7,7 @@ import os
 
 # Use the shared wrapper module so GUI imports a single stable API.
 from dubbing_core import run_dub
+from services import CancellationToken, OperationCancelled
 
 # Import all components from the components module
 from gui.components import (
@@ -67,6 +68,12 @@ class DubbingApp:
         # Auto-dub mode: skip SRT file inputs and generate them via Whisper+NLLB
         self.auto_dub = tk.BooleanVar(value=False)
 
+        # Resume mode: reuse the clips checkpointed by an interrupted run
+        self.resume = tk.BooleanVar(value=False)
+
+        # Token of the running job; the action button cancels it
+        self.cancellation = None
+
         self.file_displays = {
             "video": tk.StringVar(value=t("no_file_selected")),
             "eng_srt": tk.StringVar(value=t("no_file_selected")),
@@ -146,6 +153,7 @@ class DubbingApp:
             main_container,
             self.colors,
             self.output_name,
+            resume_var=self.resume,
             spacing=card_spacing,
             padding=card_padding,
         )
@@ -203,7 +211,11 @@ class DubbingApp:
             self.file_displays[var_key].set(filename)
 
     def start_dubbing_thread(self):
-        """Event handler for starting dubbing process"""
+        """Event handler for starting (or, while running, cancelling) dubbing"""
+        if self.cancellation is not None:
+            self.cancel_dubbing()
+            return
+
         # 1. Validation Check
         if self.auto_dub.get():
             # Auto-dub mode: only the video file is required
@@ -219,20 +231,29 @@ class DubbingApp:
                 )
                 return
 
-        # 2. Update UI state
-        self.status_action_component.start_button.disable()
-        self.status_action_component.start_button.update_text(t("processing_button"))
-        self.status_action_component.start_button.update_color(
-            self.colors["text_light"]
-        )
+        # 2. Update UI state; the button cancels the job from now on
+        self.cancellation = CancellationToken()
+        self.status_action_component.start_button.update_text(t("cancel_button"))
+        self.status_action_component.start_button.update_color(self.colors["danger"])
         self.status_action_component.status_label.config(text=t("status_processing"))
         self.status_action_component.status_indicator.config(fg="#F59E0B")  # Orange
 
         # 3. Start the process in a new thread
-        process_thread = threading.Thread(target=self.run_process_in_thread)
+        process_thread = threading.Thread(
+            target=self.run_process_in_thread, args=(self.cancellation,)
+        )
         process_thread.start()
 
-    def run_process_in_thread(self):
+    def cancel_dubbing(self):
+        """Event handler for cancelling the running dubbing process"""
+        self.cancellation.cancel()
+        self.status_action_component.start_button.disable()
+        self.status_action_component.start_button.update_text(t("cancelling_button"))
+        self.status_action_component.start_button.update_color(
+            self.colors["text_light"]
+        )
+
+    def run_process_in_thread(self, cancellation):
         """Background process execution"""
         try:
             video_path = self.paths["video"].get()
@@ -250,6 +271,7 @@ class DubbingApp:
                     ),
                 )
                 eng_srt_path, gael_srt_path = generate_srt_files(video_path, output_dir)
+                cancellation.check()
             else:
                 eng_srt_path = self.paths["eng_srt"].get()
                 gael_srt_path = self.paths["gael_srt"].get()
@@ -258,10 +280,15 @@ class DubbingApp:
             args = (video_path, eng_srt_path, gael_srt_path, output_filename)
 
             # Execute core dubbing script
-            result_message = run_dub(*args)
+            result_message = run_dub(
+                *args, resume=self.resume.get(), cancellation=cancellation
+            )
 
             self.master.after(0, lambda: self.finish_process(result_message, "green"))
 
+        except OperationCancelled:
+            self.master.after(0, lambda: self.finish_process("", "green"))
+
         except Exception as e:
             error_msg = f"ERROR: An unexpected error occurred: {e}"
             print(error_msg)
@@ -269,12 +296,23 @@ class DubbingApp:
 
     def finish_process(self, message, color):
         """Process completion handler - updates UI state"""
+        # A job that finished as it was cancelled still produced its video
+        cancelled = self.cancellation.cancelled and not message.startswith("Success")
+        self.cancellation = None
         self.status_action_component.start_button.update_text(t("start_button"))
         self.status_action_component.start_button.update_color(self.colors["primary"])
         self.status_action_component.start_button.enable()
 
-        # Check for error
-        if color == "red" or message.startswith("ERROR:"):
+        # Check for cancellation, then error
+        if cancelled:
+            messagebox.showinfo(
+                t("process_cancelled_title"), t("process_cancelled_message")
+            )
+            self.status_action_component.status_label.config(text=t("status_cancelled"))
+            self.status_action_component.status_indicator.config(
+                fg=self.colors["text_light"]
+            )
+        elif color == "red" or message.startswith("ERROR:"):
             messagebox.showerror(t("process_failed_title"), message)
             self.status_action_component.status_label.config(text=t("status_failed"))
             self.status_action_component.status_indicator.config(
@@ -35,11 +35,16 @@ class Localization:
             "status_failed": "Failed - See error message",
             "start_button": "Start Dubbing",
             "processing_button": "Processing...",
+            "cancel_button": "Cancel",
+            "cancelling_button": "Stopping...",
+            "status_cancelled": "Cancelled",
             # Dialogs
             "missing_file_title": "Missing File",
             "missing_file_message": "Please select a valid path for the {0}.",
             "process_failed_title": "Process Failed",
             "process_complete_title": "Process Complete",
+            "process_cancelled_title": "Process Cancelled",
+            "process_cancelled_message": "Dubbing was stopped. Tick Resume and start again to reuse the audio made so far.",
             # File selection
             "select_file_title": "Select {0} file",
             "video_files": "Video Files",
@@ -47,6 +52,9 @@ class Localization:
             # Auto-dub
             "auto_dub_label": "Auto Dub",
             "auto_dub_description": "(generate subtitles automatically — no SRT files needed)",
+            # Resume
+            "resume_label": "Resume",
+            "resume_description": "(reuse the audio from an earlier run)",
         },
         "ga": {
             # Window
@@ -75,11 +83,16 @@ class Localization:
             "status_failed": "Theip - Féach ar an earráid",
             "start_button": "Tosaigh an Dubáil",
             "processing_button": "Á phróiseáil...",
+            "cancel_button": "Cealaigh",
+            "cancelling_button": "Á stopadh...",
+            "status_cancelled": "Cealaithe",
             # Dialogs
             "missing_file_title": "Comhad ar Iarraidh",
             "missing_file_message": "Roghnaigh cosán bailí le do thoil don {0}.",
             "process_failed_title": "Theip ar an bPróiseas",
             "process_complete_title": "Próiseas Críochnaithe",
+            "process_cancelled_title": "Próiseas Cealaithe",
+            "process_cancelled_message": "Stopadh an dubáil. Roghnaigh Lean Ar Aghaidh agus tosaigh arís chun an fhuaim a rinneadh go dtí seo a athúsáid.",
             # File selection
             "select_file_title": "Roghnaigh comhad {0}",
             "video_files": "Comhaid Físe",
@@ -87,6 +100,9 @@ class Localization:
             # Auto-dub
             "auto_dub_label": "Uath-Dhubáil",
             "auto_dub_description": "(gin fotheidil go huathoibríoch — níl comhaid SRT de dhíth)",
+            # Resume
+            "resume_label": "Lean Ar Aghaidh",
+            "resume_description": "(athúsáid an fhuaim ó rith níos luaithe)",
         },
     }
 
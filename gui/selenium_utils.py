@@ -6,6 +6,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
+import functools
 import time
 import os
 
@@ -14,47 +15,25 @@ import os
 # resolve resource_path lazily inside `setup_selenium` instead
 
 
-def setup_selenium(current_folder):
+def setup_selenium(current_folder, headless=False, remote_debugging_port=None):
     chrome_options = Options()
     prefs = {
         "download.default_directory": current_folder,
         "download.prompt_for_download": False,
     }
     chrome_options.add_experimental_option("prefs", prefs)
-    chrome_options.add_argument("--start-maximized")
-    chrome_options.add_experimental_option("detach", True)
-
-    # Resolve resource_path without importing dubbing_core to avoid
-    # circular imports when frozen. Use sys._MEIPASS when available.
-    def resource_path(p):
-        import sys
-
-        if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
-            base = sys._MEIPASS
-        else:
-            base = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-        return os.path.join(base, p)
-
-    # When running as a PyInstaller bundle use the included chromedriver.
-    # When running from source always use webdriver-manager so it
-    # downloads a driver that matches the currently installed Chrome.
-    import sys
-    import platform
-
-    if getattr(sys, "frozen", False):
-        driver_filename = (
-            "chromedriver.exe" if platform.system() == "Windows" else "chromedriver"
-        )
-        driver_path = resource_path(os.path.join("drivers", driver_filename))
-        if os.path.exists(driver_path):
-            service = Service(driver_path)
-        else:
-            service = Service(ChromeDriverManager().install())
+    if headless:
+        # Pooled sessions run in the background and must die with the process
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--window-size=1920,1080")
     else:
-        # Running from source – let webdriver-manager pick the right version
-        service = Service(ChromeDriverManager().install())
+        chrome_options.add_argument("--start-maximized")
+        chrome_options.add_experimental_option("detach", True)
+    if remote_debugging_port:
+        # Lets other processes attach to this browser (see attach_selenium)
+        chrome_options.add_argument(f"--remote-debugging-port={remote_debugging_port}")
 
-    driver = webdriver.Chrome(service=service, options=chrome_options)
+    driver = webdriver.Chrome(service=_driver_service(), options=chrome_options)
     driver.get("https://abair.ie/synthesis")
 
     wait = WebDriverWait(driver, 15)
@@ -88,3 +67,56 @@ def setup_selenium(current_folder):
         print("   > NOTE: Could not switch language.")
 
     return driver, wait
+
+
+def attach_selenium(debugger_address, current_folder):
+    """Attach to an already running, prepared Chrome (e.g. a browser daemon
+    session) instead of launching one, and point its downloads at
+    `current_folder`."""
+    chrome_options = Options()
+    chrome_options.add_experimental_option("debuggerAddress", debugger_address)
+    driver = webdriver.Chrome(service=_driver_service(), options=chrome_options)
+
+    # Download prefs only apply at launch, so set the folder over CDP
+    driver.execute_cdp_cmd(
+        "Browser.setDownloadBehavior",
+        {"behavior": "allow", "downloadPath": os.path.abspath(current_folder)},
+    )
+    return driver, WebDriverWait(driver, 15)
+
+
+def _driver_service():
+    """Create a chromedriver Service, resolving the driver binary only once
+    per process (webdriver-manager otherwise re-checks versions each time)."""
+    return Service(_driver_path())
+
+
+@functools.lru_cache(maxsize=None)
+def _driver_path():
+    # Resolve resource_path without importing dubbing_core to avoid
+    # circular imports when frozen. Use sys._MEIPASS when available.
+    def resource_path(p):
+        import sys
+
+        if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
+            base = sys._MEIPASS
+        else:
+            base = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+        return os.path.join(base, p)
+
+    # When running as a PyInstaller bundle use the included chromedriver.
+    # When running from source always use webdriver-manager so it
+    # downloads a driver that matches the currently installed Chrome.
+    import sys
+    import platform
+
+    if getattr(sys, "frozen", False):
+        driver_filename = (
+            "chromedriver.exe" if platform.system() == "Windows" else "chromedriver"
+        )
+        driver_path = resource_path(os.path.join("drivers", driver_filename))
+        if os.path.exists(driver_path):
+            return driver_path
+
+    # Running from source – let webdriver-manager pick the right version
+    return ChromeDriverManager().install()
@@ -5,5 +5,6 @@ Domain models for Irish Auto-Dubbing application
 from .voice_config import VoiceConfig
 from .segment import Segment
 from .dub_job import DubbingJob
+from .job_result import JobResult
 
-__all__ = ["VoiceConfig", "Segment", "DubbingJob"]
+__all__ = ["VoiceConfig", "Segment", "DubbingJob", "JobResult"]
@@ -17,6 +17,8 @@ class DubbingJob:
     gael_srt_path: Path
     output_filename: str
     segments: List[Segment] = field(default_factory=list)
+    subtitle_prefix: str = ""  # Keeps subtitle files of jobs sharing a folder apart
+    deadline_sec: Optional[float] = None  # Wall-clock seconds before it is cancelled
 
     @property
     def current_folder(self) -> Path:
@@ -31,12 +33,17 @@ class DubbingJob:
     @property
     def output_srt_english(self) -> Path:
         """Get the output English subtitle path"""
-        return self.current_folder / "subtitles_english.srt"
+        return self.current_folder / f"{self.subtitle_prefix}subtitles_english.srt"
 
     @property
     def output_srt_irish(self) -> Path:
         """Get the output Irish subtitle path"""
-        return self.current_folder / "subtitles_irish.srt"
+        return self.current_folder / f"{self.subtitle_prefix}subtitles_irish.srt"
+
+    @property
+    def checkpoint_dir(self) -> Path:
+        """Get the folder holding the job's resume manifest and clips"""
+        return self.current_folder / f"{Path(self.output_filename).stem}_checkpoint"
 
     def validate(self) -> Optional[str]:
         """
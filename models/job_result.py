@@ -0,0 +1,52 @@
+"""
+Job result model
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List
+from .dub_job import DubbingJob
+
+
+@dataclass
+class JobResult:
+    """Outcome of one dubbing job in a batch, with how long each step took"""
+
+    job: DubbingJob
+    message: str = ""  # Success message, or error message prefixed with 'ERROR:'
+    timings: Dict[str, float] = field(default_factory=dict)  # Seconds per step
+
+    @property
+    def succeeded(self) -> bool:
+        """Check if the job produced its video"""
+        return bool(self.message) and not self.message.startswith("ERROR:")
+
+    @staticmethod
+    def table(results: List["JobResult"]) -> str:
+        """
+        Format results as a plain-text table, one row per job
+
+        Returns:
+            Table with each job's status and setup, dubbing, encode and total
+            seconds; failed jobs show their error in the last column
+        """
+        header = ["Job", "Setup s", "Dub s", "Encode s", "Total s", "Result"]
+        rows = [header]
+        for result in results:
+            rows.append(
+                [result.job.output_filename]
+                + [
+                    (f"{result.timings[step]:.1f}" if step in result.timings else "-")
+                    for step in ("setup_sec", "dubbing_sec", "encode_sec", "total_sec")
+                ]
+                + ["ok" if result.succeeded else result.message.removeprefix("ERROR: ")]
+            )
+
+        widths = [max(len(row[c]) for row in rows) for c in range(len(header) - 1)]
+        return "\n".join(
+            "  ".join(
+                [row[0].ljust(widths[0])]
+                + [cell.rjust(width) for cell, width in zip(row[1:-1], widths[1:])]
+                + [row[-1]]
+            ).rstrip()
+            for row in rows
+        )
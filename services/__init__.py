@@ -2,7 +2,11 @@
 Services layer for Irish Auto-Dubbing application
 """
 
+from .audio_cache import AudioClipCache
+from .cancellation import CancellationToken, OperationCancelled
 from .audio_service import AudioService, AbairAudioService
+from .abair_pool import PooledAbairAudioService
+from .http_audio_service import HttpAudioService
 from .video_service import VideoService, MoviePyVideoService
 from .subtitle_service import SubtitleService, SRTSubtitleService
 from .progress_observer import (
@@ -13,8 +17,13 @@ from .progress_observer import (
 from .dubbing_orchestrator import DubbingOrchestrator
 
 __all__ = [
+    "AudioClipCache",
+    "CancellationToken",
+    "OperationCancelled",
     "AudioService",
     "AbairAudioService",
+    "PooledAbairAudioService",
+    "HttpAudioService",
     "VideoService",
     "MoviePyVideoService",
     "SubtitleService",
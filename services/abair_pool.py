@@ -0,0 +1,317 @@
+"""
+Pool of concurrent Abair.ie browser sessions
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+import asyncio
+import ctypes
+import queue
+import shutil
+import sys
+import tempfile
+import uuid
+
+from pydub import AudioSegment
+
+from models.voice_config import VoiceConfig
+from services.audio_cache import AudioClipCache
+from services.audio_service import AudioService, AbairAudioService
+from services.progress_observer import ProgressObserver, NoOpProgressObserver
+
+# Approximate resident memory of one headless Chrome on the Abair page
+MEMORY_PER_SESSION_MB = 400
+
+# Linux memory statistics
+MEMINFO_PATH = Path("/proc/meminfo")
+
+
+def available_memory_bytes() -> Optional[int]:
+    """
+    Get the amount of physical memory currently available
+
+    Reads GlobalMemoryStatusEx on Windows and MemAvailable on Linux; memory
+    the kernel can reclaim (page cache) counts as available.
+
+    Returns:
+        Available memory in bytes, or None if it cannot be determined
+    """
+    if sys.platform == "win32":
+
+        class MEMORYSTATUSEX(ctypes.Structure):
+            _fields_ = [
+                ("dwLength", ctypes.c_ulong),
+                ("dwMemoryLoad", ctypes.c_ulong),
+                ("ullTotalPhys", ctypes.c_ulonglong),
+                ("ullAvailPhys", ctypes.c_ulonglong),
+                ("ullTotalPageFile", ctypes.c_ulonglong),
+                ("ullAvailPageFile", ctypes.c_ulonglong),
+                ("ullTotalVirtual", ctypes.c_ulonglong),
+                ("ullAvailVirtual", ctypes.c_ulonglong),
+                ("sullAvailExtendedVirtual", ctypes.c_ulonglong),
+            ]
+
+        status = MEMORYSTATUSEX()
+        status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+        if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+            return int(status.ullAvailPhys)
+        return None
+
+    # MemAvailable counts reclaimable page cache, unlike the free page count
+    try:
+        for line in MEMINFO_PATH.read_text().splitlines():
+            if line.startswith("MemAvailable:"):
+                return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def max_sessions_for_memory(
+    memory_per_session_mb: int = MEMORY_PER_SESSION_MB,
+) -> Optional[int]:
+    """
+    Get how many browser sessions fit in the available memory
+
+    Returns:
+        Session count (at least 1), or None if memory cannot be determined
+    """
+    available = available_memory_bytes()
+    if available is None:
+        return None
+    return max(1, available // (memory_per_session_mb * 1024 * 1024))
+
+
+class PooledAbairAudioService(AudioService):
+    """
+    Audio generation service backed by a pool of headless Abair.ie sessions
+
+    Each session is an AbairAudioService with its own browser and download
+    folder. Requests are handed to whichever session is idle, so callers may
+    submit work from several threads (or via submit()) concurrently.
+    """
+
+    def __init__(
+        self,
+        observer: Optional[ProgressObserver] = None,
+        size: int = 2,
+        wait_timeout: int = 15,
+        cache: Optional[AudioClipCache] = None,
+        memory_per_session_mb: int = MEMORY_PER_SESSION_MB,
+        readiness_mode: bool = False,
+    ):
+        """
+        Initialize pooled Abair audio service
+
+        Args:
+            observer: Progress observer for status updates
+            size: Requested number of browser sessions
+            wait_timeout: Selenium wait timeout in seconds
+            cache: Optional clip cache shared by all sessions
+            memory_per_session_mb: Memory budget per browser, used to cap size
+            readiness_mode: Have every session wait on DOM/network conditions
+                instead of fixed sleeps
+        """
+        self.observer = observer or NoOpProgressObserver()
+        self.wait_timeout = wait_timeout
+        self.cache = cache
+        self.readiness_mode = readiness_mode
+
+        memory_cap = max_sessions_for_memory(memory_per_session_mb)
+        self.size = max(1, size if memory_cap is None else min(size, memory_cap))
+
+        self.sessions: List[AbairAudioService] = []
+        self._idle: "queue.Queue[AbairAudioService]" = queue.Queue()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._work_dir: Optional[Path] = None
+
+    @property
+    def max_concurrency(self) -> int:
+        """Number of sessions that can synthesize at once"""
+        return len(self.sessions) or self.size
+
+    def create_session(self, download_folder: Path) -> AbairAudioService:
+        """Create one (not yet started) browser session"""
+        return AbairAudioService(
+            download_folder,
+            self.observer,
+            wait_timeout=self.wait_timeout,
+            headless=True,
+            readiness_mode=self.readiness_mode,
+        )
+
+    def setup(self):
+        """Start all browser sessions in parallel"""
+        self._work_dir = Path(tempfile.mkdtemp(prefix="abair_pool_"))
+
+        sessions = []
+        for i in range(self.size):
+            session_dir = self._work_dir / f"session_{i}"
+            session_dir.mkdir()
+            sessions.append(self.create_session(session_dir))
+
+        with ThreadPoolExecutor(max_workers=len(sessions)) as starter:
+            results = list(starter.map(self._start_session, sessions))
+
+        self.sessions = [s for s, ok in zip(sessions, results) if ok]
+        if not self.sessions:
+            self.cleanup()
+            raise RuntimeError("Failed to start any Abair browser session")
+
+        for session in self.sessions:
+            self._idle.put(session)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self.sessions), thread_name_prefix="abair-session"
+        )
+
+    def cleanup(self):
+        """Stop all sessions and remove their download folders"""
+        if self.cache:
+            self.cache.flush()
+            self.observer.on_stats("TTS cache", self.cache.stats())
+
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        for session in self.sessions:
+            session.cleanup()
+        self.sessions = []
+        self._idle = queue.Queue()
+
+        if self._work_dir:
+            shutil.rmtree(self._work_dir, ignore_errors=True)
+            self._work_dir = None
+
+    def submit(self, text: str, voice: VoiceConfig, output_dir: Path) -> Future:
+        """
+        Queue a synthesis on the next idle session
+
+        Returns:
+            Future resolving to the audio path, or None if synthesis failed
+        """
+        if not self._executor:
+            raise RuntimeError("AudioService not initialized. Call setup() first.")
+        return self._executor.submit(self._generate_on_idle_session, text, voice)
+
+    def submit_clip(self, text: str, voice: VoiceConfig) -> Future:
+        """
+        Queue a synthesis returning decoded audio on the next idle session
+
+        Returns:
+            Future resolving to the clip, or None if synthesis failed
+        """
+        if not self._executor:
+            raise RuntimeError("AudioService not initialized. Call setup() first.")
+        return self._executor.submit(self._generate_clip_on_idle_session, text, voice)
+
+    def generate_audio(
+        self, text: str, voice: VoiceConfig, output_dir: Path
+    ) -> Optional[Path]:
+        """
+        Generate audio on the next idle session
+
+        Args:
+            text: Irish text to synthesize
+            voice: Voice configuration (dialect, gender)
+            output_dir: Unused; each session downloads into its own folder
+
+        Returns:
+            Path to generated audio file or None if failed
+        """
+        return self.submit(text, voice, output_dir).result()
+
+    async def agenerate_audio(
+        self, text: str, voice: VoiceConfig, output_dir: Path
+    ) -> Optional[Path]:
+        """Await a synthesis on the pool's own executor"""
+        return await asyncio.wrap_future(self.submit(text, voice, output_dir))
+
+    def generate_clip(
+        self, text: str, voice: VoiceConfig, output_dir: Path
+    ) -> Optional[AudioSegment]:
+        """
+        Generate audio on the next idle session and return it in memory
+
+        The session decodes its download once and applies any speed change
+        to the decoded audio, so no file is re-encoded or read back.
+
+        Returns:
+            Decoded audio, or None if failed
+        """
+        return self.submit_clip(text, voice).result()
+
+    async def agenerate_clip(
+        self, text: str, voice: VoiceConfig, output_dir: Path
+    ) -> Optional[AudioSegment]:
+        """Await an in-memory synthesis on the pool's own executor"""
+        return await asyncio.wrap_future(self.submit_clip(text, voice))
+
+    def _start_session(self, session: AbairAudioService) -> bool:
+        """Start one session, reporting instead of raising on failure"""
+        try:
+            session.setup()
+            return True
+        except Exception as e:
+            self.observer.on_error(f"Browser session failed to start: {e}")
+            return False
+
+    def _generate_on_idle_session(
+        self, text: str, voice: VoiceConfig
+    ) -> Optional[Path]:
+        """Run one synthesis, holding a session exclusively while it runs"""
+        cache_key = None
+        if self.cache:
+            cache_key = self._cache_key(text, voice)
+            cached_path = self.cache.get(cache_key)
+            if cached_path:
+                return cached_path
+
+        session = self._idle.get()
+        session.cancellation = self.cancellation
+        try:
+            audio_path = session.generate_audio(text, voice, session.download_folder)
+            if audio_path:
+                # The session deletes its old synthesis files on the next
+                # request, so move the clip somewhere it can outlive that
+                audio_path = Path(
+                    shutil.move(
+                        str(audio_path),
+                        str(self._work_dir / f"{uuid.uuid4().hex}{audio_path.suffix}"),
+                    )
+                )
+        finally:
+            self._idle.put(session)
+
+        if audio_path and cache_key:
+            try:
+                self.cache.put(cache_key, audio_path)
+            except OSError as e:
+                self.observer.on_error(f"Failed to cache audio clip: {e}")
+
+        return audio_path
+
+    def _generate_clip_on_idle_session(
+        self, text: str, voice: VoiceConfig
+    ) -> Optional[AudioSegment]:
+        """Run one in-memory synthesis, holding a session while it runs"""
+        cache_key = None
+        if self.cache:
+            cache_key = self._cache_key(text, voice)
+            cached_path = self.cache.get(cache_key)
+            if cached_path:
+                return AudioSegment.from_file(str(cached_path))
+
+        session = self._idle.get()
+        session.cancellation = self.cancellation
+        try:
+            audio = session.generate_clip(text, voice, session.download_folder)
+        finally:
+            self._idle.put(session)
+
+        if audio is not None and cache_key:
+            self._store_clip_in_cache(cache_key, audio)
+
+        return audio
@@ -0,0 +1,310 @@
+"""
+Persistent content-addressed cache for synthesized TTS clips
+"""
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Optional
+import hashlib
+import json
+import os
+import shutil
+import sys
+import threading
+import time
+import unicodedata
+
+from models.voice_config import VoiceConfig
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+
+def default_cache_dir() -> Path:
+    """Get the per-user directory used for the clip cache"""
+    base = os.environ.get("LOCALAPPDATA") or os.path.join(Path.home(), ".cache")
+    return Path(base) / "IrishAutoDubber" / "tts_cache"
+
+
+class AudioClipCache:
+    """
+    Size-bounded LRU store of synthesized clips on disk
+
+    Clips are keyed by a hash of the normalized text and the voice settings
+    that affect the rendered audio, so re-dubbing a corrected episode only
+    synthesizes the lines that actually changed.
+
+    Several processes may share one cache directory: index updates are made
+    under a lock file and merged with the index on disk, and access times
+    from hits are kept in memory until FLUSH_EVERY entries have been touched
+    or flush() is called.
+    """
+
+    INDEX_FILENAME = "index.json"
+    LOCK_FILENAME = "index.lock"
+    DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # 512 MB
+    FLUSH_EVERY = 32
+
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize clip cache
+
+        Args:
+            cache_dir: Directory holding cached clips and the index
+            max_bytes: Maximum total size of cached clips before eviction
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._index_path = self.cache_dir / self.INDEX_FILENAME
+        # Access times from hits not yet written to the index
+        self._touched: Dict[str, float] = {}
+        self._index_mtime = self._index_stamp()
+        self._index: Dict[str, dict] = self._load_index()
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """Normalize text so trivially different lines share a cache entry"""
+        text = unicodedata.normalize("NFC", text)
+        return " ".join(text.split())
+
+    @classmethod
+    def make_key(cls, text: str, voice: VoiceConfig, source: str = "") -> str:
+        """
+        Build the cache key for a line of text and a voice
+
+        Args:
+            text: Line of text
+            voice: Voice the line is synthesized with
+            source: Where the audio comes from, when that is not Abair itself
+                (e.g. the URL of a stand-in server), so its clips never
+                stand in for real ones
+
+        Returns:
+            Hex SHA-256 digest of (text, dialect, gender, speed multiplier,
+            source)
+        """
+        fields = [
+            cls.normalize_text(text),
+            voice.dialect,
+            voice.gender,
+            voice.speed_multiplier(),
+        ]
+        if source:
+            fields.append(source)
+        payload = json.dumps(fields, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, count_miss: bool = True) -> Optional[Path]:
+        """
+        Look up a cached clip and mark it as recently used
+
+        Args:
+            key: Cache key from make_key()
+            count_miss: Count a miss in the stats (False for a lookup that
+                is followed by another one, so the miss is counted once)
+
+        Returns:
+            Path to the cached clip, or None on a miss
+        """
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None and self._index_stamp() != self._index_mtime:
+                # Another process changed the index - pick up its entries
+                self._reload()
+                entry = self._index.get(key)
+            if entry:
+                path = self.cache_dir / entry["file"]
+                if path.exists():
+                    entry["last_access"] = self._touched[key] = time.time()
+                    self.hits += 1
+                    if len(self._touched) >= self.FLUSH_EVERY:
+                        self._sync()
+                    return path
+                # File removed behind our back - forget it
+                self._sync(lambda index: index.pop(key, None))
+
+            self.misses += count_miss
+            return None
+
+    def put(self, key: str, source_path: Path) -> Path:
+        """
+        Copy a clip into the cache, evicting old entries if needed
+
+        Args:
+            key: Cache key from make_key()
+            source_path: Clip to store
+
+        Returns:
+            Path to the cached copy
+        """
+        source_path = Path(source_path)
+        return self._store(
+            key, source_path.suffix, lambda tmp: shutil.copyfile(source_path, tmp)
+        )
+
+    def put_bytes(self, key: str, data: bytes, suffix: str) -> Path:
+        """
+        Store in-memory audio in the cache, evicting old entries if needed
+
+        Args:
+            key: Cache key from make_key()
+            data: Encoded audio file contents
+            suffix: File extension including the dot (e.g. ".wav")
+
+        Returns:
+            Path to the cached file
+        """
+        return self._store(key, suffix, lambda tmp: tmp.write_bytes(data))
+
+    def _store(self, key: str, suffix: str, write: Callable[[Path], object]) -> Path:
+        """Write an entry atomically via `write(tmp_path)` and index it"""
+        filename = f"{key}{suffix}"
+        target = self.cache_dir / filename
+
+        with self._lock:
+            tmp_target = target.with_name(f"{filename}.{os.getpid()}.tmp")
+            write(tmp_target)
+            os.replace(tmp_target, target)
+
+            def add_entry(index: Dict[str, dict]):
+                previous = index.get(key)
+                if previous and previous["file"] != filename:
+                    # Same clip stored before in another format
+                    try:
+                        (self.cache_dir / previous["file"]).unlink()
+                    except OSError:
+                        pass
+                index[key] = {
+                    "file": filename,
+                    "size": target.stat().st_size,
+                    "last_access": time.time(),
+                }
+
+            self._sync(add_entry)
+            return target
+
+    def flush(self):
+        """Write access times from recent hits to the index on disk"""
+        with self._lock:
+            if self._touched:
+                self._sync()
+
+    def total_bytes(self) -> int:
+        """Get total size of cached clips in bytes"""
+        with self._lock:
+            return sum(entry["size"] for entry in self._index.values())
+
+    def stats(self) -> Dict[str, int]:
+        """Get hit/miss/eviction counters for reporting"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._index),
+        }
+
+    def _sync(self, update: Optional[Callable[[Dict[str, dict]], object]] = None):
+        """
+        Merge local changes into the index on disk under the file lock
+
+        Args:
+            update: Optional change applied to the freshly loaded index
+        """
+        with self._file_lock():
+            self._index_mtime = self._index_stamp()
+            self._index = self._load_index()
+            self._merge_touched()
+            self._touched.clear()
+            if update:
+                update(self._index)
+            self._evict()
+            self._save_index()
+            self._index_mtime = self._index_stamp()
+
+    def _reload(self):
+        """Re-read the index written by another process, keeping local hits"""
+        self._index_mtime = self._index_stamp()
+        self._index = self._load_index()
+        self._merge_touched()
+
+    def _merge_touched(self):
+        """Apply pending access times to entries still in the index"""
+        for key, last_access in self._touched.items():
+            entry = self._index.get(key)
+            if entry and entry["last_access"] < last_access:
+                entry["last_access"] = last_access
+
+    @contextmanager
+    def _file_lock(self):
+        """Hold an exclusive lock on the cache directory across processes"""
+        fd = os.open(self.cache_dir / self.LOCK_FILENAME, os.O_RDWR | os.O_CREAT)
+        try:
+            if sys.platform == "win32":
+                while True:
+                    try:
+                        # Retries for about 10 seconds before raising
+                        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        pass
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if sys.platform == "win32":
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+                else:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    def _index_stamp(self) -> Optional[int]:
+        """Get the index modification time, or None if it does not exist"""
+        try:
+            return os.stat(self._index_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _evict(self):
+        """Remove least recently used clips until under the size bound"""
+        total = sum(entry["size"] for entry in self._index.values())
+        if total <= self.max_bytes:
+            return
+
+        by_age = sorted(self._index.items(), key=lambda kv: kv[1]["last_access"])
+        for key, entry in by_age:
+            if total <= self.max_bytes:
+                break
+            try:
+                (self.cache_dir / entry["file"]).unlink()
+            except OSError:
+                pass
+            total -= entry["size"]
+            del self._index[key]
+            self.evictions += 1
+
+    def _load_index(self) -> Dict[str, dict]:
+        """Load the index from disk, starting fresh if it is unreadable"""
+        try:
+            with open(self._index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self):
+        """Atomically write the index to disk"""
+        tmp_path = self._index_path.with_name(
+            f"{self.INDEX_FILENAME}.{os.getpid()}.tmp"
+        )
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, self._index_path)
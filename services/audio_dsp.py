@@ -0,0 +1,244 @@
+"""
+NumPy signal processing helpers for synthesized clips
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+from pydub import AudioSegment
+
+_SAMPLE_DTYPES = {1: np.int8, 2: np.int16, 4: np.int32}
+
+
+def audio_to_array(audio: AudioSegment) -> np.ndarray:
+    """
+    Get the PCM samples of a clip
+
+    Returns:
+        Integer array of shape (frames, channels)
+    """
+    dtype = _SAMPLE_DTYPES[audio.sample_width]
+    samples = np.frombuffer(audio.raw_data, dtype=dtype)
+    return samples.reshape(-1, audio.channels)
+
+
+def array_to_audio(
+    samples: np.ndarray, frame_rate: int, sample_width: int = 2
+) -> AudioSegment:
+    """
+    Build a clip from PCM samples, clipping to the sample range
+
+    Args:
+        samples: Array of shape (frames, channels), integer or float
+        frame_rate: Sample rate in Hz
+        sample_width: Bytes per sample of the result
+    """
+    dtype = _SAMPLE_DTYPES[sample_width]
+    info = np.iinfo(dtype)
+    pcm = np.clip(np.rint(samples), info.min, info.max).astype(dtype)
+    return AudioSegment(
+        data=pcm.tobytes(),
+        sample_width=sample_width,
+        frame_rate=frame_rate,
+        channels=pcm.shape[1],
+    )
+
+
+def time_stretch(
+    samples: np.ndarray,
+    speed: float,
+    frame_rate: int,
+    frame_ms: float = 40.0,
+    tolerance_ms: float = 10.0,
+) -> np.ndarray:
+    """
+    Change tempo without changing pitch using WSOLA
+
+    Waveform-similarity overlap-add: output frames are laid down at a fixed
+    hop, and each is read from near its ideal input position, shifted by up
+    to `tolerance_ms` to best continue the previous frame's waveform.
+
+    Args:
+        samples: Array of shape (frames, channels)
+        speed: Tempo factor; 1.4 plays 40% faster, 0.8 slower
+        frame_rate: Sample rate in Hz
+        frame_ms: Analysis/synthesis frame length
+        tolerance_ms: Maximum shift when searching for the best-matching frame
+
+    Returns:
+        Float array of shape (round(frames / speed), channels)
+    """
+    if speed <= 0:
+        raise ValueError(f"Speed must be positive, got {speed}")
+
+    x = np.asarray(samples, dtype=np.float64)
+    n_in = x.shape[0]
+    n_out = int(round(n_in / speed))
+    if speed == 1.0 or n_in == 0:
+        return x.copy()
+
+    frame = max(4, int(frame_rate * frame_ms / 1000) // 2 * 2)
+    hop = frame // 2
+    tol = max(1, int(frame_rate * tolerance_ms / 1000))
+    n_frames = n_out // hop + 2
+
+    # Periodic Hann window: overlapping copies at half-frame hops sum to 1
+    window = np.sin(np.pi * np.arange(frame) / frame) ** 2
+
+    # Pad so every read (ideal position +/- tol, plus a frame) is in bounds
+    needed = int(np.ceil((n_frames + 1) * hop * speed)) + 2 * frame + 2 * tol
+    padded = np.zeros((needed + n_in, x.shape[1]))
+    padded[tol : tol + n_in] = x
+    mono = padded.mean(axis=1)
+
+    out = np.zeros((n_frames * hop + frame, x.shape[1]))
+    norm = np.zeros(n_frames * hop + frame)
+    delta = 0
+
+    for k in range(n_frames):
+        read = int(round(k * hop * speed)) + tol + delta
+        write = k * hop
+        out[write : write + frame] += padded[read : read + frame] * window[:, None]
+        norm[write : write + frame] += window
+
+        # Pick the next frame's offset so it best continues this one
+        natural = mono[read + hop : read + hop + frame]
+        ideal = int(round((k + 1) * hop * speed)) + tol
+        region = mono[ideal - tol : ideal + tol + frame]
+        delta = int(np.argmax(np.correlate(region, natural, mode="valid"))) - tol
+
+    out /= np.maximum(norm, 1e-8)[:, None]
+    return out[:n_out]
+
+
+def change_tempo(audio: AudioSegment, speed: float) -> AudioSegment:
+    """
+    Change the tempo of a clip without changing its pitch
+
+    Args:
+        audio: Clip to adjust
+        speed: Tempo factor (e.g. 1.4 for 40% faster)
+
+    Returns:
+        New clip of about len(audio) / speed milliseconds
+    """
+    if speed == 1.0:
+        return audio
+    stretched = time_stretch(audio_to_array(audio), speed, audio.frame_rate)
+    return array_to_audio(stretched, audio.frame_rate, audio.sample_width)
+
+
+def find_silences(
+    audio: AudioSegment,
+    min_silence_ms: int = 150,
+    threshold_db: float = -35.0,
+    window_ms: int = 10,
+) -> List[Tuple[int, int]]:
+    """
+    Find quiet stretches of a clip
+
+    Levels are measured per `window_ms` window in one vectorized pass and
+    compared with the loudest window, so the threshold adapts to the clip.
+
+    Args:
+        audio: Clip to analyse
+        min_silence_ms: Shortest quiet stretch to report
+        threshold_db: Level below the loudest window that counts as silence
+        window_ms: Analysis window length
+
+    Returns:
+        (start_ms, end_ms) of each silence, in order
+    """
+    mono = audio_to_array(audio).astype(np.float64).mean(axis=1)
+    window = max(1, int(audio.frame_rate * window_ms / 1000))
+    n_windows = len(mono) // window
+    if n_windows == 0:
+        return []
+
+    frames = mono[: n_windows * window].reshape(n_windows, window)
+    rms = np.sqrt(np.mean(frames**2, axis=1))
+    level_db = 20 * np.log10(np.maximum(rms, 1e-9))
+    quiet = level_db < level_db.max() + threshold_db
+
+    # Run boundaries of the quiet mask
+    edges = np.diff(np.concatenate(([0], quiet.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+
+    ms_per_window = 1000 * window / audio.frame_rate
+    keep = (ends - starts) * ms_per_window >= min_silence_ms
+    return [
+        (int(round(start * ms_per_window)), int(round(end * ms_per_window)))
+        for start, end in zip(starts[keep], ends[keep])
+    ]
+
+
+def split_on_silences(
+    audio: AudioSegment,
+    count: int,
+    min_silence_ms: int = 150,
+    threshold_db: float = -35.0,
+    keep_silence_ms: int = 50,
+) -> Optional[List[AudioSegment]]:
+    """
+    Split a clip holding `count` utterances at its longest inner pauses
+
+    Args:
+        audio: Clip to split
+        count: Number of pieces wanted
+        min_silence_ms: Shortest pause considered a boundary
+        threshold_db: Level below the loudest window that counts as silence
+        keep_silence_ms: Silence kept at each side of a cut
+
+    Returns:
+        The pieces in order, or None if there are too few pauses
+    """
+    if count <= 1:
+        return [audio]
+
+    inner = [
+        (start, end)
+        for start, end in find_silences(audio, min_silence_ms, threshold_db)
+        if start > 0 and end < len(audio)
+    ]
+    if len(inner) < count - 1:
+        return None
+
+    chosen = sorted(sorted(inner, key=lambda s: s[1] - s[0])[-(count - 1) :])
+
+    pieces = []
+    piece_start = 0
+    for start, end in chosen:
+        middle = (start + end) // 2
+        pieces.append(audio[piece_start : min(start + keep_silence_ms, middle)])
+        piece_start = max(end - keep_silence_ms, middle)
+    pieces.append(audio[piece_start:])
+    return pieces
+
+
+def trim_silence(
+    audio: AudioSegment,
+    threshold_db: float = -35.0,
+    keep_silence_ms: int = 50,
+) -> AudioSegment:
+    """
+    Cut leading and trailing silence off a clip
+
+    Args:
+        audio: Clip to trim
+        threshold_db: Level below the loudest window that counts as silence
+        keep_silence_ms: Silence kept before and after the speech
+
+    Returns:
+        The trimmed clip (the clip itself if it is silent throughout)
+    """
+    silences = find_silences(audio, keep_silence_ms, threshold_db)
+    start, end = 0, len(audio)
+    if silences and silences[0][0] == 0:
+        start = silences[0][1] - keep_silence_ms
+    # The last partial analysis window is never reported, so allow for it
+    if silences and silences[-1][1] >= end - 10:
+        end = silences[-1][0] + keep_silence_ms
+    if start >= end:
+        return audio
+    return audio[start:end]
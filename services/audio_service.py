@@ -3,11 +3,17 @@ Audio generation service using Abair.ie TTS
 """
 
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+import asyncio
+import io
+import logging
 import time
 import glob
 import os
+import shutil
+import uuid
 
 from selenium import webdriver
 from selenium.webdriver.support.ui import WebDriverWait, Select
@@ -16,12 +22,53 @@ from selenium.webdriver.common.by import By
 from pydub import AudioSegment
 
 from models.voice_config import VoiceConfig
+from services.audio_cache import AudioClipCache
+from services import cancellation as cancel
+from services.audio_dsp import change_tempo
+from services.cancellation import CancellationToken
+from services.download_watcher import DownloadWatcher, create_download_watcher
 from services.progress_observer import ProgressObserver, NoOpProgressObserver
+from services.session_health import SessionHealthMonitor, process_tree_rss_bytes
+
+logger = logging.getLogger(__name__)
+
+# Counts in-flight and completed fetch/XHR requests so readiness mode can
+# tell when the page has finished talking to the synthesis backend
+NETWORK_PROBE_JS = """
+if (!window.__abairProbe) {
+    const probe = (window.__abairProbe = { pending: 0, completed: 0 });
+    const done = () => { probe.pending--; probe.completed++; };
+    if (window.fetch) {
+        const originalFetch = window.fetch;
+        window.fetch = function () {
+            probe.pending++;
+            return originalFetch.apply(this, arguments).finally(done);
+        };
+    }
+    const originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        probe.pending++;
+        this.addEventListener("loadend", done);
+        return originalSend.apply(this, arguments);
+    };
+}
+return window.__abairProbe;
+"""
 
 
 class AudioService(ABC):
     """Abstract base class for audio generation services"""
 
+    # Token of the job being dubbed, set by the orchestrator; services check
+    # it while they wait so a cancelled job stops promptly
+    cancellation: Optional[CancellationToken] = None
+
+    # Clip cache consulted before synthesizing, for services that have one
+    cache: Optional[AudioClipCache] = None
+
+    # Origin of the audio when it is not Abair, kept apart in the cache
+    cache_source: str = ""
+
     @abstractmethod
     def generate_audio(
         self, text: str, voice: VoiceConfig, output_dir: Path
@@ -44,20 +91,204 @@ class AudioService(ABC):
         """Setup the audio service (e.g., initialize browser)"""
         pass
 
+    @property
+    def max_concurrency(self) -> int:
+        """Number of generate_audio calls the service can serve at once"""
+        return 1
+
+    def generate_clip(
+        self, text: str, voice: VoiceConfig, output_dir: Path
+    ) -> Optional[AudioSegment]:
+        """
+        Generate audio and return it decoded in memory
+
+        Services that can skip the file round trip override this; the
+        default decodes the file written by generate_audio.
+
+        Returns:
+            Decoded audio, or None if failed
+        """
+        audio_path = self.generate_audio(text, voice, output_dir)
+        if not audio_path:
+            return None
+        return AudioSegment.from_file(str(audio_path))
+
+    def cached_clip(self, text: str, voice: VoiceConfig) -> Optional[AudioSegment]:
+        """
+        Get a clip from the service's cache without synthesizing it
+
+        Lets callers skip request pacing for lines that need no request.
+        Misses are not counted here; the synthesis that follows counts them.
+
+        Returns:
+            Decoded audio, or None if the clip is not cached
+        """
+        if self.cache is None:
+            return None
+        cached_path = self.cache.get(self._cache_key(text, voice), count_miss=False)
+        if cached_path is None:
+            return None
+        return AudioSegment.from_file(str(cached_path))
+
+    def _cache_key(self, text: str, voice: VoiceConfig) -> str:
+        """Build the cache key of a line synthesized by this service"""
+        return self.cache.make_key(text, voice, self.cache_source)
+
+    def _store_clip_in_cache(self, cache_key: str, audio: AudioSegment):
+        """Store decoded audio losslessly as WAV"""
+        buffer = io.BytesIO()
+        audio.export(buffer, format="wav")
+        try:
+            self.cache.put_bytes(cache_key, buffer.getvalue(), ".wav")
+        except OSError as e:
+            self.observer.on_error(f"Failed to cache audio clip: {e}")
+
+    def generate_batch(
+        self,
+        requests: Sequence[Tuple[str, VoiceConfig]],
+        output_dir: Path,
+        as_clips: bool = False,
+        generate: Optional[Callable[[str, VoiceConfig, Path], object]] = None,
+    ) -> List[Optional[Union[Path, AudioSegment]]]:
+        """
+        Generate audio for many (text, voice) pairs
+
+        Services may reorder the work internally (e.g. to minimise voice
+        switches) but every returned path must remain valid until cleanup().
+
+        Args:
+            requests: Sequence of (text, voice) pairs
+            output_dir: Directory for audio output
+            as_clips: Return decoded AudioSegments instead of file paths
+            generate: Called as generate(text, voice, output_dir) for each
+                request in place of generate_clip/generate_audio, e.g. to
+                pace requests; it must call one of them in turn
+
+        Returns:
+            Audio paths or clips (None for failures) in the same order as requests
+        """
+        if generate is None:
+            generate = self.generate_clip if as_clips else self.generate_audio
+        return [generate(text, voice, output_dir) for text, voice in requests]
+
+    async def agenerate_audio(
+        self, text: str, voice: VoiceConfig, output_dir: Path
+    ) -> Optional[Path]:
+        """
+        Asynchronous counterpart of generate_audio
+
+        Services without a native async implementation run the blocking
+        generate_audio in the event loop's default thread executor.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self.generate_audio, text, voice, output_dir
+        )
+
+    async def agenerate_clip(
+        self, text: str, voice: VoiceConfig, output_dir: Path
+    ) -> Optional[AudioSegment]:
+        """Asynchronous counterpart of generate_clip"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self.generate_clip, text, voice, output_dir
+        )
+
+    async def acached_clip(
+        self, text: str, voice: VoiceConfig
+    ) -> Optional[AudioSegment]:
+        """Asynchronous counterpart of cached_clip"""
+        if self.cache is None:
+            return None
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.cached_clip, text, voice)
+
+    async def agenerate_many(
+        self,
+        requests: Sequence[Tuple[str, VoiceConfig]],
+        output_dir: Path,
+        concurrency: Optional[int] = None,
+        as_clips: bool = False,
+    ) -> List[Optional[Union[Path, AudioSegment]]]:
+        """
+        Generate audio for many (text, voice) pairs with bounded concurrency
+
+        Args:
+            requests: Sequence of (text, voice) pairs
+            output_dir: Directory for audio output
+            concurrency: Maximum syntheses in flight; never more than
+                max_concurrency (defaults to max_concurrency)
+            as_clips: Return decoded AudioSegments instead of file paths
+
+        Returns:
+            Audio paths or clips (None for failures) in the same order as requests
+        """
+        limit = min(concurrency or self.max_concurrency, self.max_concurrency)
+        semaphore = asyncio.Semaphore(max(1, limit))
+        generate = self.agenerate_clip if as_clips else self.agenerate_audio
+
+        async def generate_one(text: str, voice: VoiceConfig):
+            async with semaphore:
+                return await generate(text, voice, output_dir)
+
+        return await asyncio.gather(
+            *(generate_one(text, voice) for text, voice in requests)
+        )
+
     @abstractmethod
     def cleanup(self):
         """Cleanup resources (e.g., close browser)"""
         pass
 
 
+class StepTimer:
+    """Measures how long each named step of a synthesis takes"""
+
+    def __init__(self):
+        self.totals: Dict[str, float] = defaultdict(float)
+        self.counts: Dict[str, int] = defaultdict(int)
+        self.current: Dict[str, float] = {}
+        self._last = time.perf_counter()
+
+    def start(self):
+        """Start timing a new synthesis"""
+        self.current = {}
+        self._last = time.perf_counter()
+
+    def mark(self, step: str):
+        """Record the time elapsed since the previous mark as `step`"""
+        now = time.perf_counter()
+        elapsed = now - self._last
+        self._last = now
+        self.current[step] = elapsed
+        self.totals[step] += elapsed
+        self.counts[step] += 1
+
+    def averages_ms(self) -> Dict[str, int]:
+        """Get the mean duration of each step in milliseconds"""
+        return {
+            step: round(1000 * self.totals[step] / self.counts[step])
+            for step in self.totals
+        }
+
+
 class AbairAudioService(AudioService):
     """Audio generation service using Abair.ie website via Selenium"""
 
+    # Chrome downloads into this private subfolder so completion can be
+    # detected without scanning the (possibly huge) video folder
+    DOWNLOAD_SUBDIR = ".abair_downloads"
+
     def __init__(
         self,
         download_folder: Path,
         observer: Optional[ProgressObserver] = None,
         wait_timeout: int = 15,
+        cache: Optional[AudioClipCache] = None,
+        headless: bool = False,
+        readiness_mode: bool = False,
+        daemon_address: Optional[str] = None,
+        health: Optional[SessionHealthMonitor] = None,
     ):
         """
         Initialize Abair audio service
@@ -66,35 +297,154 @@ class AbairAudioService(AudioService):
             download_folder: Folder for downloaded audio files
             observer: Progress observer for status updates
             wait_timeout: Selenium wait timeout in seconds
+            cache: Optional clip cache consulted before using the browser
+            headless: Run Chrome without a visible window
+            readiness_mode: Wait on DOM/network conditions instead of fixed sleeps
+            daemon_address: "host:port" of a services.browser_daemon to borrow
+                a warm browser from instead of launching one
+            health: Decides when the browser has degraded enough to be
+                replaced mid-job (a default SessionHealthMonitor if omitted)
         """
         self.download_folder = download_folder
+        self.download_dir = Path(download_folder) / self.DOWNLOAD_SUBDIR
+        self.download_watcher: DownloadWatcher = create_download_watcher(
+            self.download_dir
+        )
         self.observer = observer or NoOpProgressObserver()
         self.wait_timeout = wait_timeout
+        self.cache = cache
+        self.headless = headless
+        self.readiness_mode = readiness_mode
+        self.daemon_address = daemon_address
+        self.step_timer = StepTimer()
+        self.health = health or SessionHealthMonitor()
+        self.recycles = 0
+        self._rss_unknown = False  # Memory could not be measured (warned once)
         self.driver: Optional[webdriver.Chrome] = None
         self.wait: Optional[WebDriverWait] = None
         self.current_voice: Optional[VoiceConfig] = None
+        self.voice_switches = 0
+        self._batch_files: List[Path] = []
+        self._daemon_client = None
 
     def setup(self):
         """Initialize Selenium browser and navigate to Abair.ie"""
         from gui.selenium_utils import setup_selenium
 
         try:
-            self.driver, self.wait = setup_selenium(str(self.download_folder))
+            try:
+                self.download_watcher.start()
+            except OSError as e:
+                logger.warning("inotify unavailable (%s); scanning downloads", e)
+                self.download_watcher = DownloadWatcher(self.download_dir)
+                self.download_watcher.start()
+
             self.current_voice = None
+            self.health.reset()
+            if self.daemon_address and self._attach_to_daemon():
+                return
+
+            self.driver, self.wait = setup_selenium(
+                str(self.download_dir), headless=self.headless
+            )
         except Exception as e:
             raise RuntimeError(f"Failed to setup Selenium: {e}")
 
     def cleanup(self):
         """Close browser and cleanup"""
-        if self.driver:
+        if self.cache:
+            self.cache.flush()
+            self.observer.on_stats("TTS cache", self.cache.stats())
+        if self.step_timer.counts:
+            self.observer.on_stats(
+                "Abair step latency (ms)", self.step_timer.averages_ms()
+            )
+        if self.health.syntheses or self.recycles:
+            self.observer.on_stats(
+                "Browser session health",
+                {**self.health.stats(), "recycles": self.recycles},
+            )
+
+        if self._daemon_client:
+            self._detach_from_daemon()
+        elif self.driver:
             try:
                 self.driver.quit()
             except:
                 pass
+        if self.driver:
             self.driver = None
             self.wait = None
             self.current_voice = None
 
+        self.download_watcher.stop()
+        shutil.rmtree(self.download_dir, ignore_errors=True)
+
+        for path in self._batch_files:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        self._batch_files = []
+
+    def _attach_to_daemon(self) -> bool:
+        """
+        Borrow a warm browser from the daemon
+
+        Returns:
+            True if attached, False to fall back to launching a browser
+        """
+        borrowed = self._borrow_daemon_browser()
+        if borrowed is None:
+            return False
+        self._daemon_client, self.driver, self.wait, self.current_voice = borrowed
+        return True
+
+    def _borrow_daemon_browser(self, idle_only: bool = False) -> Optional[tuple]:
+        """
+        Lease a daemon browser and attach a driver to it
+
+        Args:
+            idle_only: Give up unless a session is idle right away, rather
+                than waiting for one (e.g. for the one this job holds)
+
+        Returns:
+            (client, driver, wait, voice of its page), or None on failure
+        """
+        from gui.selenium_utils import attach_selenium
+        from services.browser_daemon import BrowserDaemonClient
+
+        client = BrowserDaemonClient(self.daemon_address, timeout=self.wait_timeout)
+        try:
+            if idle_only and not client.status().get("idle"):
+                return None
+            lease = client.lease()
+        except OSError as e:
+            logger.warning("%s; launching a browser instead", e)
+            return None
+
+        try:
+            driver, wait = attach_selenium(
+                lease.debugger_address, str(self.download_dir)
+            )
+        except Exception as e:
+            client.close()
+            logger.warning("Could not attach to daemon browser (%s)", e)
+            return None
+
+        # Page keeps the last job's voice
+        return client, driver, wait, lease.voice
+
+    def _detach_from_daemon(self):
+        """Give the borrowed browser back without closing it"""
+        try:
+            # Stop only our chromedriver; quit() would close the daemon's browser
+            self.driver.service.stop()
+        except Exception:
+            pass
+        self._daemon_client.release(self.current_voice)
+        self._daemon_client = None
+
     def generate_audio(
         self, text: str, voice: VoiceConfig, output_dir: Path
     ) -> Optional[Path]:
@@ -112,18 +462,15 @@ class AbairAudioService(AudioService):
         if not self.driver or not self.wait:
             raise RuntimeError("AudioService not initialized. Call setup() first.")
 
-        try:
-            # Only update settings if voice changed
-            if self.current_voice != voice:
-                if not self._set_voice_settings(voice):
-                    return None
-                self.current_voice = voice
-
-            # Clean old synthesis files
-            self._clean_old_files(output_dir)
+        cache_key = None
+        if self.cache:
+            cache_key = self._cache_key(text, voice)
+            cached_path = self.cache.get(cache_key)
+            if cached_path:
+                return cached_path
 
-            # Generate audio
-            audio_path = self._synthesize_and_download(text, output_dir)
+        try:
+            audio_path = self._synthesize_with_voice(text, voice, output_dir)
 
             # Apply speed adjustment if needed
             if audio_path and voice.needs_speed_adjustment():
@@ -131,50 +478,279 @@ class AbairAudioService(AudioService):
                     audio_path, voice.speed_multiplier()
                 )
 
+            if audio_path and cache_key:
+                self._store_in_cache(cache_key, audio_path)
+
             return audio_path
 
         except Exception as e:
             self.observer.on_error(f"Audio generation failed: {e}")
             return None
 
+    def generate_clip(
+        self, text: str, voice: VoiceConfig, output_dir: Path
+    ) -> Optional[AudioSegment]:
+        """
+        Generate audio using Abair.ie and return it decoded in memory
+
+        The downloaded mp3 is decoded exactly once and any speed adjustment
+        is applied to the decoded audio, so nothing is re-encoded lossily.
+
+        Returns:
+            Decoded audio, or None if failed
+        """
+        if not self.driver or not self.wait:
+            raise RuntimeError("AudioService not initialized. Call setup() first.")
+
+        cache_key = None
+        if self.cache:
+            cache_key = self._cache_key(text, voice)
+            cached_path = self.cache.get(cache_key)
+            if cached_path:
+                return AudioSegment.from_file(str(cached_path))
+
+        try:
+            audio_path = self._synthesize_with_voice(text, voice, output_dir)
+            if not audio_path:
+                return None
+            audio = AudioSegment.from_file(str(audio_path))
+
+            if voice.needs_speed_adjustment():
+                audio = self._speed_up(audio, voice.speed_multiplier())
+                if cache_key:
+                    self._store_clip_in_cache(cache_key, audio)
+            elif cache_key:
+                self._store_in_cache(cache_key, audio_path)
+
+            return audio
+
+        except Exception as e:
+            self.observer.on_error(f"Audio generation failed: {e}")
+            return None
+
+    def generate_batch(
+        self,
+        requests: Sequence[Tuple[str, VoiceConfig]],
+        output_dir: Path,
+        as_clips: bool = False,
+        generate: Optional[Callable[[str, VoiceConfig, Path], object]] = None,
+    ) -> List[Optional[Union[Path, AudioSegment]]]:
+        """
+        Generate audio for many lines, one voice at a time
+
+        Lines are grouped by voice (starting with the voice already selected
+        on the page) so the settings panel is changed once per voice rather
+        than at every change of speaker.
+
+        Returns:
+            Audio paths or clips (None for failures) in the same order as requests
+        """
+        voice_order: List[VoiceConfig] = []
+        if self.current_voice is not None:
+            voice_order.append(self.current_voice)
+        for _, voice in requests:
+            if voice not in voice_order:
+                voice_order.append(voice)
+
+        if generate is None:
+            generate = self.generate_clip if as_clips else self.generate_audio
+
+        results: List[Optional[Union[Path, AudioSegment]]] = [None] * len(requests)
+        for voice in voice_order:
+            for i, (text, request_voice) in enumerate(requests):
+                if request_voice != voice:
+                    continue
+                if as_clips:
+                    results[i] = generate(text, voice, output_dir)
+                    continue
+
+                audio_path = generate(text, voice, output_dir)
+                if audio_path and audio_path.parent == Path(output_dir):
+                    # The next synthesis deletes old synthesis files, so
+                    # keep this clip under a name of its own
+                    kept_path = audio_path.with_name(
+                        f"abair_clip_{uuid.uuid4().hex}{audio_path.suffix}"
+                    )
+                    audio_path = audio_path.rename(kept_path)
+                    self._batch_files.append(audio_path)
+                results[i] = audio_path
+
+        return results
+
+    def _synthesize_with_voice(
+        self, text: str, voice: VoiceConfig, output_dir: Path
+    ) -> Optional[Path]:
+        """Select the voice if needed, then synthesize and download text"""
+        # Only update settings if voice changed
+        if self.current_voice != voice:
+            if not self._set_voice_settings(voice):
+                self._check_session_health(None)
+                return None
+            self.current_voice = voice
+            self.voice_switches += 1
+
+        # Clean old synthesis files
+        self._clean_old_files(output_dir)
+
+        # Generate audio
+        audio_path = self._synthesize_and_download(text, output_dir)
+        latency = sum(self.step_timer.current.values()) if audio_path else None
+        self._check_session_health(latency)
+        return audio_path
+
+    def _check_session_health(self, latency_sec: Optional[float]):
+        """Record a synthesis and replace the browser if it has degraded"""
+        rss_bytes = self._session_rss_bytes()
+        # Daemon browsers are not ours to measure
+        warn = not (self._daemon_client or self._rss_unknown)
+        if rss_bytes is None and self.health.max_rss_mb and warn:
+            self._rss_unknown = True
+            logger.warning(
+                "Browser memory cannot be measured here; sessions will not be "
+                "replaced for using more than %dMB",
+                self.health.max_rss_mb,
+            )
+        self.health.record(latency_sec, rss_bytes)
+        reason = self.health.recycle_reason()
+        if reason:
+            self._recycle_session(reason)
+
+    def _session_rss_bytes(self) -> Optional[int]:
+        """Memory of the browser we launched (None for daemon browsers)"""
+        if self._daemon_client:
+            return None
+        try:
+            return process_tree_rss_bytes(self.driver.service.process.pid)
+        except (AttributeError, TypeError, ValueError, OSError):
+            return None
+
+    def _recycle_session(self, reason: str):
+        """
+        Replace the browser with a fresh one and restore the selected voice
+
+        The old browser is only closed once its replacement is up, so a
+        failed relaunch leaves the job on the old session. A browser lent by
+        the daemon is replaced by another idle one if the daemon has one,
+        otherwise by a browser of our own.
+        """
+        from gui.selenium_utils import setup_selenium
+
+        logger.info("Recycling browser session (%s)", reason)
+        voice = self.current_voice
+        try:
+            if self._daemon_client:
+                replacement = self._borrow_daemon_browser(idle_only=True)
+                if replacement is None:
+                    driver, wait = setup_selenium(
+                        str(self.download_dir), headless=self.headless
+                    )
+                    replacement = (None, driver, wait, None)
+                # Closing the lent browser makes the daemon relaunch it
+                self._quit_driver()
+                self._daemon_client.release(None)
+                self._daemon_client, self.driver, self.wait, self.current_voice = (
+                    replacement
+                )
+            else:
+                driver, wait = setup_selenium(
+                    str(self.download_dir), headless=self.headless
+                )
+                self._quit_driver()
+                self.driver, self.wait = driver, wait
+                self.current_voice = None
+        except Exception as e:
+            self.observer.on_error(f"Failed to recycle browser session: {e}")
+            return
+        finally:
+            self.health.reset()
+
+        self.recycles += 1
+        if voice is not None and self.current_voice != voice:
+            if self._set_voice_settings(voice):
+                self.current_voice = voice
+
+    def _quit_driver(self):
+        """Close the browser, ignoring a session that is already gone"""
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+        self.driver = None
+        self.wait = None
+
+    def _store_in_cache(self, cache_key: str, audio_path: Path):
+        """Store a freshly synthesized clip, never failing the synthesis"""
+        try:
+            self.cache.put(cache_key, audio_path)
+        except OSError as e:
+            self.observer.on_error(f"Failed to cache audio clip: {e}")
+
+    def _settle(
+        self, seconds: float, condition: Optional[Callable[[webdriver.Chrome], bool]]
+    ):
+        """
+        Let the page catch up after an interaction
+
+        Sleeps a fixed amount by default. In readiness mode it waits for
+        `condition` instead, or not at all when the next step already waits
+        for the element it needs.
+        """
+        if not self.readiness_mode:
+            cancel.sleep(seconds, self.cancellation)
+        elif condition is not None:
+            self._until(condition)
+
+    def _until(self, condition: Callable[[webdriver.Chrome], object]):
+        """Wait for a page condition, giving up once the job is cancelled"""
+        token = self.cancellation
+        if token is None:
+            return self.wait.until(condition)
+
+        def checked(driver: webdriver.Chrome):
+            token.check()
+            return condition(driver)
+
+        return self.wait.until(checked)
+
     def _set_voice_settings(self, voice: VoiceConfig) -> bool:
         """Configure Abair.ie voice settings"""
         try:
             # Set Dialect
             select_xpath = "//div[./div/span[text()='Dialect']]/div/select"
-            select_element = self.wait.until(
+            select_element = self._until(
                 EC.presence_of_element_located((By.XPATH, select_xpath))
             )
             dialect_select = Select(select_element)
             dialect_select.select_by_visible_text(voice.dialect)
-            time.sleep(1)
+            self._settle(
+                1,
+                lambda d: dialect_select.first_selected_option.text == voice.dialect,
+            )
 
             # Set Gender
             gender_xpath = f"//div[./div/span[text()='Gender']]/div/button[contains(text(), '{voice.gender}')]"
-            gender_btn = self.wait.until(
+            gender_btn = self._until(
                 EC.element_to_be_clickable((By.XPATH, gender_xpath))
             )
             self.driver.execute_script("arguments[0].click();", gender_btn)
-            time.sleep(1)
+            self._settle(1, None)
 
             # Set Voice for Kerry Male (Danny)
             if voice.dialect == "Kerry" and voice.gender == "Male":
                 voice_xpath = "//div[./div/span[text()='Voice']]/div/button[contains(text(), 'Danny')]"
-                voice_btn = self.wait.until(
+                voice_btn = self._until(
                     EC.element_to_be_clickable((By.XPATH, voice_xpath))
                 )
                 self.driver.execute_script("arguments[0].click();", voice_btn)
-                time.sleep(1)
+                self._settle(1, None)
 
             # Set Model (AI)
             model_xpath = (
                 "//div[./div/span[text()='Model']]/div/button[contains(text(), 'AI')]"
             )
-            model_btn = self.wait.until(
-                EC.element_to_be_clickable((By.XPATH, model_xpath))
-            )
+            model_btn = self._until(EC.element_to_be_clickable((By.XPATH, model_xpath)))
             self.driver.execute_script("arguments[0].click();", model_btn)
-            time.sleep(1)
+            self._settle(1, None)
 
             return True
 
@@ -193,17 +769,25 @@ class AbairAudioService(AudioService):
     def _synthesize_and_download(self, text: str, output_dir: Path) -> Optional[Path]:
         """Synthesize text and download audio file"""
         try:
+            self.step_timer.start()
+            probe = None
+            if self.readiness_mode:
+                probe = self.driver.execute_script(NETWORK_PROBE_JS)
+
             # Enter text
-            text_area = self.wait.until(
+            text_area = self._until(
                 EC.presence_of_element_located((By.TAG_NAME, "textarea"))
             )
             text_area.clear()
-            time.sleep(2)
+            self._settle(2, lambda d: text_area.get_attribute("value") == "")
             text_area.send_keys(text)
-            time.sleep(2)
+            self._settle(
+                2, lambda d: text_area.get_attribute("value").strip() == text.strip()
+            )
+            self.step_timer.mark("enter_text")
 
             # Click Synthesize
-            synth_btn = self.wait.until(
+            synth_btn = self._until(
                 EC.element_to_be_clickable(
                     (By.XPATH, "//button[contains(., 'Synthesize')]")
                 )
@@ -211,53 +795,71 @@ class AbairAudioService(AudioService):
             self.driver.execute_script(
                 "arguments[0].scrollIntoView({block: 'center'});", synth_btn
             )
-            time.sleep(2)
+            self._settle(2, None)
             synth_btn.click()
-            time.sleep(5)
+            self._settle(5, lambda d: self._synthesis_finished(probe["completed"]))
+            self.step_timer.mark("synthesize")
 
             # Click Download
-            download_btn = self.wait.until(
+            download_btn = self._until(
                 EC.element_to_be_clickable(
                     (By.XPATH, "//button[contains(., 'Download')]")
                 )
             )
-            time.sleep(2)
-            before_click = time.time()
+            self._settle(2, None)
+            self.step_timer.mark("download_ready")
+            self.download_watcher.expect()
             self.driver.execute_script(
                 "arguments[0].scrollIntoView({block: 'center'});", download_btn
             )
             download_btn.click()
 
             # Wait for file download
-            return self._wait_for_download(output_dir, before_click)
+            audio_path = self._wait_for_download(output_dir)
+            self.step_timer.mark("download")
+            logger.info(
+                "Abair step latency: %s",
+                ", ".join(
+                    f"{step}={1000 * secs:.0f}ms"
+                    for step, secs in self.step_timer.current.items()
+                ),
+            )
+            return audio_path
 
         except Exception as e:
             self.observer.on_error(f"Synthesis failed: {e}")
             return None
 
+    def _synthesis_finished(self, completed_before: int) -> bool:
+        """Check that a new request finished and nothing is still in flight"""
+        probe = self.driver.execute_script("return window.__abairProbe;")
+        return probe["completed"] > completed_before and probe["pending"] == 0
+
     def _wait_for_download(
-        self, output_dir: Path, after_timestamp: float, max_attempts: int = 30
+        self, output_dir: Path, max_wait_sec: float = 30
     ) -> Optional[Path]:
-        """Wait for audio file to download"""
-        from gui.helpers import get_latest_file
-
-        for _ in range(max_attempts):
-            time.sleep(1)
-            latest = get_latest_file(str(output_dir))
-            if (
-                latest
-                and os.path.getmtime(latest) > after_timestamp
-                and not latest.endswith(".crdownload")
-            ):
-                return Path(latest)
-
-        return None
+        """Wait for the audio download to finish and move it to output_dir"""
+        deadline = time.monotonic() + max_wait_sec
+        while True:
+            if self.cancellation:
+                self.cancellation.check()
+            # Short waits so a cancelled job stops promptly
+            remaining = deadline - time.monotonic()
+            downloaded = self.download_watcher.wait(min(remaining, 0.25))
+            if downloaded is not None:
+                break
+            if remaining <= 0.25:
+                return None
+
+        audio_path = Path(output_dir) / downloaded.name
+        shutil.move(str(downloaded), str(audio_path))
+        return audio_path
 
     def _apply_speed_adjustment(self, audio_path: Path, speed: float) -> Path:
         """Apply speed adjustment to audio file"""
         try:
             audio = AudioSegment.from_file(str(audio_path))
-            adjusted = audio.speedup(playback_speed=speed)
+            adjusted = self._speed_up(audio, speed)
 
             # Save to same path
             adjusted.export(str(audio_path), format="mp3")
@@ -266,3 +868,7 @@ class AbairAudioService(AudioService):
         except Exception as e:
             self.observer.on_error(f"Speed adjustment failed: {e}")
             return audio_path  # Return original on failure
+
+    def _speed_up(self, audio: AudioSegment, speed: float) -> AudioSegment:
+        """Change the tempo of decoded audio without changing its pitch"""
+        return change_tempo(audio, speed)
@@ -0,0 +1,396 @@
+"""
+Long-lived daemon keeping warm Abair.ie browser sessions between jobs
+
+Launching Chrome, loading abair.ie, accepting the cookie banner and
+switching the page to Irish dominates the runtime of short jobs. The daemon
+does that once per session and lends the prepared browsers out over a local
+socket; AbairAudioService attaches to a lent browser through its DevTools
+(remote debugging) address.
+
+    python -m services.browser_daemon --port 8766 --sessions 2
+
+Protocol: newline-delimited JSON on a TCP connection. A client sends
+{"op": "lease"} and holds the session for as long as the connection stays
+open; {"op": "release", "voice": [dialect, gender]} (or disconnecting)
+returns it. {"op": "status"} reports pool occupancy.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Tuple
+import argparse
+import json
+import logging
+import queue
+import shutil
+import socket
+import socketserver
+import tempfile
+import threading
+
+from models.voice_config import VoiceConfig
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8766
+
+# Launches a prepared browser downloading into a folder and returns the
+# WebDriver controlling it plus its DevTools address ("host:port")
+SessionLauncher = Callable[[Path], Tuple[Any, str]]
+
+
+def parse_address(address: str) -> Tuple[str, int]:
+    """Split "host:port" (or just "port") into a socket address"""
+    host, _, port = address.rpartition(":")
+    return host or DEFAULT_HOST, int(port)
+
+
+def launch_chrome_session(download_dir: Path) -> Tuple[Any, str]:
+    """Start headless Chrome on abair.ie with remote debugging enabled"""
+    from gui.selenium_utils import setup_selenium
+
+    with socket.socket() as probe:
+        probe.bind((DEFAULT_HOST, 0))
+        port = probe.getsockname()[1]
+
+    driver, _ = setup_selenium(
+        str(download_dir), headless=True, remote_debugging_port=port
+    )
+    return driver, f"{DEFAULT_HOST}:{port}"
+
+
+@dataclass
+class BrowserLease:
+    """A daemon browser session lent to one client"""
+
+    session_id: int
+    debugger_address: str
+    voice: Optional[VoiceConfig] = None
+
+
+@dataclass
+class _DaemonSession:
+    """A browser owned by the daemon"""
+
+    session_id: int
+    driver: Any
+    debugger_address: str
+    voice: Optional[VoiceConfig] = None
+
+
+class BrowserSessionDaemon:
+    """Pool of prepared browsers lent to clients over a local socket"""
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        size: int = 1,
+        launch_session: SessionLauncher = launch_chrome_session,
+        lease_timeout: float = 60,
+    ):
+        """
+        Initialize browser session daemon
+
+        Args:
+            host: Interface to listen on (keep this local)
+            port: Port to listen on (0 picks a free port)
+            size: Number of browser sessions to keep warm
+            launch_session: Starts one prepared browser (injectable for tests)
+            lease_timeout: Seconds a lease request waits for an idle session
+        """
+        self.size = max(1, size)
+        self.launch_session = launch_session
+        self.lease_timeout = lease_timeout
+        self.sessions: List[_DaemonSession] = []
+        self._idle: "queue.Queue[_DaemonSession]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._work_dir: Optional[Path] = None
+        self._server = socketserver.ThreadingTCPServer(
+            (host, port), self._make_handler(), bind_and_activate=False
+        )
+        self._server.daemon_threads = True
+        self._server.allow_reuse_address = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> str:
+        """Get the "host:port" clients should connect to"""
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    def start(self) -> "BrowserSessionDaemon":
+        """Launch the browsers, then accept clients on a background thread"""
+        self._work_dir = Path(tempfile.mkdtemp(prefix="abair_daemon_"))
+        for session_id in range(self.size):
+            session = self._launch(session_id)
+            if session:
+                self.sessions.append(session)
+                self._idle.put(session)
+        if not self.sessions:
+            self.stop()
+            raise RuntimeError("Failed to start any Abair browser session")
+
+        self._server.server_bind()
+        self._server.server_activate()
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop accepting clients and close every browser"""
+        if self._thread:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+        for session in self.sessions:
+            try:
+                session.driver.quit()
+            except Exception:
+                pass
+        self.sessions = []
+        self._idle = queue.Queue()
+
+        if self._work_dir:
+            shutil.rmtree(self._work_dir, ignore_errors=True)
+            self._work_dir = None
+
+    def __enter__(self) -> "BrowserSessionDaemon":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def status(self) -> dict:
+        """Get pool occupancy"""
+        return {"sessions": len(self.sessions), "idle": self._idle.qsize()}
+
+    def lease(self, timeout: Optional[float] = None) -> Optional[_DaemonSession]:
+        """
+        Take an idle session, replacing its browser if it has died
+
+        Returns:
+            The session, or None if none became idle within the timeout
+        """
+        try:
+            session = self._idle.get(
+                timeout=self.lease_timeout if timeout is None else timeout
+            )
+        except queue.Empty:
+            return None
+
+        if not self._is_alive(session):
+            logger.warning("Browser session %d died; relaunching", session.session_id)
+            try:
+                session.driver.quit()
+            except Exception:
+                pass
+            replacement = self._launch(session.session_id)
+            if replacement is None:
+                with self._lock:
+                    self.sessions.remove(session)
+                return None
+            with self._lock:
+                self.sessions[self.sessions.index(session)] = replacement
+            session = replacement
+        return session
+
+    def release(self, session: _DaemonSession, voice: Optional[VoiceConfig]):
+        """Return a session, remembering which voice its page is set to"""
+        session.voice = voice
+        self._idle.put(session)
+
+    def _launch(self, session_id: int) -> Optional[_DaemonSession]:
+        """Start one browser, logging instead of raising on failure"""
+        download_dir = self._work_dir / f"session_{session_id}"
+        download_dir.mkdir(exist_ok=True)
+        try:
+            driver, debugger_address = self.launch_session(download_dir)
+        except Exception as e:
+            logger.error("Browser session %d failed to start: %s", session_id, e)
+            return None
+        return _DaemonSession(session_id, driver, debugger_address)
+
+    @staticmethod
+    def _is_alive(session: _DaemonSession) -> bool:
+        """Check the browser still answers WebDriver commands"""
+        try:
+            session.driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def _make_handler(self):
+        """Create a request handler class bound to this daemon"""
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                held: Optional[_DaemonSession] = None
+                try:
+                    for line in self.rfile:
+                        try:
+                            request = json.loads(line)
+                        except ValueError:
+                            self._reply({"ok": False, "error": "invalid JSON"})
+                            continue
+
+                        op = request.get("op")
+                        if op == "status":
+                            self._reply({"ok": True, **daemon.status()})
+                        elif op == "lease" and held is None:
+                            held = daemon.lease(request.get("timeout"))
+                            if held is None:
+                                self._reply({"ok": False, "error": "no idle session"})
+                            else:
+                                self._reply(
+                                    {
+                                        "ok": True,
+                                        "session_id": held.session_id,
+                                        "debugger_address": held.debugger_address,
+                                        "voice": _voice_to_json(held.voice),
+                                    }
+                                )
+                        elif op == "release" and held is not None:
+                            daemon.release(held, _voice_from_json(request.get("voice")))
+                            held = None
+                            self._reply({"ok": True})
+                        else:
+                            self._reply({"ok": False, "error": f"unexpected op {op!r}"})
+                except OSError:
+                    pass  # Client disconnected abruptly
+                finally:
+                    if held is not None:
+                        # Client went away mid-lease; page state is unknown
+                        daemon.release(held, None)
+
+            def _reply(self, message: dict):
+                self.wfile.write(json.dumps(message).encode("utf-8") + b"\n")
+                self.wfile.flush()
+
+        return Handler
+
+
+class BrowserDaemonClient:
+    """Lease a browser session from a running BrowserSessionDaemon"""
+
+    def __init__(self, address: str, timeout: float = 60):
+        """
+        Initialize daemon client
+
+        Args:
+            address: Daemon address as "host:port"
+            timeout: Seconds to wait for connecting and for an idle session
+        """
+        self.address = address
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._reader = None
+
+    def lease(self) -> BrowserLease:
+        """
+        Lease a session; it stays ours until release() or close()
+
+        Raises:
+            ConnectionError: If the daemon is unreachable or has no idle session
+        """
+        self._connect()
+        reply = self._request({"op": "lease", "timeout": self.timeout})
+        if not reply.get("ok"):
+            self.close()
+            raise ConnectionError(f"Browser daemon refused lease: {reply.get('error')}")
+        return BrowserLease(
+            reply["session_id"],
+            reply["debugger_address"],
+            _voice_from_json(reply.get("voice")),
+        )
+
+    def release(self, voice: Optional[VoiceConfig] = None):
+        """Hand the session back, telling the daemon its current voice"""
+        if self._sock:
+            try:
+                self._request({"op": "release", "voice": _voice_to_json(voice)})
+            except OSError:
+                pass
+        self.close()
+
+    def status(self) -> dict:
+        """Get pool occupancy from the daemon"""
+        self._connect()
+        try:
+            return self._request({"op": "status"})
+        finally:
+            self.close()
+
+    def close(self):
+        """Close the connection (releasing any lease daemon-side)"""
+        if self._sock:
+            self._reader.close()
+            self._sock.close()
+            self._sock = None
+            self._reader = None
+
+    def _connect(self):
+        """Open the connection if not already open"""
+        if self._sock:
+            return
+        try:
+            self._sock = socket.create_connection(
+                parse_address(self.address), timeout=self.timeout
+            )
+        except OSError as e:
+            raise ConnectionError(
+                f"Browser daemon not reachable at {self.address}: {e}"
+            )
+        # The daemon may take up to `timeout` to find an idle session
+        self._sock.settimeout(self.timeout + 5)
+        self._reader = self._sock.makefile("rb")
+
+    def _request(self, message: dict) -> dict:
+        """Send one request line and read the reply line"""
+        self._sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("Browser daemon closed the connection")
+        return json.loads(line)
+
+
+def _voice_to_json(voice: Optional[VoiceConfig]):
+    return [voice.dialect, voice.gender] if voice else None
+
+
+def _voice_from_json(data) -> Optional[VoiceConfig]:
+    return VoiceConfig(dialect=data[0], gender=data[1]) if data else None
+
+
+def main():
+    """Run the daemon until interrupted"""
+    parser = argparse.ArgumentParser(description="Warm Abair.ie browser sessions")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--sessions", type=int, default=1)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    daemon = BrowserSessionDaemon(args.host, args.port, size=args.sessions)
+    daemon.start()
+    print(
+        f"Browser daemon serving {len(daemon.sessions)} session(s) at {daemon.address}"
+    )
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Cooperative cancellation and deadlines for dubbing jobs
+"""
+
+from typing import List, Optional
+import asyncio
+import threading
+import time
+
+
+class OperationCancelled(BaseException):
+    """
+    Raised by work that stopped because its token was cancelled
+
+    Derives from BaseException, like asyncio.CancelledError, so the
+    handlers that turn a failed synthesis into a silent fallback do not
+    swallow it.
+    """
+
+
+class CancellationToken:
+    """
+    Lets one thread ask work running in others to stop
+
+    Work checks the token between steps and waits on it instead of
+    sleeping, so it stops within a fraction of a second. A token may have a
+    deadline, after which it counts as cancelled, and a parent it is
+    cancelled with (e.g. a job's token under the token of its batch).
+    Thread-safe.
+    """
+
+    # How often asynchronous waits look at the token
+    POLL_INTERVAL_SEC = 0.05
+
+    def __init__(
+        self,
+        timeout_sec: Optional[float] = None,
+        parent: Optional["CancellationToken"] = None,
+    ):
+        """
+        Initialize cancellation token
+
+        Args:
+            timeout_sec: Seconds from now until the token cancels itself
+                (no deadline if None)
+            parent: Token whose cancellation (and deadline) this one shares
+        """
+        self.deadline: Optional[float] = None
+        if timeout_sec is not None:
+            self.deadline = time.monotonic() + timeout_sec
+        if parent is not None and parent.deadline is not None:
+            self.deadline = min(self.deadline or parent.deadline, parent.deadline)
+        self.reason: Optional[str] = None
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._children: List["CancellationToken"] = []
+
+        if parent is not None:
+            with parent._lock:
+                parent._children.append(self)
+            if parent.cancelled:
+                self.cancel(parent.reason)
+
+    @property
+    def cancelled(self) -> bool:
+        """Check whether the work should stop"""
+        if not self._event.is_set() and self.remaining() == 0:
+            self.cancel("Deadline exceeded")
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "Cancelled by user"):
+        """Ask the work (and the work of child tokens) to stop"""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            children = list(self._children)
+        for child in children:
+            child.cancel(reason)
+
+    def remaining(self) -> Optional[float]:
+        """Get the seconds left until the deadline, or None without one"""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def check(self):
+        """Raise OperationCancelled if the work should stop"""
+        if self.cancelled:
+            raise OperationCancelled(self.reason)
+
+    def sleep(self, seconds: float):
+        """Sleep, waking early to raise OperationCancelled if cancelled"""
+        remaining = self.remaining()
+        if remaining is not None:
+            seconds = min(seconds, remaining)
+        self._event.wait(max(0.0, seconds))
+        self.check()
+
+    async def asleep(self, seconds: float):
+        """Asynchronous counterpart of sleep"""
+        end = time.monotonic() + seconds
+        while True:
+            self.check()
+            left = end - time.monotonic()
+            if left <= 0:
+                return
+            await asyncio.sleep(min(left, self.POLL_INTERVAL_SEC))
+
+
+def sleep(seconds: float, cancellation: Optional[CancellationToken] = None):
+    """Sleep, through the token if there is one"""
+    if cancellation is not None:
+        cancellation.sleep(seconds)
+    elif seconds > 0:
+        time.sleep(seconds)
+
+
+async def asleep(seconds: float, cancellation: Optional[CancellationToken] = None):
+    """Asynchronous counterpart of sleep"""
+    if cancellation is not None:
+        await cancellation.asleep(seconds)
+    elif seconds > 0:
+        await asyncio.sleep(seconds)
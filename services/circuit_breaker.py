@@ -0,0 +1,138 @@
+"""
+Circuit breaker pausing synthesis while the backend keeps failing
+"""
+
+from typing import Optional
+import threading
+import time
+
+from services import cancellation as cancel
+from services.cancellation import CancellationToken
+from services.progress_observer import ProgressObserver, NoOpProgressObserver
+
+
+class CircuitBreaker:
+    """
+    Stop sending requests after repeated consecutive failures
+
+    After `failure_threshold` failures in a row the circuit opens and every
+    caller waits out a cooldown. The first caller after the cooldown sends a
+    single trial request (half-open): success closes the circuit, failure
+    re-opens it with the cooldown doubled, up to `max_cooldown_sec`.
+    Thread-safe, with blocking and asyncio entry points like
+    AdaptiveRateLimiter.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        cooldown_sec: float = 30.0,
+        max_cooldown_sec: float = 300.0,
+        probe_interval_sec: float = 0.5,
+        observer: Optional[ProgressObserver] = None,
+    ):
+        """
+        Initialize circuit breaker
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            cooldown_sec: Pause after the circuit first opens
+            max_cooldown_sec: Upper bound for the doubling cooldown
+            probe_interval_sec: How often callers re-check while a trial runs
+            observer: Progress observer told when the circuit opens
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.base_cooldown_sec = cooldown_sec
+        self.max_cooldown_sec = max_cooldown_sec
+        self.probe_interval_sec = probe_interval_sec
+        self.observer = observer or NoOpProgressObserver()
+
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.trips = 0
+        self.cooldown_sec = cooldown_sec
+        self._open_until = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Ask to send a request
+
+        Returns:
+            0 if the request may go now, otherwise seconds to wait before
+            asking again
+        """
+        with self._lock:
+            if self.state == self.OPEN:
+                remaining = self._open_until - time.monotonic()
+                if remaining > 0:
+                    return remaining
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+
+            if self.state == self.HALF_OPEN:
+                if self._trial_in_flight:
+                    return self.probe_interval_sec
+                self._trial_in_flight = True
+            return 0.0
+
+    def acquire(self, cancellation: Optional[CancellationToken] = None):
+        """Block until the circuit lets a request through"""
+        delay = self.reserve()
+        while delay > 0:
+            cancel.sleep(delay, cancellation)
+            delay = self.reserve()
+
+    async def aacquire(self, cancellation: Optional[CancellationToken] = None):
+        """Wait without blocking the event loop until a request may be sent"""
+        delay = self.reserve()
+        while delay > 0:
+            await cancel.asleep(delay, cancellation)
+            delay = self.reserve()
+
+    def record_success(self):
+        """Close the circuit after a successful request"""
+        with self._lock:
+            self.consecutive_failures = 0
+            self.cooldown_sec = self.base_cooldown_sec
+            self.state = self.CLOSED
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        """Count a failure, opening the circuit at the threshold"""
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == self.HALF_OPEN:
+                # Trial failed - back off harder
+                self.cooldown_sec = min(self.max_cooldown_sec, self.cooldown_sec * 2)
+            elif self.consecutive_failures < self.failure_threshold:
+                return
+            self._open()
+
+        self.observer.on_stats("Circuit breaker", self.stats())
+
+    def record_cancelled(self):
+        """Forget a request that was abandoned before it finished"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def stats(self) -> dict:
+        """Get the circuit state and counters"""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "trips": self.trips,
+            "cooldown_sec": self.cooldown_sec,
+        }
+
+    def _open(self):
+        """Open the circuit for the current cooldown"""
+        self.state = self.OPEN
+        self.trips += 1
+        self._trial_in_flight = False
+        self._open_until = time.monotonic() + self.cooldown_sec
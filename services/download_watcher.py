@@ -0,0 +1,221 @@
+"""
+Detect browser downloads as soon as they are finalized
+"""
+
+from pathlib import Path
+from typing import Optional, Set
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+
+# Suffixes browsers use while a download is still being written
+PARTIAL_SUFFIXES = (".crdownload", ".part", ".tmp")
+
+# inotify constants from <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_Q_OVERFLOW = 0x00004000
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def is_partial_download(name: str) -> bool:
+    """Check whether a file name belongs to an unfinished download"""
+    return name.endswith(PARTIAL_SUFFIXES) or name.startswith(".")
+
+
+class DownloadWatcher:
+    """
+    Wait for new files in a dedicated download directory
+
+    The browser should download into a directory nothing else writes to, so
+    every finalized file that appears is the download being waited for.
+    This base implementation rescans that (small) directory at a short
+    interval; InotifyDownloadWatcher is notified by the kernel instead.
+    """
+
+    def __init__(self, directory: Path, poll_interval: float = 0.02):
+        """
+        Initialize download watcher
+
+        Args:
+            directory: Directory the browser downloads into
+            poll_interval: Seconds between directory scans
+        """
+        self.directory = Path(directory)
+        self.poll_interval = poll_interval
+        self._known: Set[str] = set()
+
+    def start(self):
+        """Create the directory and begin watching it"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def stop(self):
+        """Stop watching"""
+
+    def expect(self):
+        """Forget files seen so far; call just before triggering a download"""
+        self._known = set(self._scan())
+
+    def wait(self, timeout: float = 30) -> Optional[Path]:
+        """
+        Wait for a finalized file that appeared since expect()
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Path of the downloaded file, or None on timeout
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            for name in self._scan():
+                if name not in self._known and not is_partial_download(name):
+                    return self.directory / name
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            time.sleep(min(self.poll_interval, remaining))
+
+    def _scan(self):
+        """List file names currently in the directory"""
+        try:
+            with os.scandir(self.directory) as entries:
+                return [entry.name for entry in entries if entry.is_file()]
+        except OSError:
+            return []
+
+    def __enter__(self) -> "DownloadWatcher":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+class InotifyDownloadWatcher(DownloadWatcher):
+    """
+    Download watcher driven by Linux inotify events
+
+    Browsers finalize a download by closing it or renaming it from its
+    partial name, so IN_CLOSE_WRITE and IN_MOVED_TO mark completion and
+    wait() returns as soon as the kernel reports it.
+    """
+
+    def __init__(self, directory: Path, poll_interval: float = 0.02):
+        super().__init__(directory, poll_interval)
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd: Optional[int] = None
+        self._buffer = b""
+
+    @staticmethod
+    def is_supported() -> bool:
+        """Check whether inotify can be used on this platform"""
+        if not sys.platform.startswith("linux"):
+            return False
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name:
+            return False
+        try:
+            return hasattr(ctypes.CDLL(libc_name), "inotify_init1")
+        except OSError:
+            return False
+
+    def start(self):
+        """Create the directory and register an inotify watch on it"""
+        super().start()
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        watch = self._libc.inotify_add_watch(
+            fd, os.fsencode(self.directory), IN_CLOSE_WRITE | IN_MOVED_TO
+        )
+        if watch < 0:
+            errno = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(errno, f"inotify_add_watch failed for {self.directory}")
+        self._fd = fd
+
+    def stop(self):
+        """Close the inotify descriptor"""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def expect(self):
+        """Discard pending events; call just before triggering a download"""
+        self._read_names()
+        super().expect()
+
+    def wait(self, timeout: float = 30) -> Optional[Path]:
+        """
+        Wait for the kernel to report a finalized file
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Path of the downloaded file, or None on timeout
+        """
+        if self._fd is None:
+            return super().wait(timeout)
+
+        deadline = time.monotonic() + timeout
+        while True:
+            for name in self._read_names():
+                if name is None:
+                    # Event queue overflowed - fall back to a directory scan
+                    return super().wait(max(0.0, deadline - time.monotonic()))
+                if name not in self._known and not is_partial_download(name):
+                    if (self.directory / name).exists():
+                        return self.directory / name
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            select.select([self._fd], [], [], remaining)
+
+    def _read_names(self):
+        """
+        Read pending events without blocking
+
+        Returns:
+            File names from the events, with None marking a queue overflow
+        """
+        names = []
+        while True:
+            try:
+                self._buffer += os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(self._buffer):
+            _, mask, _, length = _EVENT_HEADER.unpack_from(self._buffer, offset)
+            end = offset + _EVENT_HEADER.size + length
+            if end > len(self._buffer):
+                break
+            raw_name = self._buffer[offset + _EVENT_HEADER.size : end]
+            offset = end
+            if mask & IN_Q_OVERFLOW:
+                names.append(None)
+            elif length:
+                names.append(os.fsdecode(raw_name.rstrip(b"\0")))
+
+        self._buffer = self._buffer[offset:]
+        return names
+
+
+def create_download_watcher(directory: Path) -> DownloadWatcher:
+    """
+    Create the fastest download watcher available on this platform
+
+    Args:
+        directory: Dedicated directory the browser downloads into
+    """
+    if InotifyDownloadWatcher.is_supported():
+        return InotifyDownloadWatcher(directory)
+    return DownloadWatcher(directory)
@@ -2,20 +2,583 @@
 Dubbing orchestrator - coordinates all services to perform dubbing
 """
 
+import asyncio
+import bisect
 import random
 import time
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple
 from pydub import AudioSegment
 
-from models import DubbingJob, Segment, VoiceConfig
+from models import DubbingJob, JobResult, Segment, VoiceConfig
 from services import (
+    AudioClipCache,
     AudioService,
     VideoService,
     SubtitleService,
     ProgressObserver,
     ConsoleProgressObserver,
 )
+from services import timeline
+from services.cancellation import CancellationToken, OperationCancelled
+from services.circuit_breaker import CircuitBreaker
+from services.job_manifest import (
+    JobManifest,
+    ManifestDiff,
+    ManifestEntry,
+    segment_key,
+)
+from services.placement import PlacementSolver
+from services.rate_limiter import AdaptiveRateLimiter
+from services.request_packer import RequestPacker
+from services.retry_queue import RetryQueue
+from services.stage_scheduler import StageScheduler
+from services.time_fit import TimeFitter
+
+
+@dataclass
+class _PlannedSegment:
+    """Voice and subtitle timing chosen for a segment before synthesis"""
+
+    position: int  # Index into the job's segment list
+    segment: Segment
+    voice: VoiceConfig
+    allowed_end_sec: float
+    window_end_sec: Optional[float] = None  # Next spoken segment or video end
+
+
+@dataclass
+class _FailedSlot:
+    """Place on the track reserved for a segment whose synthesis failed"""
+
+    planned: _PlannedSegment
+    start_ms: int
+    end_ms: Optional[int] = None  # Start of the next clip, None if none follows
+
+    @property
+    def room_ms(self) -> Optional[int]:
+        """Milliseconds a retried clip may fill, or None if unbounded"""
+        return None if self.end_ms is None else self.end_ms - self.start_ms
+
+
+class _TrackAssembler:
+    """Builds the dubbed track one segment at a time, in subtitle order"""
+
+    def __init__(
+        self,
+        skip_threshold_ms: float,
+        duration_ms: float = 0,
+        overlap_policy: str = timeline.SHIFT,
+        fitter: Optional[TimeFitter] = None,
+    ):
+        if overlap_policy not in timeline.OVERLAP_POLICIES:
+            raise ValueError(f"Unknown overlap policy '{overlap_policy}'")
+        self.skip_threshold_ms = skip_threshold_ms
+        self.overlap_policy = overlap_policy
+        self.fitter = fitter
+        self.timeline = timeline.TimelineBuffer(duration_ms)
+        self.processed_segments: List[Segment] = []
+        self.current_time_ms = 0  # End of the track so far
+        self.cursor_ms = 0  # Where the next clip goes
+        self.last_gap_ms = 0
+        self.failed_slots: List[_FailedSlot] = []
+
+    @property
+    def dub_track(self) -> AudioSegment:
+        """The track assembled so far"""
+        return self.timeline.to_audio_segment(self.current_time_ms)
+
+    def sync_to(self, segment: Segment) -> bool:
+        """
+        Move to the segment start, or as close as the overlap policy allows
+
+        Clips that may overlap (truncate, mix) always start on time. With
+        the shift policy a clip starts after the previous one ends, so the
+        track can fall behind the subtitles.
+
+        Returns:
+            False if the track lags so far behind that the segment is skipped
+        """
+        gap_ms = segment.start_ms - self.current_time_ms
+        self.last_gap_ms = gap_ms
+        if gap_ms > 0:
+            self.current_time_ms += gap_ms
+        elif self.overlap_policy == timeline.SHIFT and gap_ms < -self.skip_threshold_ms:
+            return False
+
+        if self.overlap_policy == timeline.SHIFT:
+            self.cursor_ms = self.current_time_ms
+        else:
+            self.cursor_ms = segment.start_ms
+        return True
+
+    def add_clip(
+        self,
+        segment: Segment,
+        allowed_end_sec: float,
+        voice_audio: AudioSegment,
+        window_end_sec: Optional[float] = None,
+    ):
+        """
+        Write a synthesized clip and record its subtitle timing
+
+        With a fitter, a clip that would play past `window_end_sec` is
+        shortened to end there if it can be.
+        """
+        for slot in self.failed_slots:
+            if slot.end_ms is None:
+                slot.end_ms = self.cursor_ms
+
+        if self.fitter and window_end_sec is not None:
+            voice_audio = self.fitter.fit(
+                voice_audio, window_end_sec * 1000 - self.cursor_ms
+            )
+
+        self.timeline.write(self.cursor_ms, voice_audio, self.overlap_policy)
+        self.current_time_ms = max(
+            self.current_time_ms, self.cursor_ms + len(voice_audio)
+        )
+
+        subtitle = self._subtitle_for(segment, allowed_end_sec)
+        subtitle.index = len(self.processed_segments) + 1
+        self.processed_segments.append(subtitle)
+
+    def add_fallback(self, planned: _PlannedSegment):
+        """Leave a failed segment silent and reserve its slot for a retry"""
+        self.failed_slots.append(_FailedSlot(planned, self.cursor_ms))
+
+        fallback_duration = planned.segment.duration_ms
+        if self.last_gap_ms > 0:
+            self.current_time_ms = max(
+                self.current_time_ms, self.cursor_ms + fallback_duration
+            )
+
+    def patch_clip(self, slot: _FailedSlot, voice_audio: AudioSegment) -> bool:
+        """
+        Place a retried clip into the slot its segment failed in
+
+        The clip may run on through the silence after the slot up to the
+        next clip; anything longer is fitted (with a fitter) and then cut
+        there with a short fade.
+
+        Returns:
+            True if the clip had to be truncated
+        """
+        if self.fitter and slot.room_ms is not None:
+            voice_audio = self.fitter.fit(voice_audio, slot.room_ms)
+        truncated = slot.room_ms is not None and len(voice_audio) > slot.room_ms
+        if truncated:
+            voice_audio = voice_audio[: slot.room_ms].fade_out(min(20, slot.room_ms))
+
+        self.timeline.write(slot.start_ms, voice_audio, timeline.MIX)
+        self.current_time_ms = max(
+            self.current_time_ms, slot.start_ms + len(voice_audio)
+        )
+
+        segment = slot.planned.segment
+        starts = [s.start for s in self.processed_segments]
+        self.processed_segments.insert(
+            bisect.bisect_right(starts, segment.start),
+            self._subtitle_for(segment, slot.planned.allowed_end_sec),
+        )
+        for number, subtitle in enumerate(self.processed_segments, 1):
+            subtitle.index = number
+        return truncated
+
+    def finish(self):
+        """Complete the track once every clip (and retry) is in"""
+
+    @staticmethod
+    def _subtitle_for(segment: Segment, allowed_end_sec: float) -> Segment:
+        """Build the output subtitle for a placed clip"""
+        return Segment(
+            start=segment.start,
+            end=allowed_end_sec,
+            english_text=segment.get_clean_english_text(),
+            irish_text=segment.irish_text,
+        )
+
+
+class _SolvedTrackAssembler(_TrackAssembler):
+    """
+    Collects every clip first, then places them all at once
+
+    The solver needs every clip's duration, so clips are held until
+    finish() instead of being written as they arrive, and segments are only
+    skipped once the whole track has been seen. Retried clips join the
+    others rather than being patched into a slot.
+    """
+
+    def __init__(
+        self,
+        skip_threshold_ms: float,
+        duration_ms: float,
+        solver: PlacementSolver,
+        fitter: Optional[TimeFitter] = None,
+    ):
+        super().__init__(skip_threshold_ms, duration_ms, timeline.SHIFT, fitter)
+        self.solver = solver
+        self._clips: List[Tuple[Segment, float, AudioSegment]] = []
+
+    def sync_to(self, segment: Segment) -> bool:
+        """Never skip before the whole track is known"""
+        self.cursor_ms = segment.start_ms
+        return True
+
+    def add_clip(
+        self,
+        segment: Segment,
+        allowed_end_sec: float,
+        voice_audio: AudioSegment,
+        window_end_sec: Optional[float] = None,
+    ):
+        """Hold a clip for placement, fitted to its window from the start"""
+        if self.fitter and window_end_sec is not None:
+            voice_audio = self.fitter.fit(
+                voice_audio, window_end_sec * 1000 - segment.start_ms
+            )
+        self._clips.append((segment, allowed_end_sec, voice_audio))
+
+    def add_fallback(self, planned: _PlannedSegment):
+        """Remember a failed segment for the retry pass"""
+        self.failed_slots.append(_FailedSlot(planned, planned.segment.start_ms))
+        self.current_time_ms = max(self.current_time_ms, planned.segment.end_ms)
+
+    def patch_clip(self, slot: _FailedSlot, voice_audio: AudioSegment) -> bool:
+        """Hold a retried clip for placement with the others"""
+        self.add_clip(
+            slot.planned.segment,
+            slot.planned.allowed_end_sec,
+            voice_audio,
+            slot.planned.window_end_sec,
+        )
+        return False
+
+    def finish(self):
+        """Solve the placement and write every kept clip"""
+        clips = sorted(self._clips, key=lambda clip: clip[0].start)
+        self._clips = []
+        placed = self.solver.solve(
+            [segment.start_ms for segment, _, _ in clips],
+            [len(voice_audio) for _, _, voice_audio in clips],
+            self.skip_threshold_ms,
+        )
+
+        for (segment, allowed_end_sec, voice_audio), position in zip(clips, placed):
+            if position is None:
+                continue
+            self.timeline.write(position, voice_audio, timeline.SHIFT)
+            self.current_time_ms = max(
+                self.current_time_ms, position + len(voice_audio)
+            )
+            subtitle = self._subtitle_for(segment, allowed_end_sec)
+            subtitle.index = len(self.processed_segments) + 1
+            self.processed_segments.append(subtitle)
+
+
+class _ClipCoalescer:
+    """
+    Shares one synthesis between segments with the same text and voice
+
+    Finished clips are remembered until the last expected duplicate has
+    taken them, and a duplicate requested while the first synthesis is
+    still running waits for it instead of starting another. Failures are
+    not remembered, so a later duplicate tries again.
+    """
+
+    def __init__(self, expected: Optional[Counter] = None):
+        """
+        Args:
+            expected: Counted requests per key still to come; clips for keys
+                not listed are kept for the rest of the job
+        """
+        self.requests = 0
+        self.syntheses = 0
+        self._remaining = Counter(expected or {})
+        self._clips: Dict[str, AudioSegment] = {}
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._waiters: Dict[str, int] = {}
+
+    @staticmethod
+    def key(planned: _PlannedSegment) -> str:
+        """Key under which duplicate segments share a clip"""
+        return AudioClipCache.make_key(planned.segment.irish_text, planned.voice)
+
+    def fetch(
+        self,
+        planned: _PlannedSegment,
+        generate: Callable[[], Optional[AudioSegment]],
+        count_request: bool = True,
+    ) -> Optional[AudioSegment]:
+        """Get the segment's clip, calling `generate` only for new lines"""
+        key = self._claim(planned, count_request)
+        if key in self._clips:
+            return self._take(key)
+
+        self.syntheses += 1
+        voice_audio = generate()
+        if voice_audio is not None and self._needed(key):
+            self._clips[key] = voice_audio
+        return voice_audio
+
+    async def afetch(
+        self,
+        planned: _PlannedSegment,
+        agenerate: Callable[[], Awaitable[Optional[AudioSegment]]],
+        count_request: bool = True,
+    ) -> Optional[AudioSegment]:
+        """Asynchronous fetch(), joining a synthesis already in flight"""
+        key = self._claim(planned, count_request)
+        if key in self._clips:
+            return self._take(key)
+
+        task = self._in_flight.get(key)
+        if task is None:
+            self.syntheses += 1
+            task = asyncio.ensure_future(agenerate())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            # Shielded so one duplicate being cancelled (skipped for lag)
+            # does not cancel the synthesis the others are waiting on
+            return await asyncio.shield(task)
+        finally:
+            self._waiters[key] -= 1
+            if not self._waiters[key] and not task.done():
+                task.cancel()  # Nobody needs it any more
+
+    def stats(self) -> Dict[str, int]:
+        """Get request/synthesis counts for the job summary"""
+        return {
+            "segments": self.requests,
+            "syntheses": self.syntheses,
+            "coalesced": self.requests - self.syntheses,
+        }
+
+    def _claim(self, planned: _PlannedSegment, count_request: bool) -> str:
+        """Count a request against its key's expected uses"""
+        key = self.key(planned)
+        self.requests += count_request
+        if count_request and key in self._remaining:
+            self._remaining[key] -= 1
+        return key
+
+    def _needed(self, key: str) -> bool:
+        """Whether more requests for the key are still expected"""
+        return self._remaining.get(key, 1) > 0
+
+    def _take(self, key: str) -> AudioSegment:
+        """Get a remembered clip, forgetting it after its last expected use"""
+        if self._needed(key):
+            return self._clips[key]
+        return self._clips.pop(key)
+
+    def _finish(self, key: str, task: asyncio.Future):
+        """Remember a finished clip and stop routing duplicates to the task"""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled() and task.exception() is None:
+            if task.result() is not None and self._needed(key):
+                self._clips[key] = task.result()
+
+
+class _PackedRequests:
+    """
+    Routes planned segments through the packed requests they share
+
+    Each packed request is a synthetic planned segment holding the joined
+    text, so it is synthesized (and coalesced) like any other line; its
+    audio is split once and each member takes its piece (the pieces are
+    dropped once every member has taken its piece or been released). If the
+    split fails, members fall back to their own requests.
+    """
+
+    def __init__(
+        self, packer: Optional[RequestPacker], plan: Dict[int, _PlannedSegment]
+    ):
+        self.packer = packer
+        self.split_failures = 0
+        self._groups: Dict[int, List[_PlannedSegment]] = {}
+        self._requests: Dict[int, _PlannedSegment] = {}
+        self._pieces: Dict[int, Optional[List[AudioSegment]]] = {}
+        self._settled: Dict[int, Set[int]] = {}
+        if packer is None:
+            return
+
+        ordered = [plan[i] for i in sorted(plan)]
+        for indices in packer.pack([(p.segment.irish_text, p.voice) for p in ordered]):
+            if len(indices) < 2:
+                continue
+            group = [ordered[k] for k in indices]
+            request = _PlannedSegment(
+                group[0].position,
+                Segment(
+                    start=group[0].segment.start,
+                    end=group[-1].segment.end,
+                    english_text="",
+                    irish_text=packer.join([p.segment.irish_text for p in group]),
+                ),
+                group[0].voice,
+                group[-1].allowed_end_sec,
+            )
+            for planned in group:
+                self._groups[planned.position] = group
+                self._requests[planned.position] = request
+
+    def unit_for(self, planned: _PlannedSegment) -> _PlannedSegment:
+        """Get the request that synthesizes a segment (itself if unpacked)"""
+        return self._requests.get(planned.position, planned)
+
+    def fetch(
+        self,
+        planned: _PlannedSegment,
+        synthesize: Callable[[_PlannedSegment, bool], Optional[AudioSegment]],
+    ) -> Optional[AudioSegment]:
+        """
+        Get a segment's clip via its packed request
+
+        `synthesize(unit, count_request)` produces the audio for a request;
+        count_request is False for the fallback after a failed split.
+        """
+        request = self._requests.get(planned.position)
+        if request is None:
+            return synthesize(planned, True)
+        audio = synthesize(request, True)
+        if audio is None:
+            self.release(planned)
+            return None
+        piece = self._piece(planned, audio)
+        return piece if piece is not None else synthesize(planned, False)
+
+    async def afetch(
+        self,
+        planned: _PlannedSegment,
+        synthesize: Callable[
+            [_PlannedSegment, bool], Awaitable[Optional[AudioSegment]]
+        ],
+    ) -> Optional[AudioSegment]:
+        """Asynchronous counterpart of fetch()"""
+        request = self._requests.get(planned.position)
+        if request is None:
+            return await synthesize(planned, True)
+        audio = await synthesize(request, True)
+        if audio is None:
+            self.release(planned)
+            return None
+        piece = self._piece(planned, audio)
+        return piece if piece is not None else await synthesize(planned, False)
+
+    def release(self, planned: _PlannedSegment):
+        """Give up a segment's piece, e.g. when it is skipped for lag"""
+        group = self._groups.get(planned.position)
+        if group is not None:
+            self._settle(group, planned)
+
+    def stats(self) -> Dict[str, int]:
+        """Get packing counts for the job summary"""
+        groups = {id(group): group for group in self._groups.values()}
+        return {
+            "packed_segments": len(self._groups),
+            "packed_requests": len(groups),
+            "split_failures": self.split_failures,
+        }
+
+    def _piece(
+        self, planned: _PlannedSegment, audio: AudioSegment
+    ) -> Optional[AudioSegment]:
+        """Split a packed clip once and return this segment's piece"""
+        group = self._groups[planned.position]
+        first = group[0].position
+        if first not in self._pieces:
+            pieces = self.packer.split(audio, len(group))
+            self.split_failures += pieces is None
+            self._pieces[first] = pieces
+
+        pieces = self._pieces[first]
+        self._settle(group, planned)
+        return None if pieces is None else pieces[group.index(planned)]
+
+    def _settle(self, group: List[_PlannedSegment], planned: _PlannedSegment):
+        """Mark a member as done, dropping the pieces once all members are"""
+        first = group[0].position
+        settled = self._settled.setdefault(first, set())
+        settled.add(planned.position)
+        if len(settled) == len(group):
+            self._pieces.pop(first, None)
+
+
+class _Checkpoint:
+    """
+    Restores finished segments from a job manifest and records new ones
+
+    The job's segments are diffed against the manifest, so a corrected
+    subtitle file only resynthesizes the lines that changed; moved lines
+    reuse their clip at the new time. Restored segments keep the voice they
+    were synthesized with. Without a manifest nothing is restored or
+    recorded.
+    """
+
+    def __init__(
+        self,
+        manifest: Optional[JobManifest],
+        plan: Dict[int, _PlannedSegment],
+        observer: ProgressObserver,
+    ):
+        self.manifest = manifest
+        self.observer = observer
+        self.restored: Dict[int, ManifestEntry] = {}
+        self.diff: Optional[ManifestDiff] = None
+        if manifest is None:
+            return
+        positions = sorted(plan)
+        self.diff = manifest.diff([(plan[i].segment, plan[i].voice) for i in positions])
+        for k, entry in self.diff.matches.items():
+            plan[positions[k]].voice = entry.voice
+            self.restored[positions[k]] = entry
+
+    def pending(self, plan: Dict[int, _PlannedSegment]) -> Dict[int, _PlannedSegment]:
+        """Get the planned segments that still need synthesizing"""
+        return {i: p for i, p in plan.items() if i not in self.restored}
+
+    def restore(self, planned: _PlannedSegment) -> Optional[AudioSegment]:
+        """Load a segment's recorded clip, or None if it must be synthesized"""
+        entry = self.restored.get(planned.position)
+        if entry is None:
+            return None
+        voice_audio = self.manifest.load_clip(entry)
+        if voice_audio is not None and entry.key != segment_key(planned.segment):
+            try:
+                self.manifest.reuse(planned.segment, entry)
+            except OSError as e:
+                self.observer.on_error(f"Failed to checkpoint segment: {e}")
+        return voice_audio
+
+    def record(self, planned: _PlannedSegment, voice_audio: AudioSegment):
+        """Record a freshly synthesized clip, never failing the job"""
+        if self.manifest is None:
+            return
+        try:
+            self.manifest.record(planned.segment, planned.voice, voice_audio)
+        except OSError as e:
+            self.observer.on_error(f"Failed to checkpoint segment: {e}")
+
+    def compact(self, plan: Dict[int, _PlannedSegment]):
+        """Drop the entries and clips of lines no longer in the job"""
+        if self.manifest is None:
+            return
+        try:
+            self.manifest.compact(p.segment for p in plan.values())
+        except OSError as e:
+            self.observer.on_error(f"Failed to compact checkpoint: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        """Get diff/record counts for the job summary"""
+        return {**self.diff.stats(), "recorded": self.manifest.recorded}
 
 
 class DubbingOrchestrator:
@@ -30,7 +593,8 @@ class DubbingOrchestrator:
     LONG_TEXT_THRESHOLD = 60  # Characters
     CHARS_PER_SEC_READING_SPEED = 14  # Average reading speed
     SKIP_THRESHOLD_SEC = 2.5
-    SEGMENT_DELAY_SEC = 5  # Delay between segments
+    SEGMENT_DELAY_SEC = 5  # Initial spacing between requests (then adapted)
+    LOOKAHEAD_SEGMENTS = 8  # Prefetch window when syntheses run concurrently
 
     # Available voices
     VOICE_POOL = [
@@ -44,6 +608,17 @@ class DubbingOrchestrator:
         video_service: VideoService,
         subtitle_service: SubtitleService,
         observer: Optional[ProgressObserver] = None,
+        segment_delay_sec: Optional[float] = None,
+        concurrency: int = 1,
+        batch_by_voice: bool = False,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        retry_queue: Optional[RetryQueue] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        request_packer: Optional[RequestPacker] = None,
+        lookahead: Optional[int] = None,
+        overlap_policy: str = timeline.SHIFT,
+        time_fitter: Optional[TimeFitter] = None,
+        placement_solver: Optional[PlacementSolver] = None,
     ):
         """
         Initialize dubbing orchestrator
@@ -53,149 +628,841 @@ class DubbingOrchestrator:
             video_service: Service for video processing
             subtitle_service: Service for subtitle handling
             observer: Progress observer for status updates
+            segment_delay_sec: Initial spacing between synthesis requests
+                (defaults to SEGMENT_DELAY_SEC; 0 disables rate limiting)
+            concurrency: Maximum syntheses in flight; values above 1 use the
+                asynchronous path when the audio service supports it
+            batch_by_voice: Synthesize the whole job through
+                AudioService.generate_batch so each voice is set up once.
+                Batches run ahead of placement, so with shift placement a
+                line later skipped for lag has still been synthesized
+            rate_limiter: Shared limiter pacing synthesis requests; by default
+                one starting at 1 / segment_delay_sec requests per second
+            retry_queue: Backoff schedule for re-synthesizing failed segments
+                after the main pass (RetryQueue(max_retries=0) disables it)
+            circuit_breaker: Pauses synthesis after consecutive failures
+            request_packer: Joins short consecutive same-voice lines into one
+                synthesis request (off by default)
+            lookahead: Segments synthesized ahead of the one being placed on
+                the track; a positive value prefetches in the background even
+                with one synthesis at a time (defaults to LOOKAHEAD_SEGMENTS
+                when concurrency is above 1, otherwise off)
+            overlap_policy: What a clip does to a previous clip still
+                playing at its start: "shift" waits for it to end (skipping
+                segments that fall too far behind), "truncate" cuts it off,
+                "mix" plays both
+            time_fitter: Trims and speeds up clips that would run into the
+                next segment, so the track rarely falls behind (off by
+                default)
+            placement_solver: Places all clips once every one is
+                synthesized, minimizing total drift and skips instead of
+                placing each clip as soon as possible (shift policy only;
+                off by default)
         """
+        if placement_solver and overlap_policy != timeline.SHIFT:
+            raise ValueError("A placement solver needs the 'shift' overlap policy")
         self.audio_service = audio_service
         self.video_service = video_service
         self.subtitle_service = subtitle_service
         self.observer = observer or ConsoleProgressObserver()
+        if segment_delay_sec is None:
+            segment_delay_sec = self.SEGMENT_DELAY_SEC
+        if rate_limiter is None and segment_delay_sec > 0:
+            rate_limiter = AdaptiveRateLimiter(
+                1.0 / segment_delay_sec, observer=self.observer
+            )
+        self.rate_limiter = rate_limiter
+        self.retry_queue = retry_queue if retry_queue is not None else RetryQueue()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(observer=self.observer)
+        self.concurrency = concurrency
+        self.batch_by_voice = batch_by_voice
+        self.request_packer = request_packer
+        self.lookahead = lookahead
+        self.overlap_policy = overlap_policy
+        self.time_fitter = time_fitter
+        self.placement_solver = placement_solver
+        # Token of the job being dubbed, checked between segments
+        self.cancellation: Optional[CancellationToken] = None
 
-    def execute(self, job: DubbingJob) -> str:
+    def execute(
+        self,
+        job: DubbingJob,
+        resume: bool = False,
+        cancellation: Optional[CancellationToken] = None,
+    ) -> str:
         """
         Execute complete dubbing workflow
 
+        Every synthesized clip is checkpointed in a manifest in
+        job.checkpoint_dir as soon as it is synthesized.
+
         Args:
             job: DubbingJob containing all necessary parameters
+            resume: Reuse the clips checkpointed by a previous run of the job
+                and only synthesize the missing segments, or (after the
+                subtitles were corrected) the added and changed ones
+            cancellation: Token that stops the job; the clips finished so
+                far stay checkpointed for a resumed run
 
         Returns:
             Success message with output path, or error message prefixed with 'ERROR:'
         """
-        # Validate job
-        error = job.validate()
-        if error:
-            return f"ERROR: {error}"
+        return self.execute_many([job], resume, cancellation)[0].message
 
+    def execute_many(
+        self,
+        jobs: Sequence[DubbingJob],
+        resume: bool = False,
+        cancellation: Optional[CancellationToken] = None,
+    ) -> List[JobResult]:
+        """
+        Execute the dubbing workflow for several jobs with the same services
+
+        The audio service is set up once, while the first job loads, and
+        cleaned up after the last job. Each job's video is encoded in the
+        background while the next job loads and synthesizes; encodes run
+        one at a time, and a job waits for the encode before it to finish
+        so at most two tracks are held at once. A failed job does not stop
+        the batch. Jobs sharing a folder get their output name as a prefix
+        on their subtitle files.
+
+        Each job runs under its own token, cancelled with `cancellation` or
+        once the job has run for job.deadline_sec. A cancelled job stops at
+        the next wait or segment (its encode at the next frame) and keeps
+        the clips it finished; jobs not yet started when the batch is
+        cancelled are not run.
+
+        Args:
+            jobs: Jobs to run, in order
+            resume: Reuse each job's checkpointed clips (see execute)
+            cancellation: Token that stops the whole batch
+
+        Returns:
+            One result per job, in order
+        """
+        self._separate_subtitle_files(jobs)
+        results = [JobResult(job) for job in jobs]
+        audio_ready = False
+        encode: Optional[Future] = None
+        started = time.perf_counter()
+
+        encoder = ThreadPoolExecutor(max_workers=1)
         try:
-            # Step 1: Load subtitles
-            job.segments = self.subtitle_service.load_subtitles(
-                job.eng_srt_path, job.gael_srt_path
-            )
+            for job, result in zip(jobs, results):
+                job_started = time.perf_counter()
+                token = CancellationToken(job.deadline_sec, parent=cancellation)
+                if token.cancelled:
+                    result.message = self._stopped(token.reason)
+                    continue
+                error = job.validate()
+                if error:
+                    result.message = f"ERROR: {error}"
+                    continue
 
-            # Step 2: Load video
-            video = self.video_service.load_video(job.video_path)
-            video_duration = self.video_service.get_video_duration(video)
+                self.cancellation = self.audio_service.cancellation = token
+                try:
+                    # Step 1: Load subtitles and video, open the checkpoint and
+                    # set up the audio service (first job only), each as soon
+                    # as what it needs is ready
+                    manifest = JobManifest(job.checkpoint_dir)
+                    stages = self._setup_stages(
+                        job, manifest, resume, setup_audio=not audio_ready
+                    )
+                    try:
+                        try:
+                            loaded = stages.run()
+                        finally:
+                            audio_ready = (
+                                audio_ready or "audio_setup" in stages.completed
+                            )
+                            result.timings["setup_sec"] = stages.timings["total"]
+                            self.observer.on_stats("Setup stages", stages.stats())
+                        token.check()
+                        job.segments = loaded["subtitles"]
 
-            # Step 3: Setup audio service
-            self.audio_service.setup()
+                        # Step 2: Generate dubbed audio track
+                        synthesis_started = time.perf_counter()
+                        dub_track, processed_segments = self._generate_dub_track(
+                            job.segments,
+                            loaded["video_duration"],
+                            job.current_folder,
+                            manifest,
+                        )
+                        result.timings["dubbing_sec"] = (
+                            time.perf_counter() - synthesis_started
+                        )
+                    finally:
+                        manifest.close()
+                except OperationCancelled as e:
+                    result.message = self._stopped(e)
+                    continue
+                except Exception as e:
+                    result.message = self._failed(e)
+                    continue
 
-            try:
-                # Step 4: Generate dubbed audio track
-                dub_track, processed_segments = self._generate_dub_track(
-                    job.segments, video_duration, job.current_folder
+                # Steps 3 and 4: Create final video and write subtitle files
+                # while the next job synthesizes
+                if encode is not None:
+                    encode.result()
+                encode = encoder.submit(
+                    self._finish_job,
+                    job,
+                    loaded["video"],
+                    dub_track,
+                    processed_segments,
+                    result,
+                    job_started,
+                    token,
                 )
+            if encode is not None:
+                encode.result()
+        finally:
+            encoder.shutdown(wait=True)
+            self.cancellation = self.audio_service.cancellation = None
+            # Always cleanup an audio service that was set up
+            if audio_ready:
+                try:
+                    self.audio_service.cleanup()
+                except Exception as e:
+                    self.observer.on_error(str(e))
 
-                # Step 5: Create final video
-                self.video_service.create_dubbed_video(
-                    video, dub_track, job.output_path
-                )
+        if len(jobs) > 1:
+            self.observer.on_stats(
+                "Batch",
+                {
+                    "jobs": len(jobs),
+                    "succeeded": sum(result.succeeded for result in results),
+                    "total_sec": round(time.perf_counter() - started, 3),
+                },
+            )
+        return results
 
-                # Step 6: Write subtitle files
-                self._write_subtitle_files(job, processed_segments)
+    def _finish_job(
+        self,
+        job: DubbingJob,
+        video,
+        dub_track: AudioSegment,
+        processed_segments: List[Segment],
+        result: JobResult,
+        job_started: float,
+        cancellation: CancellationToken,
+    ):
+        """Encode a job's video and write its subtitles, filling in its result"""
+        encode_started = time.perf_counter()
+        # Encodes run one at a time, so the service only has this job's token
+        self.video_service.cancellation = cancellation
+        try:
+            self.video_service.create_dubbed_video(video, dub_track, job.output_path)
+            self._write_subtitle_files(job, processed_segments)
+        except OperationCancelled as e:
+            result.message = self._stopped(e)
+            return
+        except Exception as e:
+            result.message = self._failed(e)
+            return
+        finally:
+            self.video_service.cancellation = None
+            now = time.perf_counter()
+            result.timings["encode_sec"] = now - encode_started
+            result.timings["total_sec"] = now - job_started
 
-                # Success
-                self.observer.on_complete(str(job.output_path))
-                return f"Success! Output video saved as: {job.output_path}"
+        self.observer.on_complete(str(job.output_path))
+        result.message = f"Success! Output video saved as: {job.output_path}"
 
-            finally:
-                # Always cleanup audio service
-                self.audio_service.cleanup()
+    def _failed(self, error: Exception) -> str:
+        """Report a job's failure and get its error message"""
+        self.observer.on_error(str(error))
+        return f"ERROR: Dubbing process failed: {error}"
 
-        except Exception as e:
-            error_msg = f"ERROR: Dubbing process failed: {e}"
-            self.observer.on_error(str(e))
-            return error_msg
+    def _stopped(self, reason) -> str:
+        """Report a cancelled job and get its error message"""
+        self.observer.on_error(f"Dubbing cancelled: {reason}")
+        return (
+            f"ERROR: Dubbing cancelled ({reason}); finished clips are kept, "
+            "resume the job to reuse them"
+        )
+
+    def _check_cancelled(self):
+        """Stop the job if its token was cancelled"""
+        if self.cancellation:
+            self.cancellation.check()
+
+    @staticmethod
+    def _separate_subtitle_files(jobs: Sequence[DubbingJob]):
+        """Prefix the subtitle files of jobs that would write the same ones"""
+        folders = Counter(job.output_srt_english for job in jobs)
+        for job in jobs:
+            if folders[job.output_srt_english] > 1:
+                job.subtitle_prefix = f"{Path(job.output_filename).stem}_"
+
+    def _setup_stages(
+        self,
+        job: DubbingJob,
+        manifest: JobManifest,
+        resume: bool,
+        setup_audio: bool = True,
+    ) -> StageScheduler:
+        """
+        Declare the work done before dubbing starts
+
+        Loading the subtitles and the video, opening the checkpoint and
+        starting the audio service (a browser, for Abair) do not depend on
+        each other, so they run at the same time.
+
+        Args:
+            setup_audio: Start the audio service too (not needed when an
+                earlier job of a batch already did)
+        """
+        stages = StageScheduler()
+        stages.add(
+            "subtitles",
+            lambda: self.subtitle_service.load_subtitles(
+                job.eng_srt_path, job.gael_srt_path
+            ),
+        )
+        stages.add("video", lambda: self.video_service.load_video(job.video_path))
+        stages.add(
+            "video_duration", self.video_service.get_video_duration, after=["video"]
+        )
+        stages.add("checkpoint", lambda: manifest.open(resume))
+        if setup_audio:
+            stages.add("audio_setup", self.audio_service.setup)
+        return stages
 
     def _generate_dub_track(
-        self, segments: List[Segment], video_duration: float, output_dir: Path
+        self,
+        segments: List[Segment],
+        video_duration: float,
+        output_dir: Path,
+        manifest: Optional[JobManifest] = None,
     ) -> tuple[AudioSegment, List[Segment]]:
         """
         Generate complete dubbed audio track
 
+        Args:
+            manifest: Checkpoint to restore finished segments from and record
+                new ones in
+
         Returns:
             Tuple of (audio_track, processed_segments_with_timing)
         """
         self.observer.on_stage_start("Dubbing audio")
 
-        dub_track = AudioSegment.silent(duration=0)
-        processed_segments = []
-        current_time_ms = 0
-        previous_voice = None
+        plan = self._plan_segments(segments, video_duration)
+        limit = 1
+        if self.concurrency > 1:
+            limit = min(self.concurrency, self.audio_service.max_concurrency)
 
-        for i, segment in enumerate(segments):
-            # Update progress
+        lookahead = self.lookahead
+        if lookahead is None:
+            lookahead = self.LOOKAHEAD_SEGMENTS if limit > 1 else 0
+
+        checkpoint = _Checkpoint(manifest, plan, self.observer)
+        pending = checkpoint.pending(plan)
+        packing = _PackedRequests(self.request_packer, pending)
+        coalescer = _ClipCoalescer(
+            Counter(_ClipCoalescer.key(packing.unit_for(p)) for p in pending.values())
+        )
+        if self.time_fitter:
+            self.time_fitter.reset()
+        if self.placement_solver:
+            self.placement_solver.reset()
+            assembler = _SolvedTrackAssembler(
+                self.SKIP_THRESHOLD_SEC * 1000,
+                video_duration * 1000,
+                self.placement_solver,
+                self.time_fitter,
+            )
+        else:
+            assembler = _TrackAssembler(
+                self.SKIP_THRESHOLD_SEC * 1000,
+                video_duration * 1000,
+                self.overlap_policy,
+                self.time_fitter,
+            )
+        if limit > 1 or lookahead > 0:
+            # Keep every synthesis slot busy
+            lookahead = max(lookahead, limit)
+            asyncio.run(
+                self._assemble_track_async(
+                    segments,
+                    plan,
+                    assembler,
+                    output_dir,
+                    limit,
+                    lookahead,
+                    coalescer,
+                    packing,
+                    checkpoint,
+                )
+            )
+        else:
+            if self.batch_by_voice:
+                synthesize = self._synthesize_batch(
+                    pending, output_dir, coalescer, packing
+                )
+            else:
+
+                def synthesize(
+                    unit: _PlannedSegment, count_request: bool
+                ) -> Optional[AudioSegment]:
+                    return coalescer.fetch(
+                        unit,
+                        lambda: self._generate_clip_paced(
+                            unit.segment.irish_text, unit.voice, output_dir
+                        ),
+                        count_request,
+                    )
+
+            self._assemble_track(
+                segments,
+                plan,
+                assembler,
+                lambda planned: packing.fetch(planned, synthesize),
+                checkpoint,
+                packing.release,
+            )
+
+        if self.request_packer:
+            self.observer.on_stats("Request packing", packing.stats())
+        self.observer.on_stats("Deduplication", coalescer.stats())
+        self._retry_failed_segments(assembler, output_dir, checkpoint)
+        assembler.finish()
+        if self.placement_solver:
+            self.observer.on_stats("Placement", self.placement_solver.stats())
+        if self.time_fitter:
+            self.observer.on_stats("Time fit", self.time_fitter.stats())
+        checkpoint.compact(plan)
+        if manifest is not None:
+            self.observer.on_stats("Checkpoint", checkpoint.stats())
+
+        if self.rate_limiter:
+            self.rate_limiter.report()
+        self.observer.on_stage_complete("Dubbing audio")
+        return assembler.dub_track, assembler.processed_segments
+
+    def _retry_failed_segments(
+        self, assembler: _TrackAssembler, output_dir: Path, checkpoint: _Checkpoint
+    ):
+        """
+        Re-synthesize failed segments with backoff and patch them into the track
+
+        Runs after every healthy segment is placed, so retries never hold up
+        the main pass.
+        """
+        slots = assembler.failed_slots
+        if not slots:
+            return
+
+        stats = {"failed": len(slots), "recovered": 0, "truncated": 0, "abandoned": 0}
+        for slot in slots:
+            # A slot with no room left cannot take a clip
+            if slot.room_ms == 0 or not self.retry_queue.push(slot):
+                stats["abandoned"] += 1
+
+        recovered: Dict[str, AudioSegment] = {}
+        while True:
+            entry = self.retry_queue.pop(self.cancellation)
+            if entry is None:
+                break
+            slot, retry = entry
             self.observer.on_progress(
-                i + 1,
-                len(segments),
-                "Dubbing",
-                f"Segment {i + 1}/{len(segments)}",
+                stats["recovered"] + stats["abandoned"] + 1,
+                len(slots),
+                "Retrying",
+                f"Segment {slot.planned.position + 1} (retry {retry})",
+            )
+
+            # Duplicate lines share the first successful retry
+            key = _ClipCoalescer.key(slot.planned)
+            voice_audio = recovered.get(key)
+            if voice_audio is None:
+                voice_audio = self._generate_clip_paced(
+                    slot.planned.segment.irish_text, slot.planned.voice, output_dir
+                )
+            if voice_audio is not None:
+                recovered[key] = voice_audio
+                stats["recovered"] += 1
+                checkpoint.record(slot.planned, voice_audio)
+                if assembler.patch_clip(slot, voice_audio):
+                    stats["truncated"] += 1
+            elif not self.retry_queue.push(slot, retry + 1):
+                stats["abandoned"] += 1
+
+        self.observer.on_stats("Retries", stats)
+
+    def _generate_clip_paced(
+        self, text: str, voice: VoiceConfig, output_dir: Path
+    ) -> Optional[AudioSegment]:
+        """
+        Generate a clip once the rate limiter allows, feeding back the outcome
+
+        Cached clips are returned straight away: they cost no request, and
+        their near-zero latency would skew the rate limiter's baseline.
+        """
+        voice_audio = self.audio_service.cached_clip(text, voice)
+        if voice_audio is not None:
+            return voice_audio
+
+        self.circuit_breaker.acquire(self.cancellation)
+        if self.rate_limiter:
+            self.rate_limiter.acquire(self.cancellation)
+
+        started = time.monotonic()
+        try:
+            voice_audio = self.audio_service.generate_clip(text, voice, output_dir)
+        except OperationCancelled:
+            # The job was stopped, not a backend failure
+            self.circuit_breaker.record_cancelled()
+            raise
+        except Exception:
+            self._record_outcome(None, started)
+            raise
+        self._record_outcome(voice_audio, started)
+        return voice_audio
+
+    async def _agenerate_clip_paced(
+        self, text: str, voice: VoiceConfig, output_dir: Path
+    ) -> Optional[AudioSegment]:
+        """Asynchronous counterpart of _generate_clip_paced"""
+        voice_audio = await self.audio_service.acached_clip(text, voice)
+        if voice_audio is not None:
+            return voice_audio
+
+        await self.circuit_breaker.aacquire(self.cancellation)
+        started = time.monotonic()
+        try:
+            if self.rate_limiter:
+                await self.rate_limiter.aacquire(self.cancellation)
+                started = time.monotonic()
+            voice_audio = await self._run_to_completion(
+                self.audio_service.agenerate_clip(text, voice, output_dir)
             )
+        except (asyncio.CancelledError, OperationCancelled):
+            # Dropped for lag or stopped, not a backend failure
+            self.circuit_breaker.record_cancelled()
+            raise
+        except Exception:
+            self._record_outcome(None, started)
+            raise
+        self._record_outcome(voice_audio, started)
+        return voice_audio
+
+    @staticmethod
+    async def _run_to_completion(request: Awaitable[Optional[AudioSegment]]):
+        """
+        Await a synthesis that, once started, is not abandoned when cancelled
+
+        Executor threads cannot be stopped, so a cancelled caller waits for
+        the synthesis to finish (and drops its clip) before the cancellation
+        propagates. Callers holding a concurrency slot therefore release it
+        only once the service is free again.
+        """
+        task = asyncio.ensure_future(request)
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            while not task.done():
+                try:
+                    await asyncio.wait([task])
+                except asyncio.CancelledError:
+                    pass  # Cancelled again (e.g. at shutdown); keep waiting
+            if not task.cancelled():
+                task.exception()  # Dropped along with the clip
+            raise
 
+    def _record_outcome(self, voice_audio: Optional[AudioSegment], started: float):
+        """Tell the circuit breaker and rate limiter how a request went"""
+        if voice_audio is not None:
+            self.circuit_breaker.record_success()
+            if self.rate_limiter:
+                self.rate_limiter.record_success(time.monotonic() - started)
+        else:
+            self.circuit_breaker.record_failure()
+            if self.rate_limiter:
+                self.rate_limiter.record_failure()
+
+    def _plan_segments(
+        self, segments: List[Segment], video_duration: float
+    ) -> Dict[int, _PlannedSegment]:
+        """
+        Choose voice and subtitle timing for every non-empty segment
+
+        Returns:
+            Planned segments keyed by their position in `segments`
+        """
+        plan = {}
+        previous_voice = None
+
+        for i, segment in enumerate(segments):
             # Skip empty segments
             if segment.is_empty():
                 continue
 
-            # Select voice
             voice = self._select_voice(segment, previous_voice)
-
-            # Calculate smart timing
             allowed_end_sec = self._calculate_smart_timing(
                 segment, i, segments, video_duration
             )
+            plan[i] = _PlannedSegment(i, segment, voice, allowed_end_sec)
+            previous_voice = voice
+
+        # Clips may play until the next spoken segment starts
+        window_end = video_duration
+        for i in sorted(plan, reverse=True):
+            plan[i].window_end_sec = window_end
+            window_end = plan[i].segment.start
+        return plan
+
+    def _assemble_track(
+        self,
+        segments: List[Segment],
+        plan: Dict[int, _PlannedSegment],
+        assembler: _TrackAssembler,
+        fetch_clip: Callable[[_PlannedSegment], Optional[AudioSegment]],
+        checkpoint: _Checkpoint,
+        skip_clip: Optional[Callable[[_PlannedSegment], object]] = None,
+    ):
+        """
+        Place clips on the track in subtitle order
+
+        `fetch_clip` is only called for segments that are not skipped for
+        lag or restored from the checkpoint, so lazy sources never
+        synthesize audio that would be dropped; `skip_clip` is called for
+        the skipped ones instead. The track, subtitles and failed slots are
+        collected in `assembler`.
+        """
+
+        for i, segment in enumerate(segments):
+            self._check_cancelled()
+
+            # Update progress
+            self.observer.on_progress(
+                i + 1,
+                len(segments),
+                "Dubbing",
+                f"Segment {i + 1}/{len(segments)}",
+            )
+
+            planned = plan.get(i)
+            if planned is None:
+                continue
 
             # Add sync silence
-            gap_ms = segment.start_ms - current_time_ms
-            if gap_ms > 0:
-                dub_track += AudioSegment.silent(duration=gap_ms)
-                current_time_ms += gap_ms
-            elif gap_ms < -(self.SKIP_THRESHOLD_SEC * 1000):
+            if not assembler.sync_to(segment):
+                if skip_clip:
+                    skip_clip(planned)
                 self.observer.on_progress(
                     i + 1, len(segments), "Dubbing", f"Skipping segment {i + 1} (lag)"
                 )
                 continue
 
-            # Generate audio
-            audio_path = self.audio_service.generate_audio(
-                segment.irish_text, voice, output_dir
+            voice_audio = checkpoint.restore(planned)
+            if voice_audio is None:
+                voice_audio = fetch_clip(planned)
+                if voice_audio is not None:
+                    checkpoint.record(planned, voice_audio)
+            if voice_audio is not None:
+                assembler.add_clip(
+                    segment,
+                    planned.allowed_end_sec,
+                    voice_audio,
+                    planned.window_end_sec,
+                )
+            else:
+                # Fallback to silence, retried once the pass is done
+                assembler.add_fallback(planned)
+
+    def _synthesize_batch(
+        self,
+        plan: Dict[int, _PlannedSegment],
+        output_dir: Path,
+        coalescer: _ClipCoalescer,
+        packing: _PackedRequests,
+    ) -> Callable[[_PlannedSegment, bool], Optional[AudioSegment]]:
+        """
+        Synthesize every distinct request in one generate_batch call
+
+        Each request still goes through _generate_clip_paced (circuit
+        breaker, rate limiter and cancellation) and is reported as progress.
+
+        Returns:
+            Request lookup for _PackedRequests.fetch; requests outside the
+            batch (fallbacks after a failed split) are synthesized one by one
+        """
+        unique: Dict[str, _PlannedSegment] = {}
+        for i in sorted(plan):
+            unit = packing.unit_for(plan[i])
+            unique.setdefault(coalescer.key(unit), unit)
+
+        done = 0
+
+        def generate(text: str, voice: VoiceConfig, output_dir: Path):
+            nonlocal done
+            self._check_cancelled()
+            done += 1
+            self.observer.on_progress(
+                done, len(unique), "Synthesizing", f"Request {done}/{len(unique)}"
+            )
+            return self._generate_clip_paced(text, voice, output_dir)
+
+        clips = self.audio_service.generate_batch(
+            [(p.segment.irish_text, p.voice) for p in unique.values()],
+            output_dir,
+            as_clips=True,
+            generate=generate,
+        )
+        coalescer.requests += len(plan)
+        coalescer.syntheses += len(unique)
+        clips_by_key = dict(zip(unique, clips))
+
+        def synthesize(unit: _PlannedSegment, count_request: bool):
+            key = coalescer.key(unit)
+            if key in clips_by_key:
+                return clips_by_key[key]
+            return coalescer.fetch(
+                unit,
+                lambda: self._generate_clip_paced(
+                    unit.segment.irish_text, unit.voice, output_dir
+                ),
+                count_request=False,
+            )
+
+        return synthesize
+
+    async def _assemble_track_async(
+        self,
+        segments: List[Segment],
+        plan: Dict[int, _PlannedSegment],
+        assembler: _TrackAssembler,
+        output_dir: Path,
+        concurrency: int,
+        lookahead: int,
+        coalescer: _ClipCoalescer,
+        packing: _PackedRequests,
+        checkpoint: _Checkpoint,
+    ):
+        """
+        Place clips on the track with up to `concurrency` syntheses in flight
+
+        While a segment is placed, the next `lookahead` segments are being
+        synthesized and decoded in executor threads. Segments further ahead
+        are not submitted until the window moves, so at most `lookahead + 1`
+        clips are held at once however long the job is.
+
+        Clips are accepted in whatever order they finish: each one is
+        checkpointed straight away and parked until every earlier segment
+        has been placed. Where a clip goes only depends on the segment
+        timings and the lengths of the clips placed before it, so placing
+        the parked clips in subtitle order gives the same track as the
+        sequential path however the syntheses interleave. Segments that
+        turn out to be skipped for lag are synthesized speculatively and
+        dropped; one already being synthesized keeps its slot until the
+        service returns, so no more than `concurrency` syntheses ever run.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def synthesize(text: str, voice: VoiceConfig) -> Optional[AudioSegment]:
+            async with semaphore:
+                return await self._agenerate_clip_paced(text, voice, output_dir)
+
+        def coalesced(unit: _PlannedSegment, count_request: bool):
+            return coalescer.afetch(
+                unit,
+                lambda: synthesize(unit.segment.irish_text, unit.voice),
+                count_request,
             )
 
-            if audio_path:
-                # Add audio to track
-                voice_audio = AudioSegment.from_file(str(audio_path))
-                dub_track += voice_audio
-                current_time_ms += len(voice_audio)
-
-                # Record processed segment
-                processed_segment = Segment(
-                    start=segment.start,
-                    end=allowed_end_sec,
-                    english_text=segment.get_clean_english_text(),
-                    irish_text=segment.irish_text,
-                    index=len(processed_segments) + 1,
+        order = sorted(checkpoint.pending(plan))
+        tasks: Dict[int, asyncio.Future] = {}  # Submitted and still running
+        finished: Dict[int, asyncio.Future] = {}  # Done, waiting to be placed
+        submitted = 0
+        stats = {
+            "lookahead": lookahead,
+            "stalls": 0,
+            "max_buffered": 0,
+            "out_of_order": 0,
+        }
+
+        def submit(i: int):
+            # Duplicates and packed lines share requests
+            tasks[i] = asyncio.ensure_future(packing.afetch(plan[i], coalesced))
+
+        def submit_through(last: int):
+            nonlocal submitted
+            for i in order[submitted : last + 1]:
+                submit(i)
+            submitted = max(submitted, min(last + 1, len(order)))
+
+        async def collect(i: int) -> Optional[AudioSegment]:
+            """Accept finished clips in any order until segment i's is in"""
+            stats["stalls"] += i in tasks and not tasks[i].done()
+            buffered = len(finished) + sum(t.done() for t in tasks.values())
+            stats["max_buffered"] = max(stats["max_buffered"], buffered)
+            while i not in finished:
+                done, _ = await asyncio.wait(
+                    tasks.values(),
+                    # Look at the token while syntheses are in flight
+                    timeout=self.cancellation and CancellationToken.POLL_INTERVAL_SEC,
+                    return_when=asyncio.FIRST_COMPLETED,
                 )
-                processed_segments.append(processed_segment)
+                self._check_cancelled()
+                for j in sorted(k for k, task in tasks.items() if task in done):
+                    finished[j] = task = tasks.pop(j)
+                    stats["out_of_order"] += j > i
+                    # Errors surface when (and if) the segment is placed
+                    if task.cancelled() or task.exception() is not None:
+                        continue
+                    if task.result() is not None:
+                        checkpoint.record(plan[j], task.result())
+            return finished.pop(i).result()
 
-                previous_voice = voice
+        try:
+            for i, segment in enumerate(segments):
+                self._check_cancelled()
+                self.observer.on_progress(
+                    i + 1,
+                    len(segments),
+                    "Dubbing",
+                    f"Segment {i + 1}/{len(segments)}",
+                )
 
-                # Delay between segments
-                time.sleep(self.SEGMENT_DELAY_SEC)
-            else:
-                # Fallback to silence
-                fallback_duration = segment.duration_ms
-                if gap_ms > 0:
-                    dub_track += AudioSegment.silent(duration=fallback_duration)
-                    current_time_ms += fallback_duration
+                if i not in plan:
+                    continue
 
-        self.observer.on_stage_complete("Dubbing audio")
-        return dub_track, processed_segments
+                submit_through(bisect.bisect_left(order, i) + lookahead)
+                if not assembler.sync_to(segment):
+                    if i in tasks:
+                        tasks.pop(i).cancel()
+                    finished.pop(i, None)
+                    packing.release(plan[i])
+                    self.observer.on_progress(
+                        i + 1,
+                        len(segments),
+                        "Dubbing",
+                        f"Skipping segment {i + 1} (lag)",
+                    )
+                    continue
+
+                voice_audio = checkpoint.restore(plan[i])
+                if voice_audio is None:
+                    if i not in tasks and i not in finished:
+                        # Checkpointed clip unreadable; synthesize it after all
+                        submit(i)
+                    voice_audio = await collect(i)
+                if voice_audio is not None:
+                    assembler.add_clip(
+                        segment,
+                        plan[i].allowed_end_sec,
+                        voice_audio,
+                        plan[i].window_end_sec,
+                    )
+                else:
+                    assembler.add_fallback(plan[i])
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+        self.observer.on_stats("Prefetch", stats)
 
     def _select_voice(
         self, segment: Segment, previous_voice: Optional[VoiceConfig]
@@ -0,0 +1,225 @@
+"""
+Audio generation service calling the Abair synthesis API directly over HTTP
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import base64
+import io
+import uuid
+
+import requests
+from requests.adapters import HTTPAdapter
+from pydub import AudioSegment
+
+from models.voice_config import VoiceConfig
+from services.audio_cache import AudioClipCache
+from services.audio_service import AudioService
+from services.progress_observer import ProgressObserver, NoOpProgressObserver
+
+
+class HttpAudioService(AudioService):
+    """
+    Audio generation service using the endpoint behind the Abair.ie page
+
+    No browser is involved: each synthesis is a single POST over a pooled
+    keep-alive requests.Session, so it is safe to call from several threads.
+    """
+
+    DEFAULT_ENDPOINT = "https://api.abair.ie/v3/synthesis"
+
+    # API voice names for the (dialect, gender) pairs offered on the page
+    VOICE_NAMES: Dict[Tuple[str, str], str] = {
+        ("Kerry", "Female"): "ga_MU_nnc_nemo",
+        ("Kerry", "Male"): "ga_MU_dms_nemo",
+        ("Connemara", "Female"): "ga_CO_snc_nemo",
+        ("Connemara", "Male"): "ga_CO_pmc_nemo",
+        ("Galway", "Female"): "ga_CO_snc_nemo",
+        ("Galway", "Male"): "ga_CO_pmc_nemo",
+    }
+
+    def __init__(
+        self,
+        observer: Optional[ProgressObserver] = None,
+        endpoint: str = DEFAULT_ENDPOINT,
+        timeout: float = 30,
+        pool_size: int = 4,
+        cache: Optional[AudioClipCache] = None,
+        audio_format: str = "mp3",
+    ):
+        """
+        Initialize HTTP audio service
+
+        Args:
+            observer: Progress observer for status updates
+            endpoint: URL of the synthesis endpoint
+            timeout: Per-request timeout in seconds
+            pool_size: Number of keep-alive connections (and concurrent calls)
+            cache: Optional clip cache consulted before calling the endpoint;
+                clips from any endpoint but the default are kept apart
+            audio_format: Audio encoding to request ("mp3" or "wav")
+        """
+        self.observer = observer or NoOpProgressObserver()
+        self.endpoint = endpoint
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.cache = cache
+        self.audio_format = audio_format
+        if endpoint != self.DEFAULT_ENDPOINT:
+            self.cache_source = endpoint
+        self.session: Optional[requests.Session] = None
+        self._written_files: List[Path] = []
+
+    @property
+    def max_concurrency(self) -> int:
+        """Number of requests that can be in flight at once"""
+        return self.pool_size
+
+    def setup(self):
+        """Open the pooled HTTP session"""
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size, pool_maxsize=self.pool_size
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def cleanup(self):
+        """Close the HTTP session and remove the clips it wrote"""
+        if self.cache:
+            self.cache.flush()
+            self.observer.on_stats("TTS cache", self.cache.stats())
+
+        if self.session:
+            self.session.close()
+            self.session = None
+
+        for path in self._written_files:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        self._written_files = []
+
+    def generate_audio(
+        self, text: str, voice: VoiceConfig, output_dir: Path
+    ) -> Optional[Path]:
+        """
+        Generate audio with one request to the synthesis endpoint
+
+        Args:
+            text: Irish text to synthesize
+            voice: Voice configuration (dialect, gender)
+            output_dir: Directory for audio output
+
+        Returns:
+            Path to generated audio file or None if failed
+        """
+        if not self.session:
+            raise RuntimeError("AudioService not initialized. Call setup() first.")
+
+        cache_key = None
+        if self.cache:
+            cache_key = self._cache_key(text, voice)
+            cached_path = self.cache.get(cache_key)
+            if cached_path:
+                return cached_path
+
+        audio_bytes = self._request_audio(text, voice)
+        if audio_bytes is None:
+            return None
+
+        audio_format = self._format_of(audio_bytes)
+        audio_path = Path(output_dir) / f"synthesis_{uuid.uuid4().hex}.{audio_format}"
+        audio_path.write_bytes(audio_bytes)
+        self._written_files.append(audio_path)
+
+        if cache_key:
+            try:
+                self.cache.put(cache_key, audio_path)
+            except OSError as e:
+                self.observer.on_error(f"Failed to cache audio clip: {e}")
+
+        return audio_path
+
+    def generate_clip(
+        self, text: str, voice: VoiceConfig, output_dir: Path
+    ) -> Optional[AudioSegment]:
+        """
+        Generate audio and decode the response body without touching disk
+
+        Returns:
+            Decoded audio, or None if failed
+        """
+        if not self.session:
+            raise RuntimeError("AudioService not initialized. Call setup() first.")
+
+        cache_key = None
+        if self.cache:
+            cache_key = self._cache_key(text, voice)
+            cached_path = self.cache.get(cache_key)
+            if cached_path:
+                return AudioSegment.from_file(str(cached_path))
+
+        audio_bytes = self._request_audio(text, voice)
+        if audio_bytes is None:
+            return None
+
+        audio_format = self._format_of(audio_bytes)
+        if cache_key:
+            try:
+                self.cache.put_bytes(cache_key, audio_bytes, f".{audio_format}")
+            except OSError as e:
+                self.observer.on_error(f"Failed to cache audio clip: {e}")
+
+        return AudioSegment.from_file(io.BytesIO(audio_bytes), format=audio_format)
+
+    def _request_audio(self, text: str, voice: VoiceConfig) -> Optional[bytes]:
+        """POST one synthesis request and return the decoded audio bytes"""
+        if self.cancellation:
+            self.cancellation.check()
+        try:
+            response = self.session.post(
+                self.endpoint,
+                json=self._build_payload(text, voice),
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            payload = response.json()
+            content = payload.get("audioContent") if isinstance(payload, dict) else None
+            if not isinstance(content, str):
+                raise ValueError("response carries no audioContent")
+            return base64.b64decode(content)
+        except (requests.RequestException, ValueError) as e:
+            self.observer.on_error(f"Audio generation failed: {e}")
+            return None
+
+    def _format_of(self, audio_bytes: bytes) -> str:
+        """
+        Get the format of returned audio from its header
+
+        Servers that ignore the requested encoding (like the local
+        stand-in, which always sends WAV) still get decoded and saved
+        correctly.
+        """
+        if audio_bytes[:4] == b"RIFF" and audio_bytes[8:12] == b"WAVE":
+            return "wav"
+        if audio_bytes[:3] == b"ID3" or audio_bytes[:2] in (b"\xff\xfb", b"\xff\xf3"):
+            return "mp3"
+        return self.audio_format
+
+    def _build_payload(self, text: str, voice: VoiceConfig) -> dict:
+        """Build the JSON request body for a synthesis"""
+        encoding = "MP3" if self.audio_format == "mp3" else "LINEAR16"
+        return {
+            "synthinput": {"text": text, "normalise": True},
+            "voiceparams": {
+                "languageCode": "ga-IE",
+                "name": self.VOICE_NAMES[(voice.dialect, voice.gender)],
+            },
+            "audioconfig": {
+                "audioEncoding": encoding,
+                # The API applies the tempo change, so no re-encode is needed
+                "speakingRate": voice.speed_multiplier(),
+            },
+        }
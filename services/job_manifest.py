@@ -0,0 +1,287 @@
+"""
+Per-job checkpoint manifest for resuming interrupted dubbing jobs
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import json
+import logging
+import os
+import shutil
+import uuid
+
+from pydub import AudioSegment
+
+from models import Segment, VoiceConfig
+from services.audio_cache import AudioClipCache
+
+logger = logging.getLogger(__name__)
+
+# Segments are matched by timing and normalized Irish text
+SegmentKey = Tuple[int, int, str]
+
+
+@dataclass
+class ManifestEntry:
+    """A segment whose clip has been synthesized"""
+
+    start: float
+    end: float
+    irish_text: str
+    voice: VoiceConfig
+    clip: str  # File name inside the manifest's clip folder
+    length_ms: int
+
+    @property
+    def key(self) -> SegmentKey:
+        return segment_key(Segment(self.start, self.end, "", self.irish_text))
+
+
+@dataclass
+class ManifestDiff:
+    """How a job's segments compare with the previous run's manifest"""
+
+    matches: Dict[int, ManifestEntry] = field(default_factory=dict)
+    unchanged: int = 0  # Same timing and text
+    retimed: int = 0  # Same text at a new time; the clip is reused
+    changed: int = 0  # New text at a known time
+    added: int = 0  # Timing the previous run never had
+    removed: int = 0  # Previous entries no segment uses any more
+
+    def stats(self) -> Dict[str, int]:
+        """Get the counts for the job summary"""
+        return {
+            "unchanged": self.unchanged,
+            "retimed": self.retimed,
+            "changed": self.changed,
+            "added": self.added,
+            "removed": self.removed,
+        }
+
+
+def segment_key(segment: Segment) -> SegmentKey:
+    """Get the key a segment's manifest entry is stored under"""
+    return (
+        segment.start_ms,
+        segment.end_ms,
+        AudioClipCache.normalize_text(segment.irish_text),
+    )
+
+
+class JobManifest:
+    """
+    Append-only record of the clips a dubbing job has finished
+
+    Each clip is written to its own WAV file (via a temporary name and an
+    atomic rename) before one JSON line describing it is appended to
+    manifest.jsonl and flushed to disk, so recording a segment costs the
+    same however far the job has got. A line cut short by a crash is
+    ignored on load, along with its clip. Once a job's track is assembled
+    the manifest is compacted to that job's segments.
+    """
+
+    FILENAME = "manifest.jsonl"
+    CLIP_DIR = "clips"
+    VERSION = 1
+
+    def __init__(self, directory: Path):
+        """
+        Initialize job manifest
+
+        Args:
+            directory: Folder holding the manifest and its clips
+        """
+        self.directory = Path(directory)
+        self.path = self.directory / self.FILENAME
+        self.clip_dir = self.directory / self.CLIP_DIR
+        self.entries: Dict[SegmentKey, ManifestEntry] = {}
+        self.recorded = 0
+        self._file = None
+
+    def open(self, resume: bool = False) -> int:
+        """
+        Start recording, keeping the previous run's entries when resuming
+
+        Returns:
+            Number of entries loaded from the previous run
+        """
+        self.entries = {}
+        if resume:
+            self._load()
+        else:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+        self.clip_dir.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+        if self._file.tell() == 0:
+            self._append({"version": self.VERSION})
+        elif not self.path.read_bytes().endswith(b"\n"):
+            self._file.write("\n")  # Terminate a torn last line
+        return len(self.entries)
+
+    def close(self):
+        """Stop recording"""
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def lookup(self, segment: Segment) -> Optional[ManifestEntry]:
+        """Get the recorded entry for a segment, if any"""
+        return self.entries.get(segment_key(segment))
+
+    def diff(self, planned: Sequence[Tuple[Segment, VoiceConfig]]) -> ManifestDiff:
+        """
+        Match a job's segments against the recorded entries
+
+        A clip only depends on its text and voice, so a segment that moved
+        reuses any entry with the same text and voice gender (the nearest in
+        time), even one recorded for another segment. Only segments without
+        a match need synthesizing.
+
+        Args:
+            planned: (segment, planned voice) pairs in job order
+
+        Returns:
+            The matches, by index into `planned`, and what changed
+        """
+        diff = ManifestDiff()
+        by_text: Dict[Tuple[str, str], List[ManifestEntry]] = defaultdict(list)
+        timings = set()
+        for key, entry in self.entries.items():
+            by_text[(key[2], entry.voice.gender)].append(entry)
+            timings.add(key[:2])
+
+        used = set()
+        for i, (segment, voice) in enumerate(planned):
+            key = segment_key(segment)
+            entry = self.entries.get(key)
+            if entry is not None and entry.voice.gender == voice.gender:
+                diff.unchanged += 1
+            else:
+                candidates = by_text.get((key[2], voice.gender))
+                if candidates:
+                    entry = min(candidates, key=lambda e: abs(e.start - segment.start))
+                    diff.retimed += 1
+                else:
+                    entry = None
+                    if key[:2] in timings:
+                        diff.changed += 1
+                    else:
+                        diff.added += 1
+            if entry is not None:
+                diff.matches[i] = entry
+                used.add(entry.clip)
+
+        diff.removed = sum(e.clip not in used for e in self.entries.values())
+        return diff
+
+    def reuse(self, segment: Segment, entry: ManifestEntry):
+        """Record that a segment reuses another entry's clip"""
+        alias = replace(entry, start=segment.start, end=segment.end)
+        if alias.key not in self.entries:
+            self._append(self._to_record(alias))
+            self.entries[alias.key] = alias
+
+    def compact(self, keep: Iterable[Segment]):
+        """
+        Keep only the entries of the given segments, deleting unused clips
+
+        The manifest is rewritten under a temporary name and renamed into
+        place, so a crash leaves either the old or the new manifest.
+        """
+        keys = {segment_key(segment) for segment in keep}
+        self.entries = {k: e for k, e in self.entries.items() if k in keys}
+
+        partial = self.path.with_name(f"{self.FILENAME}.part")
+        with open(partial, "w", encoding="utf-8") as f:
+            for record in [{"version": self.VERSION}] + [
+                self._to_record(e) for e in self.entries.values()
+            ]:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+        reopen = self._file is not None
+        self.close()
+        os.replace(partial, self.path)
+        if reopen:
+            self._file = open(self.path, "a", encoding="utf-8")
+
+        clips = {e.clip for e in self.entries.values()}
+        for path in self.clip_dir.iterdir():
+            if path.name not in clips:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def load_clip(self, entry: ManifestEntry) -> Optional[AudioSegment]:
+        """Read a recorded clip back, or None if its file is unreadable"""
+        try:
+            return AudioSegment.from_file(str(self.clip_dir / entry.clip))
+        except Exception as e:
+            logger.warning("Checkpoint clip %s unreadable: %s", entry.clip, e)
+            return None
+
+    def record(self, segment: Segment, voice: VoiceConfig, audio: AudioSegment):
+        """Durably record a finished segment's clip, timing and voice"""
+        entry = ManifestEntry(
+            segment.start,
+            segment.end,
+            segment.irish_text,
+            voice,
+            f"{uuid.uuid4().hex}.wav",
+            len(audio),
+        )
+        partial = self.clip_dir / f"{entry.clip}.part"
+        audio.export(str(partial), format="wav")
+        os.replace(partial, self.clip_dir / entry.clip)
+
+        self._append(self._to_record(entry))
+        self.entries[entry.key] = entry
+        self.recorded += 1
+
+    @staticmethod
+    def _to_record(entry: ManifestEntry) -> dict:
+        """Get the manifest line for an entry"""
+        return {
+            "start": entry.start,
+            "end": entry.end,
+            "irish_text": entry.irish_text,
+            "voice": [entry.voice.dialect, entry.voice.gender],
+            "clip": entry.clip,
+            "length_ms": entry.length_ms,
+        }
+
+    def _append(self, record: dict):
+        """Append one line and make sure it reached the disk"""
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _load(self):
+        """Read the entries of a previous run"""
+        try:
+            lines = self.path.read_text(encoding="utf-8", errors="replace").splitlines()
+        except OSError:
+            return
+
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # Torn write from an interrupted run
+            if "clip" not in record:
+                continue  # Header
+            entry = ManifestEntry(
+                record["start"],
+                record["end"],
+                record["irish_text"],
+                VoiceConfig(*record["voice"]),
+                record["clip"],
+                record["length_ms"],
+            )
+            if (self.clip_dir / entry.clip).exists():
+                self.entries[entry.key] = entry
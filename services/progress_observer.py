@@ -3,7 +3,7 @@ Progress observer for tracking dubbing progress
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Dict, Optional
 
 
 class ProgressObserver(ABC):
@@ -44,6 +44,18 @@ class ProgressObserver(ABC):
         """Called when entire process completes successfully"""
         pass
 
+    def on_stats(self, stage: str, stats: Dict[str, Any]):
+        """
+        Called when a service reports summary statistics
+
+        Not abstract so existing observers keep working without changes.
+
+        Args:
+            stage: Name of the component reporting (e.g., "TTS cache")
+            stats: Mapping of statistic name to value
+        """
+        pass
+
 
 class ConsoleProgressObserver(ProgressObserver):
     """Console-based progress observer using print statements"""
@@ -76,6 +88,11 @@ class ConsoleProgressObserver(ProgressObserver):
         """Print completion message"""
         print(f"\n✓ DONE! Output: {output_path}")
 
+    def on_stats(self, stage: str, stats: Dict[str, Any]):
+        """Print statistics as a single key=value line"""
+        details = ", ".join(f"{key}={value}" for key, value in stats.items())
+        print(f"  {stage}: {details}")
+
 
 class NoOpProgressObserver(ProgressObserver):
     """No-operation progress observer that does nothing"""
@@ -0,0 +1,140 @@
+"""
+Adaptive request rate control shared by audio backends
+"""
+
+from typing import Optional
+import threading
+import time
+
+from services import cancellation as cancel
+from services.cancellation import CancellationToken
+from services.progress_observer import ProgressObserver, NoOpProgressObserver
+
+
+class AdaptiveRateLimiter:
+    """
+    Token-bucket pacing with AIMD (additive increase, multiplicative
+    decrease) adjustment of the rate
+
+    Every healthy response nudges the rate up by `increase_step`; a failure
+    or a response much slower than the running baseline cuts it by
+    `decrease_factor`. Thread-safe, with blocking and asyncio entry points.
+    """
+
+    def __init__(
+        self,
+        initial_rate: float,
+        min_rate: float = 0.05,
+        max_rate: float = 5.0,
+        increase_step: float = 0.05,
+        decrease_factor: float = 0.5,
+        slow_factor: float = 2.0,
+        burst: int = 1,
+        observer: Optional[ProgressObserver] = None,
+        report_every: int = 25,
+    ):
+        """
+        Initialize rate limiter
+
+        Args:
+            initial_rate: Starting rate in requests per second
+            min_rate: Lowest rate the limiter backs off to
+            max_rate: Highest rate the limiter speeds up to
+            increase_step: Requests/sec added after each healthy response
+            decrease_factor: Multiplier applied after a failure or slow response
+            slow_factor: Latency above this multiple of the baseline is "slow"
+            burst: Number of requests allowed back to back after idling
+            observer: Progress observer the current rate is reported to
+            report_every: Report the rate after this many healthy responses
+        """
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.slow_factor = slow_factor
+        self.burst = max(1, burst)
+        self.observer = observer or NoOpProgressObserver()
+        self.report_every = report_every
+
+        self.rate = min(max(initial_rate, min_rate), max_rate)
+        self.baseline_latency: Optional[float] = None
+        self.successes = 0
+        self.failures = 0
+        self.slowdowns = 0
+
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+
+    def reserve(self) -> float:
+        """
+        Claim the next request slot
+
+        Returns:
+            Seconds the caller must wait before sending its request
+        """
+        with self._lock:
+            now = time.monotonic()
+            interval = 1.0 / self.rate
+            # Idle time earns up to `burst` immediate requests
+            earliest = now - (self.burst - 1) * interval
+            slot = max(self._next_slot, earliest)
+            self._next_slot = slot + interval
+            return max(0.0, slot - now)
+
+    def acquire(self, cancellation: Optional[CancellationToken] = None):
+        """Block until a request may be sent"""
+        delay = self.reserve()
+        if delay > 0:
+            cancel.sleep(delay, cancellation)
+
+    async def aacquire(self, cancellation: Optional[CancellationToken] = None):
+        """Wait without blocking the event loop until a request may be sent"""
+        delay = self.reserve()
+        if delay > 0:
+            await cancel.asleep(delay, cancellation)
+
+    def record_success(self, latency_sec: float):
+        """Speed up after a healthy response, or back off if it was slow"""
+        with self._lock:
+            baseline = self.baseline_latency
+            if baseline is not None and latency_sec > self.slow_factor * baseline:
+                self.slowdowns += 1
+                self._decrease()
+                report = True
+            else:
+                self.successes += 1
+                self.rate = min(self.max_rate, self.rate + self.increase_step)
+                report = self.successes % self.report_every == 0
+
+            # Exponentially weighted baseline so gradual drift is tolerated
+            self.baseline_latency = (
+                latency_sec if baseline is None else 0.8 * baseline + 0.2 * latency_sec
+            )
+
+        if report:
+            self.report()
+
+    def record_failure(self):
+        """Back off after a failed request"""
+        with self._lock:
+            self.failures += 1
+            self._decrease()
+        self.report()
+
+    def stats(self) -> dict:
+        """Get the current rate and outcome counters"""
+        return {
+            "rate_per_sec": round(self.rate, 3),
+            "successes": self.successes,
+            "failures": self.failures,
+            "slowdowns": self.slowdowns,
+        }
+
+    def report(self):
+        """Send the current rate to the observer"""
+        self.observer.on_stats("Rate limiter", self.stats())
+
+    def _decrease(self):
+        """Apply the multiplicative decrease and space out the next request"""
+        self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+        self._next_slot = max(self._next_slot, time.monotonic() + 1.0 / self.rate)
@@ -0,0 +1,97 @@
+"""
+Pack short consecutive lines into one synthesis request
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+from pydub import AudioSegment
+
+from models.voice_config import VoiceConfig
+from services.audio_dsp import split_on_silences
+
+
+class RequestPacker:
+    """
+    Join short same-voice lines into one request and split the audio back
+
+    Most subtitle cues are a few words, so one round trip per cue is mostly
+    overhead. Consecutive short lines in the same voice are joined with
+    sentence-ending punctuation, which makes the synthesizer pause between
+    them, and the returned clip is cut at those pauses.
+    """
+
+    SENTENCE_ENDINGS = (".", "!", "?", "…")
+
+    def __init__(
+        self,
+        max_chars: int = 120,
+        max_line_chars: int = 40,
+        min_silence_ms: int = 150,
+        threshold_db: float = -35.0,
+    ):
+        """
+        Initialize request packer
+
+        Args:
+            max_chars: Character budget for one packed request
+            max_line_chars: Only lines up to this length are packed
+            min_silence_ms: Shortest pause accepted as a line boundary
+            threshold_db: Level below the loudest part that counts as a pause
+        """
+        self.max_chars = max_chars
+        self.max_line_chars = max_line_chars
+        self.min_silence_ms = min_silence_ms
+        self.threshold_db = threshold_db
+
+    def pack(self, requests: Sequence[Tuple[str, VoiceConfig]]) -> List[List[int]]:
+        """
+        Group consecutive short requests that share a voice
+
+        Args:
+            requests: (text, voice) pairs in timeline order
+
+        Returns:
+            Groups of request indices, in order, covering every request
+        """
+        groups: List[List[int]] = []
+        group_chars: Optional[int] = None  # None while the group cannot grow
+        previous_voice = None
+
+        for i, (text, voice) in enumerate(requests):
+            length = len(self._with_pause(text))
+            if length > self.max_line_chars:
+                groups.append([i])
+                group_chars = None
+            elif (
+                group_chars is not None
+                and voice == previous_voice
+                and group_chars + 1 + length <= self.max_chars
+            ):
+                groups[-1].append(i)
+                group_chars += 1 + length
+            else:
+                groups.append([i])
+                group_chars = length
+            previous_voice = voice
+
+        return groups
+
+    def join(self, texts: Sequence[str]) -> str:
+        """Join lines into one request, each ending in a pause"""
+        return " ".join(self._with_pause(text) for text in texts)
+
+    def split(self, audio: AudioSegment, count: int) -> Optional[List[AudioSegment]]:
+        """
+        Cut a packed clip back into one clip per line
+
+        Returns:
+            The clips, or None if the pauses could not be found
+        """
+        return split_on_silences(audio, count, self.min_silence_ms, self.threshold_db)
+
+    def _with_pause(self, text: str) -> str:
+        """Normalize whitespace and make sure the line ends in a pause"""
+        text = " ".join(text.split())
+        if not text.endswith(self.SENTENCE_ENDINGS):
+            text += "."
+        return text
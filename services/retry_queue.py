@@ -0,0 +1,85 @@
+"""
+Deferred retry queue with exponential backoff
+"""
+
+from typing import Any, List, Optional, Tuple
+import heapq
+import itertools
+import time
+
+from services import cancellation as cancel
+from services.cancellation import CancellationToken
+
+
+class RetryQueue:
+    """
+    Items waiting to be retried, each due after an exponential backoff
+
+    The n-th retry of an item becomes due `base_delay_sec * 2 ** (n - 1)`
+    seconds (capped at `max_delay_sec`) after it was pushed. Items are
+    popped in due order.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 2,
+        base_delay_sec: float = 2.0,
+        max_delay_sec: float = 60.0,
+    ):
+        """
+        Initialize retry queue
+
+        Args:
+            max_retries: Retries allowed per item (0 disables retrying)
+            base_delay_sec: Delay before the first retry
+            max_delay_sec: Upper bound for the backoff delay
+        """
+        self.max_retries = max_retries
+        self.base_delay_sec = base_delay_sec
+        self.max_delay_sec = max_delay_sec
+        self._heap: List[Tuple[float, int, int, Any]] = []
+        self._counter = itertools.count()  # Keeps pops stable for equal due times
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def backoff(self, retry: int) -> float:
+        """Get the delay before the given (1-based) retry"""
+        return min(self.max_delay_sec, self.base_delay_sec * 2 ** (retry - 1))
+
+    def push(self, item: Any, retry: int = 1) -> bool:
+        """
+        Schedule an item's next retry
+
+        Args:
+            item: Work to retry
+            retry: Which retry this will be (1 for the first)
+
+        Returns:
+            False if the item has used up its retries
+        """
+        if retry > self.max_retries:
+            return False
+        due = time.monotonic() + self.backoff(retry)
+        heapq.heappush(self._heap, (due, next(self._counter), retry, item))
+        return True
+
+    def pop(
+        self, cancellation: Optional[CancellationToken] = None
+    ) -> Optional[Tuple[Any, int]]:
+        """
+        Wait until the earliest item is due and remove it
+
+        Args:
+            cancellation: Token that interrupts the wait
+
+        Returns:
+            Tuple of (item, retry number), or None if the queue is empty
+        """
+        if not self._heap:
+            return None
+        due, _, retry, item = heapq.heappop(self._heap)
+        delay = due - time.monotonic()
+        if delay > 0:
+            cancel.sleep(delay, cancellation)
+        return item, retry
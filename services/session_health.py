@@ -0,0 +1,284 @@
+"""
+Health tracking for long-lived browser sessions
+"""
+
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+import ctypes
+import os
+import sys
+
+# Windows API constants for process enumeration and memory queries
+_TH32CS_SNAPPROCESS = 0x00000002
+_PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+
+
+def process_tree_rss_bytes(root_pid: int) -> Optional[int]:
+    """
+    Get the resident memory of a process and all of its descendants
+
+    Chrome spreads a session over a browser, GPU and renderer processes, so
+    the whole tree under the chromedriver process is counted. Uses /proc on
+    Linux and the Tool Help and PSAPI functions (working set) on Windows.
+
+    Returns:
+        Total RSS in bytes, or None if the process is gone or memory cannot
+        be measured on this platform
+    """
+    if sys.platform == "win32":
+        parents, rss_bytes = _windows_parent_pids(), _windows_rss_bytes
+    elif Path("/proc/self").is_dir():
+        parents, rss_bytes = _proc_parent_pids(), _proc_rss_bytes
+    else:
+        return None
+    if root_pid not in parents:
+        return None
+
+    children: Dict[int, List[int]] = defaultdict(list)
+    for pid, parent in parents.items():
+        children[parent].append(pid)
+
+    # Windows reuses the IDs of exited parents, so the links may loop
+    total = 0
+    seen = set()
+    pending = [root_pid]
+    while pending:
+        pid = pending.pop()
+        if pid in seen:
+            continue
+        seen.add(pid)
+        total += rss_bytes(pid) or 0
+        pending.extend(children.get(pid, ()))
+    return total
+
+
+def _proc_parent_pids() -> Dict[int, int]:
+    """Map every running process to its parent, from /proc"""
+    parents = {}
+    for entry in Path("/proc").iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+        except OSError:
+            continue  # Exited while scanning
+        # The command name may contain spaces, so split after its ")"
+        parents[int(entry.name)] = int(stat[stat.rindex(")") + 2 :].split()[1])
+    return parents
+
+
+def _proc_rss_bytes(pid: int) -> Optional[int]:
+    """Resident memory of one process, from /proc"""
+    try:
+        pages = int((Path("/proc") / str(pid) / "statm").read_text().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def _windows_parent_pids() -> Dict[int, int]:
+    """Map every running process to its parent, from a Tool Help snapshot"""
+    from ctypes import wintypes
+
+    class PROCESSENTRY32W(ctypes.Structure):
+        _fields_ = [
+            ("dwSize", wintypes.DWORD),
+            ("cntUsage", wintypes.DWORD),
+            ("th32ProcessID", wintypes.DWORD),
+            ("th32DefaultHeapID", ctypes.c_size_t),
+            ("th32ModuleID", wintypes.DWORD),
+            ("cntThreads", wintypes.DWORD),
+            ("th32ParentProcessID", wintypes.DWORD),
+            ("pcPriClassBase", ctypes.c_long),
+            ("dwFlags", wintypes.DWORD),
+            ("szExeFile", ctypes.c_wchar * 260),
+        ]
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.CreateToolhelp32Snapshot.restype = ctypes.c_void_p
+    kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+    kernel32.Process32FirstW.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+    kernel32.Process32NextW.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+    kernel32.CloseHandle.argtypes = [ctypes.c_void_p]
+
+    snapshot = kernel32.CreateToolhelp32Snapshot(_TH32CS_SNAPPROCESS, 0)
+    if snapshot in (None, ctypes.c_void_p(-1).value):
+        return {}
+    parents = {}
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        found = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while found:
+            parents[entry.th32ProcessID] = entry.th32ParentProcessID
+            found = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+    finally:
+        kernel32.CloseHandle(snapshot)
+    return parents
+
+
+def _windows_rss_bytes(pid: int) -> Optional[int]:
+    """Working set of one process, from GetProcessMemoryInfo"""
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.OpenProcess.restype = ctypes.c_void_p
+    kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+    kernel32.K32GetProcessMemoryInfo.argtypes = [
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+        wintypes.DWORD,
+    ]
+    kernel32.CloseHandle.argtypes = [ctypes.c_void_p]
+
+    handle = kernel32.OpenProcess(_PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return None  # Exited, or not ours to inspect
+    try:
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(PROCESS_MEMORY_COUNTERS)
+        if not kernel32.K32GetProcessMemoryInfo(
+            handle, ctypes.byref(counters), counters.cb
+        ):
+            return None
+        return int(counters.WorkingSetSize)
+    finally:
+        kernel32.CloseHandle(handle)
+
+
+class SessionHealthMonitor:
+    """
+    Decide when a browser session has degraded enough to replace it
+
+    The first `baseline_samples` successful syntheses of a session set its
+    baseline latency; after that a smoothed latency more than
+    `latency_drift` times the baseline means the page has slowed down.
+    Sessions are also replaced after `max_syntheses` syntheses, after
+    `max_consecutive_failures` failures in a row (stale elements and the
+    like), or once their memory passes `max_rss_mb`. Any limit set to None
+    is not enforced.
+    """
+
+    def __init__(
+        self,
+        max_syntheses: Optional[int] = 150,
+        latency_drift: Optional[float] = 2.0,
+        max_rss_mb: Optional[int] = 1500,
+        max_consecutive_failures: Optional[int] = 3,
+        baseline_samples: int = 5,
+        smoothing: float = 0.3,
+    ):
+        """
+        Initialize session health monitor
+
+        Args:
+            max_syntheses: Syntheses after which a session is replaced
+            latency_drift: Allowed ratio of recent to baseline latency
+            max_rss_mb: Memory of the browser's process tree above which a
+                session is replaced (a fresh headless session uses ~400MB)
+            max_consecutive_failures: Failures in a row that replace a session
+            baseline_samples: Successful syntheses averaged into the baseline
+            smoothing: Weight of the newest sample in the recent latency
+        """
+        self.max_syntheses = max_syntheses
+        self.latency_drift = latency_drift
+        self.max_rss_mb = max_rss_mb
+        self.max_consecutive_failures = max_consecutive_failures
+        self.baseline_samples = max(1, baseline_samples)
+        self.smoothing = smoothing
+        self.reset()
+
+    def reset(self):
+        """Start tracking a fresh session"""
+        self.syntheses = 0
+        self.consecutive_failures = 0
+        self.rss_bytes: Optional[int] = None
+        self.recent_latency: Optional[float] = None
+        self._baseline: List[float] = []
+
+    @property
+    def baseline_latency(self) -> Optional[float]:
+        """Mean latency of the session's first successful syntheses"""
+        if len(self._baseline) < self.baseline_samples:
+            return None
+        return sum(self._baseline) / len(self._baseline)
+
+    def record(self, latency_sec: Optional[float], rss_bytes: Optional[int] = None):
+        """
+        Record one synthesis
+
+        Args:
+            latency_sec: How long the synthesis took, or None if it failed
+            rss_bytes: Session memory measured afterwards, if known
+        """
+        self.syntheses += 1
+        if rss_bytes is not None:
+            self.rss_bytes = rss_bytes
+        if latency_sec is None:
+            self.consecutive_failures += 1
+            return
+
+        self.consecutive_failures = 0
+        if len(self._baseline) < self.baseline_samples:
+            self._baseline.append(latency_sec)
+            self.recent_latency = self.baseline_latency
+        else:
+            self.recent_latency += self.smoothing * (latency_sec - self.recent_latency)
+
+    def recycle_reason(self) -> Optional[str]:
+        """
+        Check whether the session should be replaced
+
+        Returns:
+            Why the session should be replaced, or None if it is healthy
+        """
+        if self.max_syntheses and self.syntheses >= self.max_syntheses:
+            return f"{self.syntheses} syntheses"
+        if (
+            self.max_consecutive_failures
+            and self.consecutive_failures >= self.max_consecutive_failures
+        ):
+            return f"{self.consecutive_failures} failures in a row"
+        baseline = self.baseline_latency
+        if (
+            self.latency_drift
+            and baseline
+            and self.recent_latency > baseline * self.latency_drift
+        ):
+            return (
+                f"latency {1000 * self.recent_latency:.0f}ms vs "
+                f"{1000 * baseline:.0f}ms baseline"
+            )
+        if self.max_rss_mb and self.rss_bytes:
+            if self.rss_bytes > self.max_rss_mb * 1024 * 1024:
+                return f"memory {self.rss_bytes // (1024 * 1024)}MB"
+        return None
+
+    def stats(self) -> dict:
+        """Get the current session's health figures"""
+        baseline = self.baseline_latency
+        return {
+            "syntheses": self.syntheses,
+            "baseline_ms": round(1000 * baseline) if baseline else None,
+            "recent_ms": (
+                round(1000 * self.recent_latency) if self.recent_latency else None
+            ),
+            "rss_mb": (
+                self.rss_bytes // (1024 * 1024) if self.rss_bytes is not None else None
+            ),
+        }
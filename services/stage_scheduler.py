@@ -0,0 +1,102 @@
+"""
+Run dependent stages of work concurrently
+"""
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set
+import time
+
+
+class StageScheduler:
+    """
+    Runs named stages in threads as soon as the stages they depend on finish
+
+    Each stage is a callable given the results of its dependencies, in the
+    order they were listed. A stage can only depend on stages added before
+    it, so the stages always form a DAG. If a stage fails, no further
+    stages start; the ones already running are waited for and the first
+    error is raised.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize stage scheduler
+
+        Args:
+            max_workers: Most stages running at once (default: all of them)
+        """
+        self.max_workers = max_workers
+        self.timings: Dict[str, float] = {}
+        self.completed: Set[str] = set()
+        self._stages: Dict[str, Callable[..., Any]] = {}
+        self._after: Dict[str, List[str]] = {}
+
+    def add(self, name: str, fn: Callable[..., Any], after: Sequence[str] = ()):
+        """
+        Declare a stage
+
+        Args:
+            name: Unique stage name, used for dependencies and timings
+            fn: Work to run, called with the results of `after`
+            after: Stages that must finish first
+        """
+        if name in self._stages:
+            raise ValueError(f"Stage '{name}' already added")
+        unknown = [dependency for dependency in after if dependency not in self._stages]
+        if unknown:
+            raise ValueError(f"Stage '{name}' depends on unknown stages {unknown}")
+        self._stages[name] = fn
+        self._after[name] = list(after)
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Run every stage, each as soon as its dependencies are done
+
+        Returns:
+            Result of each stage by name
+        """
+        results: Dict[str, Any] = {}
+        waiting = list(self._stages)
+        running: Dict[Future, str] = {}
+        error: Optional[BaseException] = None
+        started = time.perf_counter()
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers or max(1, len(self._stages))
+        ) as pool:
+            while waiting or running:
+                if error is None:
+                    for name in list(waiting):
+                        if all(d in results for d in self._after[name]):
+                            waiting.remove(name)
+                            args = [results[d] for d in self._after[name]]
+                            running[pool.submit(self._timed, name, args)] = name
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except BaseException as e:
+                        error = error or e
+                    else:
+                        self.completed.add(name)
+
+        self.timings["total"] = time.perf_counter() - started
+        if error is not None:
+            raise error
+        return results
+
+    def stats(self) -> Dict[str, float]:
+        """Get each stage's duration in seconds, plus the total"""
+        return {name: round(seconds, 3) for name, seconds in self.timings.items()}
+
+    def _timed(self, name: str, args: List[Any]) -> Any:
+        """Run one stage, recording how long it took"""
+        started = time.perf_counter()
+        try:
+            return self._stages[name](*args)
+        finally:
+            self.timings[name] = time.perf_counter() - started
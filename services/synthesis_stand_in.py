@@ -0,0 +1,168 @@
+"""
+Local stand-in for the Abair synthesis endpoint
+
+Serves canned audio in the same JSON shape as the real API so that
+HttpAudioService can be tested and benchmarked offline:
+
+    python -m services.synthesis_stand_in --port 8765 --latency 0.2
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+import argparse
+import base64
+import io
+import json
+import math
+import socket
+import struct
+import threading
+import time
+import wave
+
+
+def make_canned_wav(
+    duration_sec: float = 0.5, frame_rate: int = 22050, frequency: float = 220.0
+) -> bytes:
+    """
+    Build a short mono 16-bit sine tone as WAV bytes
+
+    Args:
+        duration_sec: Length of the tone
+        frame_rate: Sample rate in Hz
+        frequency: Tone frequency in Hz
+
+    Returns:
+        Complete WAV file contents
+    """
+    n_frames = int(duration_sec * frame_rate)
+    samples = (
+        int(8000 * math.sin(2 * math.pi * frequency * i / frame_rate))
+        for i in range(n_frames)
+    )
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(frame_rate)
+        wav.writeframes(b"".join(struct.pack("<h", s) for s in samples))
+    return buffer.getvalue()
+
+
+class StandInSynthesisServer:
+    """Threaded HTTP server answering every POST with canned audio"""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_sec: float = 0.0,
+        audio: Optional[bytes] = None,
+    ):
+        """
+        Initialize stand-in server
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            latency_sec: Artificial delay per request, to mimic the real service
+            audio: Audio bytes to return (defaults to a short WAV tone)
+        """
+        self.latency_sec = latency_sec
+        self.audio = audio if audio is not None else make_canned_wav()
+        self.requests = []
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Get the URL to use as HttpAudioService's endpoint"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v3/synthesis"
+
+    def start(self) -> "StandInSynthesisServer":
+        """Serve requests on a background thread"""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.05},  # Lets stop() return quickly
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and release the port"""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "StandInSynthesisServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def _make_handler(self):
+        """Create a request handler class bound to this server instance"""
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive, like the real API
+
+            def setup(self):
+                super().setup()
+                # Headers and body go out in separate writes; without this,
+                # delayed ACKs add ~40ms to every keep-alive request
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                try:
+                    payload = json.loads(self.rfile.read(length) or b"{}")
+                except ValueError:
+                    self.send_error(400, "Invalid JSON")
+                    return
+
+                stand_in.requests.append(payload)
+                if stand_in.latency_sec:
+                    time.sleep(stand_in.latency_sec)
+
+                body = json.dumps(
+                    {"audioContent": base64.b64encode(stand_in.audio).decode("ascii")}
+                ).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Keep test and benchmark output clean
+
+        return Handler
+
+
+def main():
+    """Run the stand-in server until interrupted"""
+    parser = argparse.ArgumentParser(description="Local Abair synthesis stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = StandInSynthesisServer(args.host, args.port, args.latency)
+    print(f"Serving canned audio at {server.url}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
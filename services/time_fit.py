@@ -0,0 +1,88 @@
+"""
+Fit synthesized clips into the time before the next subtitle
+"""
+
+from typing import Dict, List
+
+from pydub import AudioSegment
+
+from services.audio_dsp import change_tempo, trim_silence
+
+
+class TimeFitter:
+    """
+    Shorten clips that would run into the next segment
+
+    A clip longer than its window first loses its leading and trailing
+    silence, then is sped up (keeping its pitch) by just enough to fit, but
+    never beyond `max_speed`. Clips that still overflow push the track
+    behind, as they would without fitting.
+    """
+
+    def __init__(
+        self,
+        max_speed: float = 1.3,
+        keep_silence_ms: int = 50,
+        threshold_db: float = -35.0,
+    ):
+        """
+        Initialize time fitter
+
+        Args:
+            max_speed: Largest tempo factor applied (1.3 plays 30% faster)
+            keep_silence_ms: Silence kept around the speech when trimming
+            threshold_db: Level below the loudest part that counts as silence
+        """
+        if max_speed < 1.0:
+            raise ValueError(f"max_speed must be at least 1.0, got {max_speed}")
+        self.max_speed = max_speed
+        self.keep_silence_ms = keep_silence_ms
+        self.threshold_db = threshold_db
+        self.reset()
+
+    def reset(self):
+        """Clear the statistics, e.g. at the start of a job"""
+        self.clips = 0
+        self.trimmed = 0
+        self.overflowing = 0
+        self._speeds: List[float] = []
+
+    def fit(self, audio: AudioSegment, window_ms: float) -> AudioSegment:
+        """
+        Shorten a clip to play within `window_ms`, as far as the bounds allow
+
+        Returns:
+            The clip itself if it already fits, otherwise a trimmed and
+            possibly sped-up copy
+        """
+        self.clips += 1
+        if len(audio) <= window_ms:
+            return audio
+
+        fitted = trim_silence(audio, self.threshold_db, self.keep_silence_ms)
+        self.trimmed += len(fitted) < len(audio)
+        if len(fitted) <= window_ms:
+            return fitted
+
+        needed = len(fitted) / window_ms if window_ms > 0 else float("inf")
+        speed = min(needed, self.max_speed)
+        self._speeds.append(speed)
+        fitted = change_tempo(fitted, speed)
+        if needed <= self.max_speed:
+            fitted = fitted[: int(window_ms)]  # Only trims rounding
+        else:
+            self.overflowing += 1
+        return fitted
+
+    def stats(self) -> Dict[str, float]:
+        """Get fitting counts and tempo factors for the job summary"""
+        return {
+            "clips": self.clips,
+            "trimmed": self.trimmed,
+            "stretched": len(self._speeds),
+            "overflowing": self.overflowing,
+            "mean_speed": (
+                round(sum(self._speeds) / len(self._speeds), 3) if self._speeds else 1.0
+            ),
+            "max_speed": round(max(self._speeds, default=1.0), 3),
+        }
@@ -0,0 +1,140 @@
+"""
+Preallocated PCM timeline the dubbed track is written into
+"""
+
+from typing import Optional
+
+import numpy as np
+from pydub import AudioSegment
+
+from services.audio_dsp import audio_to_array
+
+# What happens when a clip is written over audio already on the timeline
+SHIFT = "shift"  # Start the clip where the earlier audio ends
+TRUNCATE = "truncate"  # Cut the earlier audio off where the clip starts
+MIX = "mix"  # Sum both, clipping to the sample range
+OVERLAP_POLICIES = (SHIFT, TRUNCATE, MIX)
+
+
+class TimelineBuffer:
+    """
+    One int16 PCM buffer holding the whole track
+
+    Appending to an AudioSegment copies everything before it, so building a
+    long track clip by clip is quadratic. The timeline instead allocates
+    the expected duration once and copies each clip to its offset. The
+    sample format is taken from the first clip written; later clips are
+    converted to it. Writes past the end grow the buffer.
+    """
+
+    FADE_MS = 10  # Fade applied where TRUNCATE cuts earlier audio off
+
+    def __init__(self, duration_ms: float):
+        """
+        Initialize timeline
+
+        Args:
+            duration_ms: Expected track length, allocated on the first write
+        """
+        self.duration_ms = duration_ms
+        self.frame_rate: Optional[int] = None
+        self.channels: Optional[int] = None
+        self._samples: Optional[np.ndarray] = None
+        self._end = 0  # Frames up to the end of the last audio written
+
+    @property
+    def end_ms(self) -> float:
+        """Where the audio written so far ends"""
+        return 1000 * self._end / self.frame_rate if self.frame_rate else 0
+
+    def write(self, position_ms: float, audio: AudioSegment, policy: str = MIX) -> int:
+        """
+        Copy a clip onto the timeline
+
+        Args:
+            position_ms: Where the clip should start
+            audio: Clip to write
+            policy: One of OVERLAP_POLICIES, for audio already there
+
+        Returns:
+            Where the clip was placed, in milliseconds
+        """
+        if policy not in OVERLAP_POLICIES:
+            raise ValueError(f"Unknown overlap policy '{policy}'")
+        if self._samples is None:
+            self._allocate(audio)
+        audio = self._conform(audio)
+
+        clip = audio_to_array(audio)
+        start = self._frames(position_ms)
+        if policy == SHIFT:
+            start = max(start, self._end)
+        elif policy == TRUNCATE and start < self._end:
+            self._cut(start)
+        stop = start + len(clip)
+        self._reserve(stop)
+
+        if policy == MIX:
+            mixed = self._samples[start:stop].astype(np.int32) + clip
+            np.clip(mixed, -32768, 32767, out=mixed)
+            self._samples[start:stop] = mixed
+        else:
+            self._samples[start:stop] = clip
+        self._end = max(self._end, stop)
+        return round(1000 * start / self.frame_rate)
+
+    def to_audio_segment(self, length_ms: float) -> AudioSegment:
+        """Get the first `length_ms` of the timeline as one clip"""
+        if self._samples is None:
+            return AudioSegment.silent(duration=length_ms)
+
+        frames = self._frames(length_ms)
+        self._reserve(frames)
+        return AudioSegment(
+            data=self._samples[:frames].tobytes(),
+            sample_width=2,
+            frame_rate=self.frame_rate,
+            channels=self.channels,
+        )
+
+    def _allocate(self, audio: AudioSegment):
+        """Fix the sample format and allocate the expected duration"""
+        self.frame_rate = audio.frame_rate
+        self.channels = audio.channels
+        # Zeroed pages are only committed once written
+        self._samples = np.zeros(
+            (self._frames(self.duration_ms), self.channels), dtype=np.int16
+        )
+
+    def _conform(self, audio: AudioSegment) -> AudioSegment:
+        """Convert a clip to the timeline's sample format"""
+        if audio.frame_rate != self.frame_rate:
+            audio = audio.set_frame_rate(self.frame_rate)
+        if audio.channels != self.channels:
+            audio = audio.set_channels(self.channels)
+        if audio.sample_width != 2:
+            audio = audio.set_sample_width(2)
+        return audio
+
+    def _frames(self, ms: float) -> int:
+        """Convert a time to a frame offset"""
+        return max(0, round(ms * self.frame_rate / 1000))
+
+    def _reserve(self, frames: int):
+        """Grow the buffer (at least doubling) to hold `frames` frames"""
+        capacity = len(self._samples)
+        if frames <= capacity:
+            return
+        grown = np.zeros((max(frames, 2 * capacity), self.channels), dtype=np.int16)
+        grown[:capacity] = self._samples
+        self._samples = grown
+
+    def _cut(self, start: int):
+        """Silence earlier audio from `start` on, fading into the cut"""
+        fade = min(start, self._frames(self.FADE_MS))
+        if fade:
+            ramp = np.linspace(1.0, 0.0, fade, endpoint=False)[:, np.newaxis]
+            head = self._samples[start - fade : start]
+            head[:] = np.rint(head * ramp).astype(np.int16)
+        self._samples[start : self._end] = 0
+        self._end = start
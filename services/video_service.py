@@ -8,14 +8,20 @@ from typing import Optional
 import tempfile
 
 from moviepy import VideoFileClip, AudioFileClip
+from proglog import ProgressBarLogger
 from pydub import AudioSegment
 
+from services.cancellation import CancellationToken, OperationCancelled
 from services.progress_observer import ProgressObserver, NoOpProgressObserver
 
 
 class VideoService(ABC):
     """Abstract base class for video processing services"""
 
+    # Token of the job being encoded, set by the orchestrator; encodes stop
+    # (removing their partial output) once it is cancelled
+    cancellation: Optional[CancellationToken] = None
+
     @abstractmethod
     def load_video(self, video_path: Path) -> VideoFileClip:
         """Load a video file"""
@@ -34,6 +40,18 @@ class VideoService(ABC):
         pass
 
 
+class _CancellableLogger(ProgressBarLogger):
+    """MoviePy progress logger that stops the encode once cancelled"""
+
+    def __init__(self, cancellation: CancellationToken):
+        super().__init__()
+        self.cancellation = cancellation
+
+    def bars_callback(self, bar, attr, value, old_value=None):
+        # Called for every chunk of frames or audio MoviePy writes
+        self.cancellation.check()
+
+
 class MoviePyVideoService(VideoService):
     """Video processing service using MoviePy"""
 
@@ -109,25 +127,29 @@ class MoviePyVideoService(VideoService):
                 audio_codec="aac",
                 threads=4,
                 preset="fast",
-                logger=None,  # Suppress MoviePy logging
+                # Suppress MoviePy logging, but listen for cancellation
+                logger=self.cancellation and _CancellableLogger(self.cancellation),
                 temp_audiofile=str(temp_audiofile),
                 temp_audiofile_path=str(temp_dir),
             )
 
             self.observer.on_stage_complete("Mixing audio and video")
-
-            # Cleanup temporary files
-            self._cleanup_temp_files([temp_audio_path, temp_audiofile])
-
             return output_path
 
+        except OperationCancelled:
+            # Leave no half-written video behind
+            self._cleanup_temp_files([Path(output_path)])
+            raise
+
         except Exception as e:
             error_msg = f"Failed to create dubbed video: {e}"
             self.observer.on_error(error_msg)
-            # Try to cleanup even on error
-            self._cleanup_temp_files([temp_audio_path, temp_audiofile])
             raise RuntimeError(error_msg)
 
+        finally:
+            # Cleanup temporary files, even on error
+            self._cleanup_temp_files([temp_audio_path, temp_audiofile])
+
     def get_video_duration(self, video: VideoFileClip) -> float:
         """
         Get video duration in seconds
@@ -2,13 +2,28 @@
 Unit tests for service layer
 """
 
+import asyncio
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
 import unittest
-from unittest.mock import Mock, MagicMock, patch, call
+import uuid
+from unittest.mock import AsyncMock, Mock, MagicMock, PropertyMock, patch, call
 from pathlib import Path
 from pydub import AudioSegment
+from pydub.generators import Sine
+import numpy as np
+import requests
 
 from models import VoiceConfig, Segment, DubbingJob
 from services import (
+    AudioService,
+    AudioClipCache,
+    AbairAudioService,
     ProgressObserver,
     ConsoleProgressObserver,
     NoOpProgressObserver,
@@ -50,6 +65,1338 @@ class TestProgressObserver(unittest.TestCase):
             mock_print.assert_called_with("\n✓ DONE! Output: /output/path")
 
 
+class TestAudioClipCache(unittest.TestCase):
+    """Test AudioClipCache"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.voice = VoiceConfig(dialect="Kerry", gender="Female")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _make_clip(self, name, size):
+        path = self.root / name
+        path.write_bytes(b"x" * size)
+        return path
+
+    def test_key_normalizes_text_and_includes_voice(self):
+        """Test whitespace differences share a key but voices do not"""
+        key1 = AudioClipCache.make_key("Dia  duit ", self.voice)
+        key2 = AudioClipCache.make_key("Dia duit", self.voice)
+        key3 = AudioClipCache.make_key(
+            "Dia duit", VoiceConfig(dialect="Kerry", gender="Male")
+        )
+
+        self.assertEqual(key1, key2)
+        self.assertNotEqual(key1, key3)
+
+    def test_hit_and_miss_counts(self):
+        """Test lookups count hits and misses"""
+        cache = AudioClipCache(self.root / "cache")
+        key = cache.make_key("Sea.", self.voice)
+
+        self.assertIsNone(cache.get(key))
+        cache.put(key, self._make_clip("synthesis.mp3", 10))
+        cached = cache.get(key)
+
+        self.assertEqual(cached.read_bytes(), b"x" * 10)
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_lru_eviction(self):
+        """Test least recently used clips are evicted over the size bound"""
+        cache = AudioClipCache(self.root / "cache", max_bytes=25)
+        keys = [cache.make_key(f"line {i}", self.voice) for i in range(3)]
+
+        cache.put(keys[0], self._make_clip("a.mp3", 10))
+        cache.put(keys[1], self._make_clip("b.mp3", 10))
+        cache.get(keys[0])  # keys[0] used most recently
+        cache.put(keys[2], self._make_clip("c.mp3", 10))
+
+        self.assertIsNotNone(cache.get(keys[0]))
+        self.assertIsNone(cache.get(keys[1]))
+        self.assertIsNotNone(cache.get(keys[2]))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_index_persists_between_instances(self):
+        """Test cached clips survive a new cache instance"""
+        cache = AudioClipCache(self.root / "cache")
+        key = cache.make_key("Go raibh maith agat", self.voice)
+        cache.put(key, self._make_clip("synthesis.mp3", 5))
+
+        reopened = AudioClipCache(self.root / "cache")
+        self.assertIsNotNone(reopened.get(key))
+
+    def test_instances_sharing_a_directory_see_each_others_clips(self):
+        """Test entries stored through one instance are found by another"""
+        first = AudioClipCache(self.root / "cache")
+        second = AudioClipCache(self.root / "cache")
+        key1 = first.make_key("Sea.", self.voice)
+        key2 = first.make_key("Ní hea.", self.voice)
+
+        first.put(key1, self._make_clip("a.mp3", 5))
+        second.put(key2, self._make_clip("b.mp3", 5))
+
+        self.assertIsNotNone(second.get(key1))
+        self.assertIsNotNone(first.get(key2))
+        reopened = AudioClipCache(self.root / "cache")
+        self.assertEqual(reopened.stats()["entries"], 2)
+
+    def test_hits_batch_index_writes(self):
+        """Test hits update access times in memory until flushed"""
+        cache = AudioClipCache(self.root / "cache")
+        key = cache.make_key("Sea.", self.voice)
+        cache.put(key, self._make_clip("synthesis.mp3", 5))
+        stored_access = cache._index[key]["last_access"]
+
+        with patch.object(cache, "_save_index") as save_index:
+            for _ in range(cache.FLUSH_EVERY):
+                self.assertIsNotNone(cache.get(key))
+        save_index.assert_not_called()
+
+        cache.flush()
+        reopened = AudioClipCache(self.root / "cache")
+        self.assertGreater(reopened._index[key]["last_access"], stored_access)
+
+    def test_abair_service_uses_cache_before_browser(self):
+        """Test a cache hit skips browser synthesis entirely"""
+        cache = AudioClipCache(self.root / "cache")
+        key = cache.make_key("Sea.", self.voice)
+        cached = cache.put(key, self._make_clip("synthesis.mp3", 5))
+
+        observer = Mock(spec=ProgressObserver)
+        service = AbairAudioService(self.root, observer, cache=cache)
+        service.driver = Mock()
+        service.wait = Mock()
+
+        with patch.object(service, "_synthesize_and_download") as synth:
+            result = service.generate_audio("Sea.", self.voice, self.root)
+
+        self.assertEqual(result, cached)
+        synth.assert_not_called()
+
+        service.cleanup()
+        observer.on_stats.assert_called_once()
+
+
+class TestAbairReadinessMode(unittest.TestCase):
+    """Test readiness-driven waiting in AbairAudioService"""
+
+    def _make_service(self, readiness_mode):
+        service = AbairAudioService(Path("."), readiness_mode=readiness_mode)
+        service.driver = Mock()
+        service.wait = Mock()
+        return service
+
+    def test_fixed_mode_sleeps(self):
+        """Test the default mode keeps the fixed sleeps"""
+        service = self._make_service(readiness_mode=False)
+        condition = Mock()
+
+        with patch("services.audio_service.time.sleep") as mock_sleep:
+            service._settle(5, condition)
+
+        mock_sleep.assert_called_once_with(5)
+        service.wait.until.assert_not_called()
+
+    def test_readiness_mode_waits_on_condition(self):
+        """Test readiness mode waits on the condition instead of sleeping"""
+        service = self._make_service(readiness_mode=True)
+        condition = Mock()
+
+        with patch("services.audio_service.time.sleep") as mock_sleep:
+            service._settle(5, condition)
+            service._settle(2, None)
+
+        mock_sleep.assert_not_called()
+        service.wait.until.assert_called_once_with(condition)
+
+    def test_synthesis_finished_requires_idle_network(self):
+        """Test synthesis counts as finished only when no request is pending"""
+        service = self._make_service(readiness_mode=True)
+
+        service.driver.execute_script.return_value = {"completed": 3, "pending": 1}
+        self.assertFalse(service._synthesis_finished(2))
+
+        service.driver.execute_script.return_value = {"completed": 3, "pending": 0}
+        self.assertTrue(service._synthesis_finished(2))
+        self.assertFalse(service._synthesis_finished(3))
+
+    def test_step_timer_averages(self):
+        """Test per-step latency averages"""
+        from services.audio_service import StepTimer
+
+        timer = StepTimer()
+        with patch(
+            "services.audio_service.time.perf_counter", side_effect=[0, 1, 0, 3]
+        ):
+            timer.start()
+            timer.mark("synthesize")
+            timer.start()
+            timer.mark("synthesize")
+
+        self.assertEqual(timer.averages_ms(), {"synthesize": 2000})
+
+
+class TestDownloadWatcher(unittest.TestCase):
+    """Test download completion detection"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = Path(self.temp_dir.name) / "downloads"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def download_later(self, name, delay=0.05):
+        """Write a partial file, then rename it like Chrome does"""
+
+        def write():
+            time.sleep(delay)
+            partial = self.directory / f"{name}.crdownload"
+            partial.write_bytes(b"audio")
+            os.replace(partial, self.directory / name)
+
+        thread = threading.Thread(target=write)
+        thread.start()
+        return thread
+
+    def check_watcher(self, watcher):
+        with watcher:
+            (self.directory / "old.mp3").write_bytes(b"stale")
+            watcher.expect()
+            writer = self.download_later("synthesis.mp3")
+            start = time.monotonic()
+            result = watcher.wait(timeout=5)
+            elapsed = time.monotonic() - start
+            writer.join()
+
+        self.assertEqual(result, self.directory / "synthesis.mp3")
+        self.assertLess(elapsed, 0.5)
+
+    def test_scanning_watcher_detects_finalized_file(self):
+        """Test the directory-scan fallback ignores stale and partial files"""
+        from services.download_watcher import DownloadWatcher
+
+        self.check_watcher(DownloadWatcher(self.directory))
+
+    def test_inotify_watcher_detects_finalized_file(self):
+        """Test the inotify watcher reports the renamed download"""
+        from services.download_watcher import InotifyDownloadWatcher
+
+        if not InotifyDownloadWatcher.is_supported():
+            self.skipTest("inotify not available")
+        self.check_watcher(InotifyDownloadWatcher(self.directory))
+
+    def test_wait_times_out(self):
+        """Test wait returns None when nothing is downloaded"""
+        from services.download_watcher import create_download_watcher
+
+        with create_download_watcher(self.directory) as watcher:
+            watcher.expect()
+            self.assertIsNone(watcher.wait(timeout=0.05))
+
+    def test_abair_moves_download_to_output_dir(self):
+        """Test AbairAudioService hands back the clip in the output folder"""
+        out_dir = Path(self.temp_dir.name)
+        service = AbairAudioService(out_dir)
+        service.download_watcher.start()
+        try:
+            service.download_watcher.expect()
+            self.directory = service.download_dir
+            writer = self.download_later("synthesis.mp3")
+            audio_path = service._wait_for_download(out_dir, max_wait_sec=5)
+            writer.join()
+        finally:
+            service.download_watcher.stop()
+
+        self.assertEqual(audio_path, out_dir / "synthesis.mp3")
+        self.assertTrue(audio_path.exists())
+        self.assertEqual(list(service.download_dir.iterdir()), [])
+
+
+class TestBrowserSessionDaemon(unittest.TestCase):
+    """Test leasing warm browser sessions over the daemon socket"""
+
+    def setUp(self):
+        from services.browser_daemon import BrowserSessionDaemon
+
+        self.launched = []
+
+        def launch(download_dir):
+            driver = Mock()
+            self.launched.append(driver)
+            return driver, f"127.0.0.1:{9000 + len(self.launched)}"
+
+        self.daemon = BrowserSessionDaemon(port=0, launch_session=launch).start()
+
+    def tearDown(self):
+        self.daemon.stop()
+
+    def client(self, timeout=1):
+        from services.browser_daemon import BrowserDaemonClient
+
+        return BrowserDaemonClient(self.daemon.address, timeout=timeout)
+
+    def test_lease_is_exclusive_and_remembers_voice(self):
+        """Test one client holds a session and the next inherits its voice"""
+        voice = VoiceConfig(dialect="Kerry", gender="Male")
+        first = self.client()
+        lease = first.lease()
+        self.assertEqual(lease.debugger_address, "127.0.0.1:9001")
+        self.assertIsNone(lease.voice)
+
+        with self.assertRaises(ConnectionError):
+            self.client(timeout=0.05).lease()
+
+        first.release(voice)
+        second = self.client()
+        self.assertEqual(second.lease().voice, voice)
+        second.release()
+        self.assertEqual(len(self.launched), 1)
+
+    def test_disconnect_returns_session(self):
+        """Test a client that goes away without releasing frees its session"""
+        client = self.client()
+        client.lease()
+        client.close()
+
+        other = self.client()
+        self.assertIsNone(other.lease().voice)
+        other.release()
+
+    def test_dead_browser_is_relaunched(self):
+        """Test a session whose browser died is replaced on lease"""
+        type(self.launched[0]).current_url = PropertyMock(side_effect=Exception)
+        client = self.client()
+        self.assertEqual(client.lease().debugger_address, "127.0.0.1:9002")
+        client.release()
+
+    def test_abair_service_attaches_and_releases(self):
+        """Test AbairAudioService borrows the browser instead of launching one"""
+        voice = VoiceConfig(dialect="Connemara", gender="Female")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            service = AbairAudioService(
+                Path(temp_dir), daemon_address=self.daemon.address
+            )
+            driver = Mock()
+            with patch(
+                "gui.selenium_utils.attach_selenium", return_value=(driver, Mock())
+            ) as attach, patch("gui.selenium_utils.setup_selenium") as launch:
+                service.setup()
+                service.current_voice = voice
+                service.cleanup()
+
+        attach.assert_called_once()
+        self.assertEqual(attach.call_args[0][0], "127.0.0.1:9001")
+        launch.assert_not_called()
+        driver.quit.assert_not_called()
+        driver.service.stop.assert_called_once()
+
+        client = self.client()
+        self.assertEqual(client.lease().voice, voice)
+        client.release()
+
+    def test_abair_service_falls_back_without_daemon(self):
+        """Test an unreachable daemon falls back to launching a browser"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            service = AbairAudioService(Path(temp_dir), daemon_address="127.0.0.1:1")
+            with patch(
+                "gui.selenium_utils.setup_selenium", return_value=(Mock(), Mock())
+            ) as launch:
+                service.setup()
+                service.cleanup()
+
+        launch.assert_called_once()
+
+
+class TestAbairInMemoryClips(unittest.TestCase):
+    """Test AbairAudioService.generate_clip"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.out_dir = Path(self.temp_dir.name)
+        self.download = self.out_dir / "synthesis.wav"
+        Sine(440).to_audio_segment(duration=1400).export(
+            str(self.download), format="wav"
+        )
+        self.service = AbairAudioService(
+            self.out_dir, cache=AudioClipCache(self.out_dir / "cache")
+        )
+        self.service.driver = Mock()
+        self.service.wait = Mock()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_speed_adjusted_clip_is_not_reencoded(self):
+        """Test speed adjustment happens in memory and the download is untouched"""
+        voice = VoiceConfig(dialect="Connemara", gender="Female")
+        original = self.download.read_bytes()
+
+        with patch.object(
+            self.service, "_synthesize_with_voice", return_value=self.download
+        ):
+            clip = self.service.generate_clip("Dia duit", voice, self.out_dir)
+
+        self.assertLess(len(clip), 1400)
+        self.assertEqual(self.download.read_bytes(), original)
+
+        # The adjusted clip is cached losslessly and reused
+        with patch.object(self.service, "_synthesize_with_voice") as synth:
+            cached = self.service.generate_clip("Dia duit", voice, self.out_dir)
+        synth.assert_not_called()
+        self.assertEqual(cached.raw_data, clip.raw_data)
+
+
+class TestSessionHealth(unittest.TestCase):
+    """Test browser session health tracking and recycling"""
+
+    def test_monitor_flags_drift_failures_and_age(self):
+        """Test each limit triggers a recycle only once it is exceeded"""
+        from services.session_health import SessionHealthMonitor
+
+        monitor = SessionHealthMonitor(max_syntheses=20, baseline_samples=3)
+        for latency in (1.0, 1.2, 0.8, 1.5, 1.8):
+            monitor.record(latency)
+        self.assertAlmostEqual(monitor.baseline_latency, 1.0)
+        self.assertIsNone(monitor.recycle_reason())
+        for _ in range(5):
+            monitor.record(4.0)
+        self.assertIn("latency", monitor.recycle_reason())
+
+        monitor.reset()
+        monitor.record(None)
+        monitor.record(None)
+        self.assertIsNone(monitor.recycle_reason())
+        monitor.record(None)
+        self.assertIn("failures", monitor.recycle_reason())
+
+        monitor = SessionHealthMonitor(max_syntheses=2, max_rss_mb=100)
+        monitor.record(1.0, rss_bytes=50 * 1024 * 1024)
+        self.assertIsNone(monitor.recycle_reason())
+        monitor.record(1.0)
+        self.assertIn("2 syntheses", monitor.recycle_reason())
+        self.assertEqual(monitor.stats()["rss_mb"], 50)
+
+    @unittest.skipUnless(os.path.isdir("/proc/self"), "needs /proc")
+    def test_process_tree_rss(self):
+        """Test the RSS of this process tree is measured"""
+        from services.session_health import process_tree_rss_bytes
+
+        self.assertGreater(process_tree_rss_bytes(os.getpid()), 1024 * 1024)
+        self.assertIsNone(process_tree_rss_bytes(2**22 + 1))
+
+    def test_process_tree_survives_reused_parent_ids(self):
+        """Test a parent ID reused by a descendant does not loop forever"""
+        from services import session_health
+
+        mb = 1024 * 1024
+        with patch.object(
+            session_health, "_proc_parent_pids", return_value={10: 12, 11: 10, 12: 11}
+        ), patch.object(session_health, "_proc_rss_bytes", return_value=mb):
+            self.assertEqual(session_health.process_tree_rss_bytes(10), 3 * mb)
+
+    def test_memory_limit_on_by_default(self):
+        """Test sessions are replaced on memory growth without configuration"""
+        from services.session_health import SessionHealthMonitor
+
+        monitor = SessionHealthMonitor()
+        monitor.record(1.0, rss_bytes=600 * 1024 * 1024)
+        self.assertIsNone(monitor.recycle_reason())
+        monitor.record(1.0, rss_bytes=2000 * 1024 * 1024)
+        self.assertEqual(monitor.recycle_reason(), "memory 2000MB")
+
+    def test_abair_recycles_browser_and_restores_voice(self):
+        """Test a worn-out session is replaced and keeps its voice"""
+        from services.session_health import SessionHealthMonitor
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            out_dir = Path(temp_dir)
+            observer = Mock(spec=ProgressObserver)
+            service = AbairAudioService(
+                out_dir, observer, health=SessionHealthMonitor(max_syntheses=2)
+            )
+            old_driver = service.driver = Mock()
+            service.wait = Mock()
+            new_driver = Mock()
+            voice = VoiceConfig(dialect="Kerry", gender="Male")
+
+            def synthesize(text, output_dir):
+                service.step_timer.current = {"synthesize": 0.5}
+                return out_dir / "synthesis.mp3"
+
+            with patch(
+                "gui.selenium_utils.setup_selenium", return_value=(new_driver, Mock())
+            ), patch.object(
+                service, "_set_voice_settings", return_value=True
+            ) as set_voice, patch.object(
+                service, "_synthesize_and_download", side_effect=synthesize
+            ):
+                for _ in range(3):
+                    self.assertIsNotNone(
+                        service.generate_audio("Dia duit", voice, out_dir)
+                    )
+
+            old_driver.quit.assert_called_once()
+            self.assertIs(service.driver, new_driver)
+            self.assertEqual(set_voice.call_args_list, [call(voice), call(voice)])
+            self.assertEqual(service.current_voice, voice)
+            self.assertEqual(service.voice_switches, 1)
+            self.assertEqual(service.recycles, 1)
+            self.assertEqual(service.health.syntheses, 1)
+
+            service.cleanup()
+            observer.on_stats.assert_any_call(
+                "Browser session health",
+                {
+                    "syntheses": 1,
+                    "baseline_ms": None,
+                    "recent_ms": None,
+                    "rss_mb": None,
+                    "recycles": 1,
+                },
+            )
+
+    def test_failed_daemon_recycle_keeps_lent_browser(self):
+        """Test a lent browser is only given back once a replacement is up"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            observer = Mock(spec=ProgressObserver)
+            # Nothing listens there, so no other daemon browser can be borrowed
+            service = AbairAudioService(
+                Path(temp_dir), observer, daemon_address="127.0.0.1:1"
+            )
+            lent_driver = service.driver = Mock()
+            client = service._daemon_client = Mock()
+            own_driver = Mock()
+
+            with patch(
+                "gui.selenium_utils.setup_selenium", side_effect=RuntimeError("no")
+            ):
+                service._recycle_session("test")
+
+            observer.on_error.assert_called_once()
+            lent_driver.quit.assert_not_called()
+            client.release.assert_not_called()
+            self.assertIs(service.driver, lent_driver)
+            self.assertIs(service._daemon_client, client)
+
+            with patch(
+                "gui.selenium_utils.setup_selenium", return_value=(own_driver, Mock())
+            ):
+                service._recycle_session("test")
+
+            lent_driver.quit.assert_called_once()
+            client.release.assert_called_once_with(None)
+            self.assertIs(service.driver, own_driver)
+            self.assertIsNone(service._daemon_client)
+            self.assertEqual(service.recycles, 1)
+
+
+class TestTimeStretch(unittest.TestCase):
+    """Test the NumPy WSOLA time-stretch"""
+
+    def setUp(self):
+        self.clip = Sine(440, sample_rate=22050).to_audio_segment(
+            duration=2000, volume=-6
+        )
+
+    def dominant_frequency(self, audio):
+        from services.audio_dsp import audio_to_array
+
+        samples = audio_to_array(audio)[:, 0].astype(float)
+        spectrum = np.abs(np.fft.rfft(samples))
+        return np.argmax(spectrum) * audio.frame_rate / len(samples)
+
+    def test_length_follows_speed_and_pitch_is_kept(self):
+        """Test faster and slower factors give exact length at the same pitch"""
+        from services.audio_dsp import change_tempo
+
+        for speed in (1.4, 0.75, 2.5):
+            stretched = change_tempo(self.clip, speed)
+            self.assertAlmostEqual(len(stretched), 2000 / speed, delta=1)
+            self.assertAlmostEqual(self.dominant_frequency(stretched), 440, delta=5)
+
+    def test_unit_speed_returns_clip_unchanged(self):
+        """Test a factor of 1 is a no-op"""
+        from services.audio_dsp import change_tempo
+
+        self.assertIs(change_tempo(self.clip, 1.0), self.clip)
+
+    def test_stereo_channels_are_preserved(self):
+        """Test multi-channel clips keep their layout"""
+        from services.audio_dsp import audio_to_array, change_tempo
+
+        stereo = AudioSegment.from_mono_audiosegments(self.clip, self.clip)
+        stretched = change_tempo(stereo, 1.2)
+        self.assertEqual(stretched.channels, 2)
+        left, right = audio_to_array(stretched).T
+        np.testing.assert_array_equal(left, right)
+
+    def test_rejects_non_positive_speed(self):
+        """Test invalid factors raise ValueError"""
+        from services.audio_dsp import time_stretch
+
+        with self.assertRaises(ValueError):
+            time_stretch(np.zeros((100, 1)), 0, 22050)
+
+
+class TestTimelineBuffer(unittest.TestCase):
+    """Test the preallocated track timeline"""
+
+    def tone(self, duration_ms, frequency=440):
+        return Sine(frequency, sample_rate=16000).to_audio_segment(
+            duration=duration_ms, volume=-12
+        )
+
+    def test_matches_concatenated_track(self):
+        """Test sequential writes build the same track as appending"""
+        from services.timeline import TimelineBuffer, SHIFT
+
+        timeline = TimelineBuffer(2000)
+        track = AudioSegment.silent(duration=0, frame_rate=16000)
+        position = 0
+        for start, length in ((120, 300), (500, 250), (700, 400), (1900, 300)):
+            if start > len(track):
+                track += AudioSegment.silent(
+                    duration=start - len(track), frame_rate=16000
+                )
+            clip = self.tone(length, 200 + start)
+            track += clip
+            position = timeline.write(start, clip, SHIFT) + length
+
+        # The third clip started late, after the second one ended
+        self.assertEqual(position, 2200)
+        self.assertEqual(timeline.to_audio_segment(position).raw_data, track.raw_data)
+
+    def test_truncate_and_mix_overlaps(self):
+        """Test overlapping clips cut off or sum with the earlier audio"""
+        from services.audio_dsp import audio_to_array
+        from services.timeline import TimelineBuffer, MIX, TRUNCATE
+
+        clip = self.tone(400)
+        timeline = TimelineBuffer(1000)
+        timeline.write(0, clip, TRUNCATE)
+        timeline.write(
+            200, AudioSegment.silent(duration=50, frame_rate=16000), TRUNCATE
+        )
+        samples = audio_to_array(timeline.to_audio_segment(400))
+        self.assertEqual(timeline.end_ms, 250)
+        self.assertFalse(samples[200 * 16 :].any())
+        self.assertTrue(samples[: 190 * 16].any())
+
+        timeline = TimelineBuffer(1000)
+        timeline.write(0, clip, MIX)
+        timeline.write(0, clip, MIX)
+        doubled = audio_to_array(timeline.to_audio_segment(400))
+        np.testing.assert_array_equal(doubled, 2 * audio_to_array(clip))
+
+        with self.assertRaises(ValueError):
+            timeline.write(0, clip, "overwrite")
+
+    def test_grows_past_expected_duration(self):
+        """Test clips running past the video end extend the timeline"""
+        from services.timeline import TimelineBuffer
+
+        timeline = TimelineBuffer(100)
+        timeline.write(80, self.tone(500))
+        self.assertEqual(len(timeline.to_audio_segment(580)), 580)
+
+    def test_orchestrator_overlap_policies(self):
+        """Test overlapping policies place every clip on its cue"""
+        from services.dubbing_orchestrator import DubbingOrchestrator
+        from services.retry_queue import RetryQueue
+
+        # Clips run longer than the spacing, so the shift policy falls behind
+        segments = make_segments(10, spacing=0.3, text="Líne fhada anseo")
+        placed = {}
+        for policy in ("shift", "truncate", "mix"):
+            orchestrator = DubbingOrchestrator(
+                ClipAudioService(),
+                Mock(),
+                Mock(),
+                Mock(spec=ProgressObserver),
+                segment_delay_sec=0,
+                retry_queue=RetryQueue(max_retries=0),
+                overlap_policy=policy,
+            )
+            with tempfile.TemporaryDirectory() as out_dir:
+                track, subtitles = orchestrator._generate_dub_track(
+                    segments, 3.0, Path(out_dir)
+                )
+            placed[policy] = (len(track), len(subtitles))
+
+        self.assertLess(placed["shift"][1], 10)
+        # Each clip lasts 40 ms per character of "Líne fhada anseo 9"
+        self.assertEqual(placed["truncate"], (segments[-1].start_ms + 40 * 18, 10))
+        self.assertEqual(placed["mix"], placed["truncate"])
+
+
+class TestAbairBatchSynthesis(unittest.TestCase):
+    """Test voice-grouped batch synthesis in AbairAudioService"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.out_dir = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_batch_switches_voice_once_per_voice(self):
+        """Test alternating speakers only switch settings once per voice"""
+        service = AbairAudioService(self.out_dir)
+        service.driver = Mock()
+        service.wait = Mock()
+
+        def synthesize(text, output_dir):
+            path = Path(output_dir) / "synthesis.mp3"
+            path.write_text(text, encoding="utf-8")
+            return path
+
+        female = VoiceConfig(dialect="Kerry", gender="Female")
+        male = VoiceConfig(dialect="Kerry", gender="Male")
+        requests_ = [(f"line {i}", female if i % 2 else male) for i in range(6)]
+
+        with patch.object(
+            service, "_set_voice_settings", return_value=True
+        ) as settings, patch.object(
+            service, "_synthesize_and_download", side_effect=synthesize
+        ):
+            paths = service.generate_batch(requests_, self.out_dir)
+
+        self.assertEqual(settings.call_count, 2)
+        self.assertEqual(
+            [p.read_text(encoding="utf-8") for p in paths],
+            [f"line {i}" for i in range(6)],
+        )
+
+        service.cleanup()
+        self.assertFalse(any(p.exists() for p in paths))
+
+    def test_orchestrator_batch_matches_sequential_track(self):
+        """Test batch mode places clips back in subtitle order"""
+        from services.dubbing_orchestrator import DubbingOrchestrator
+
+        segments = make_segments(9, spacing=1.0)
+        results = []
+        for batch_by_voice in (False, True):
+            service = ClipAudioService()
+            service.generate_batch = Mock(wraps=service.generate_batch)
+            orchestrator = DubbingOrchestrator(
+                service,
+                Mock(),
+                Mock(),
+                Mock(spec=ProgressObserver),
+                segment_delay_sec=0,
+                batch_by_voice=batch_by_voice,
+            )
+            results.append(
+                orchestrator._generate_dub_track(segments, 10.0, self.out_dir)
+            )
+            self.assertEqual(service.generate_batch.called, batch_by_voice)
+
+        self.assertEqual(results[0][0].raw_data, results[1][0].raw_data)
+        self.assertEqual(results[0][1], results[1][1])
+
+    def test_batched_requests_are_paced_and_cancellable(self):
+        """Test batched requests pass the breaker, rate limiter and token"""
+        from services.cancellation import CancellationToken, OperationCancelled
+        from services.dubbing_orchestrator import DubbingOrchestrator
+        from services.rate_limiter import AdaptiveRateLimiter
+
+        service = ClipAudioService()
+        observer = Mock(spec=ProgressObserver)
+        limiter = AdaptiveRateLimiter(1000.0, max_rate=1000.0)
+        limiter.acquire = Mock(wraps=limiter.acquire)
+        orchestrator = DubbingOrchestrator(
+            service,
+            Mock(),
+            Mock(),
+            observer,
+            batch_by_voice=True,
+            rate_limiter=limiter,
+        )
+        orchestrator._generate_dub_track(make_segments(6), 10.0, self.out_dir)
+        self.assertEqual(limiter.acquire.call_count, 6)
+        self.assertEqual(limiter.successes, 6)
+        self.assertIn(
+            call(6, 6, "Synthesizing", "Request 6/6"),
+            observer.on_progress.call_args_list,
+        )
+
+        # A cancelled job stops between batched requests
+        orchestrator.cancellation = CancellationToken()
+        original = service.generate_audio
+
+        def cancelling(text, voice, output_dir):
+            if len(service.generate_calls) == 1:
+                orchestrator.cancellation.cancel()
+            return original(text, voice, output_dir)
+
+        service.generate_audio = cancelling
+        service.generate_calls = []
+        with self.assertRaises(OperationCancelled):
+            orchestrator._generate_dub_track(make_segments(6), 10.0, self.out_dir)
+        self.assertEqual(len(service.generate_calls), 2)
+
+    def test_batch_with_shift_policy_groups_every_line(self):
+        """Test shift placement still batches, placing only lines in time"""
+        from services.dubbing_orchestrator import DubbingOrchestrator
+
+        segments = make_segments(20, spacing=0.2, text="Dia duit a chara")
+        service = ClipAudioService()
+        service.generate_batch = Mock(wraps=service.generate_batch)
+        observer = Mock(spec=ProgressObserver)
+        orchestrator = DubbingOrchestrator(
+            service,
+            Mock(),
+            Mock(),
+            observer,
+            segment_delay_sec=0,
+            batch_by_voice=True,
+        )
+        _, subtitles = orchestrator._generate_dub_track(segments, 10.0, self.out_dir)
+
+        service.generate_batch.assert_called_once()
+        self.assertEqual(len(service.generate_calls), len(segments))
+        self.assertLess(len(subtitles), len(segments))
+
+
+class FakeAbairSession:
+    """Stand-in for a browser session that writes a synthesis file"""
+
+    def __init__(self, download_folder):
+        self.download_folder = download_folder
+        self.texts = []
+        self.cleaned_up = False
+
+    def setup(self):
+        pass
+
+    def cleanup(self):
+        self.cleaned_up = True
+
+    def generate_audio(self, text, voice, output_dir):
+        self.texts.append(text)
+        path = Path(output_dir) / "synthesis.mp3"
+        path.write_text(text, encoding="utf-8")
+        return path
+
+    def generate_clip(self, text, voice, output_dir):
+        self.texts.append(text)
+        return Sine(440).to_audio_segment(duration=10 * len(text))
+
+
+class TestPooledAbairAudioService(unittest.TestCase):
+    """Test PooledAbairAudioService"""
+
+    def _make_pool(self, size):
+        from services.abair_pool import PooledAbairAudioService
+
+        pool = PooledAbairAudioService(size=size, memory_per_session_mb=1)
+        pool.create_session = FakeAbairSession
+        return pool
+
+    def test_pool_distributes_concurrent_requests(self):
+        """Test concurrent submissions are spread over sessions"""
+        pool = self._make_pool(3)
+        voice = VoiceConfig(dialect="Kerry", gender="Female")
+        pool.setup()
+        try:
+            futures = [pool.submit(f"line {i}", voice, Path(".")) for i in range(9)]
+            paths = [f.result() for f in futures]
+
+            # Every clip survives later syntheses on the same session
+            texts = [p.read_text(encoding="utf-8") for p in paths]
+            self.assertEqual(texts, [f"line {i}" for i in range(9)])
+            self.assertEqual(sum(len(session.texts) for session in pool.sessions), 9)
+            self.assertEqual(pool.max_concurrency, 3)
+        finally:
+            sessions = pool.sessions
+            pool.cleanup()
+
+        self.assertTrue(all(session.cleaned_up for session in sessions))
+
+    def test_pool_clips_stay_in_memory(self):
+        """Test pooled clips skip the file round trip and fill the cache"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = AudioClipCache(Path(temp_dir) / "cache")
+            pool = self._make_pool(2)
+            pool.cache = cache
+            voice = VoiceConfig(dialect="Kerry", gender="Female")
+            pool.setup()
+            try:
+                with patch.object(
+                    AudioSegment, "from_file", wraps=AudioSegment.from_file
+                ) as from_file:
+                    clips = asyncio.run(
+                        pool.agenerate_many(
+                            [(f"line {i}", voice) for i in range(4)],
+                            Path(temp_dir),
+                            as_clips=True,
+                        )
+                    )
+                    from_file.assert_not_called()
+                    cached = pool.generate_clip("line 0", voice, Path(temp_dir))
+                    from_file.assert_called_once()
+
+                self.assertEqual([len(clip) for clip in clips], [60] * 4)
+                self.assertEqual(len(cached), 60)
+                written = [p for p in pool._work_dir.rglob("*") if p.is_file()]
+                self.assertEqual(written, [])
+                self.assertEqual(sum(len(s.texts) for s in pool.sessions), 4)
+                self.assertEqual(cache.stats()["entries"], 4)
+            finally:
+                pool.cleanup()
+
+    def test_pool_size_capped_by_memory(self):
+        """Test the pool never asks for more sessions than memory allows"""
+        from services.abair_pool import PooledAbairAudioService
+
+        with patch("services.abair_pool.max_sessions_for_memory", return_value=2):
+            pool = PooledAbairAudioService(size=8)
+
+        self.assertEqual(pool.size, 2)
+
+    @unittest.skipIf(sys.platform == "win32", "Windows asks the kernel32 API")
+    def test_available_memory_includes_reclaimable_cache(self):
+        """Test available memory is MemAvailable, not just free pages"""
+        from services.abair_pool import available_memory_bytes
+
+        with tempfile.TemporaryDirectory() as folder:
+            meminfo = Path(folder) / "meminfo"
+            meminfo.write_text(
+                "MemTotal:       16000000 kB\n"
+                "MemFree:          500000 kB\n"
+                "MemAvailable:    9000000 kB\n"
+            )
+            with patch("services.abair_pool.MEMINFO_PATH", meminfo):
+                self.assertEqual(available_memory_bytes(), 9000000 * 1024)
+            with patch("services.abair_pool.MEMINFO_PATH", meminfo.with_name("x")):
+                self.assertIsNone(available_memory_bytes())
+
+
+class TestHttpAudioService(unittest.TestCase):
+    """Test HttpAudioService against the local stand-in server"""
+
+    def setUp(self):
+        from services.synthesis_stand_in import StandInSynthesisServer
+
+        self.server = StandInSynthesisServer().start()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.out_dir = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.server.stop()
+        self.temp_dir.cleanup()
+
+    def test_generates_canned_audio(self):
+        """Test a synthesis returns the server's audio and sends the voice"""
+        from services import HttpAudioService
+
+        service = HttpAudioService(endpoint=self.server.url, audio_format="wav")
+        service.setup()
+        try:
+            voice = VoiceConfig(dialect="Connemara", gender="Female")
+            path = service.generate_audio("Dia duit", voice, self.out_dir)
+
+            self.assertEqual(path.read_bytes(), self.server.audio)
+            request = self.server.requests[0]
+            self.assertEqual(request["synthinput"]["text"], "Dia duit")
+            self.assertEqual(request["audioconfig"]["speakingRate"], 1.4)
+        finally:
+            service.cleanup()
+
+        self.assertFalse(path.exists())
+
+    def test_generate_clip_stays_in_memory(self):
+        """Test clips are decoded from the response without writing files"""
+        from services import HttpAudioService
+
+        service = HttpAudioService(endpoint=self.server.url, audio_format="wav")
+        service.setup()
+        try:
+            voice = VoiceConfig(dialect="Kerry", gender="Female")
+            clip = service.generate_clip("Dia duit", voice, self.out_dir)
+        finally:
+            service.cleanup()
+
+        self.assertEqual(len(clip), 500)
+        self.assertEqual(list(self.out_dir.iterdir()), [])
+
+    def test_default_configuration_handles_wav_responses(self):
+        """Test the service built by the core decodes the stand-in's WAV"""
+        from dubbing_core.core import create_audio_service
+
+        job = DubbingJob.from_paths("/v/video.mp4", "e.srt", "g.srt", "out.mp4")
+        with patch(
+            "dubbing_core.core.default_cache_dir", return_value=self.out_dir / "cache"
+        ):
+            service = create_audio_service(
+                "http", job, Mock(), synthesis_url=self.server.url
+            )
+        self.assertEqual(service.audio_format, "mp3")
+        service.setup()
+        try:
+            voice = VoiceConfig(dialect="Kerry", gender="Female")
+            path = service.generate_audio("Dia duit", voice, self.out_dir)
+            clip = service.generate_clip("Go raibh maith agat", voice, self.out_dir)
+            cached = service.generate_clip("Dia duit", voice, self.out_dir)
+        finally:
+            service.cleanup()
+
+        self.assertEqual(path.suffix, ".wav")
+        self.assertEqual(len(clip), 500)
+        self.assertEqual(len(cached), 500)
+
+    def test_stand_in_clips_never_reach_the_browser_backend(self):
+        """Test clips from another endpoint are cached apart from Abair's"""
+        from dubbing_core.core import create_audio_service
+
+        job = DubbingJob.from_paths("/v/video.mp4", "e.srt", "g.srt", "out.mp4")
+        voice = VoiceConfig(dialect="Kerry", gender="Female")
+        with patch(
+            "dubbing_core.core.default_cache_dir", return_value=self.out_dir / "cache"
+        ):
+            http = create_audio_service(
+                "http", job, Mock(), synthesis_url=self.server.url
+            )
+            http.setup()
+            try:
+                self.assertIsNotNone(
+                    http.generate_clip("Dia duit", voice, self.out_dir)
+                )
+            finally:
+                http.cleanup()
+            browser = create_audio_service("browser", job, Mock())
+            default_http = create_audio_service("http", job, Mock())
+
+        self.assertIsNotNone(http.cached_clip("Dia duit", voice))
+        self.assertIsNone(browser.cached_clip("Dia duit", voice))
+        self.assertIsNone(default_http.cached_clip("Dia duit", voice))
+
+    def test_server_error_returns_none(self):
+        """Test a failed request is reported instead of raised"""
+        from services import HttpAudioService
+
+        observer = Mock(spec=ProgressObserver)
+        service = HttpAudioService(observer, endpoint=self.server.url + "/missing")
+        service.setup()
+        try:
+            with patch.object(
+                service.session, "post", side_effect=requests.ConnectionError("down")
+            ):
+                voice = VoiceConfig(dialect="Kerry", gender="Male")
+                result = service.generate_audio("Sea.", voice, self.out_dir)
+
+            self.assertIsNone(result)
+            observer.on_error.assert_called_once()
+        finally:
+            service.cleanup()
+
+    def test_unexpected_json_returns_none(self):
+        """Test a response that is JSON but not a synthesis fails the line"""
+        from services import HttpAudioService
+
+        observer = Mock(spec=ProgressObserver)
+        service = HttpAudioService(observer, endpoint=self.server.url)
+        service.setup()
+        voice = VoiceConfig(dialect="Kerry", gender="Male")
+        try:
+            for body in (["audio"], "audio", {"audioContent": 5}):
+                response = Mock(json=Mock(return_value=body))
+                with patch.object(service.session, "post", return_value=response):
+                    self.assertIsNone(
+                        service.generate_audio("Sea.", voice, self.out_dir)
+                    )
+        finally:
+            service.cleanup()
+
+        self.assertEqual(observer.on_error.call_count, 3)
+
+    def test_core_selects_backend(self):
+        """Test run_dubbing_process backends map to the right service"""
+        from dubbing_core.core import create_audio_service
+        from services import HttpAudioService
+
+        job = DubbingJob.from_paths("/v/video.mp4", "e.srt", "g.srt", "out.mp4")
+        with patch("dubbing_core.core.default_cache_dir", return_value=self.out_dir):
+            http = create_audio_service(
+                "http", job, Mock(), synthesis_url=self.server.url
+            )
+            browser = create_audio_service("browser", job, Mock())
+
+            with self.assertRaises(ValueError):
+                create_audio_service("carrier-pigeon", job, Mock())
+
+        self.assertIsInstance(http, HttpAudioService)
+        self.assertEqual(http.endpoint, self.server.url)
+        self.assertIsInstance(browser, AbairAudioService)
+
+    def test_core_concurrency_reaches_services(self):
+        """Test the concurrency option sizes the audio service and orchestrator"""
+        from dubbing_core.core import create_orchestrator
+        from services import HttpAudioService, PooledAbairAudioService
+
+        job = DubbingJob.from_paths("/v/video.mp4", "e.srt", "g.srt", "out.mp4")
+        with patch(
+            "dubbing_core.core.default_cache_dir", return_value=self.out_dir
+        ), patch("services.abair_pool.max_sessions_for_memory", return_value=8):
+            pooled = create_orchestrator(job, concurrency=3)
+            http = create_orchestrator(job, audio_backend="http", concurrency=3)
+            single = create_orchestrator(job)
+
+        self.assertIsInstance(pooled.audio_service, PooledAbairAudioService)
+        self.assertEqual(pooled.audio_service.max_concurrency, 3)
+        self.assertEqual(pooled.concurrency, 3)
+        self.assertIsInstance(http.audio_service, HttpAudioService)
+        self.assertEqual(http.audio_service.max_concurrency, 3)
+        self.assertIsInstance(single.audio_service, AbairAudioService)
+        self.assertEqual(single.concurrency, 1)
+
+    def test_core_passes_orchestration_options(self):
+        """Test every orchestration option can be chosen through the core"""
+        from dubbing_core.core import create_orchestrator
+        from services.request_packer import RequestPacker
+
+        job = DubbingJob.from_paths("/v/video.mp4", "e.srt", "g.srt", "out.mp4")
+        with patch("dubbing_core.core.default_cache_dir", return_value=self.out_dir):
+            orchestrator = create_orchestrator(
+                job,
+                readiness_mode=True,
+                batch_by_voice=True,
+                pack_lines=True,
+                lookahead=5,
+                overlap_policy="mix",
+            )
+            with patch("services.abair_pool.max_sessions_for_memory", return_value=8):
+                pooled = create_orchestrator(job, concurrency=2, readiness_mode=True)
+
+        self.assertTrue(orchestrator.audio_service.readiness_mode)
+        self.assertTrue(orchestrator.batch_by_voice)
+        self.assertIsInstance(orchestrator.request_packer, RequestPacker)
+        self.assertEqual(orchestrator.lookahead, 5)
+        self.assertEqual(orchestrator.overlap_policy, "mix")
+        self.assertTrue(
+            pooled.audio_service.create_session(self.out_dir).readiness_mode
+        )
+
+
+class TestAdaptiveRateLimiter(unittest.TestCase):
+    """Test AdaptiveRateLimiter"""
+
+    def test_additive_increase_and_multiplicative_decrease(self):
+        """Test healthy responses speed up and failures back off"""
+        from services.rate_limiter import AdaptiveRateLimiter
+
+        limiter = AdaptiveRateLimiter(1.0, increase_step=0.5, max_rate=2.0)
+        limiter.record_success(1.0)
+        limiter.record_success(1.0)
+        limiter.record_success(1.0)
+        self.assertEqual(limiter.rate, 2.0)
+
+        limiter.record_failure()
+        self.assertEqual(limiter.rate, 1.0)
+
+    def test_slow_response_backs_off(self):
+        """Test a response far slower than the baseline counts as a slowdown"""
+        from services.rate_limiter import AdaptiveRateLimiter
+
+        limiter = AdaptiveRateLimiter(1.0, increase_step=0.0, slow_factor=2.0)
+        limiter.record_success(1.0)
+        limiter.record_success(5.0)
+
+        self.assertEqual(limiter.rate, 0.5)
+        self.assertEqual(limiter.stats()["slowdowns"], 1)
+
+    def test_reserve_spaces_requests(self):
+        """Test consecutive reservations are spaced by 1 / rate"""
+        from services.rate_limiter import AdaptiveRateLimiter
+
+        limiter = AdaptiveRateLimiter(10.0, max_rate=10.0)
+        with patch("services.rate_limiter.time.monotonic", return_value=100.0):
+            limiter._next_slot = 100.0
+            delays = [limiter.reserve() for _ in range(3)]
+
+        for delay, expected in zip(delays, [0.0, 0.1, 0.2]):
+            self.assertAlmostEqual(delay, expected)
+
+    def test_rate_reported_to_observer(self):
+        """Test failures and the final report reach the observer"""
+        from services.rate_limiter import AdaptiveRateLimiter
+
+        observer = Mock(spec=ProgressObserver)
+        limiter = AdaptiveRateLimiter(1.0, observer=observer)
+        limiter.record_failure()
+
+        stage, stats = observer.on_stats.call_args[0]
+        self.assertEqual(stage, "Rate limiter")
+        self.assertEqual(stats["rate_per_sec"], 0.5)
+
+    def test_orchestrator_feeds_outcomes_to_limiter(self):
+        """Test the orchestrator paces requests through the limiter"""
+        from services.dubbing_orchestrator import DubbingOrchestrator
+        from services.retry_queue import RetryQueue
+
+        limiter = Mock()
+        service = ClipAudioService(fail_texts={"Dia duit 1"})
+        orchestrator = DubbingOrchestrator(
+            service,
+            Mock(),
+            Mock(),
+            Mock(spec=ProgressObserver),
+            rate_limiter=limiter,
+            retry_queue=RetryQueue(max_retries=0),
+        )
+        with tempfile.TemporaryDirectory() as out_dir:
+            orchestrator._generate_dub_track(make_segments(3), 5.0, Path(out_dir))
+
+        self.assertEqual(limiter.acquire.call_count, 3)
+        self.assertEqual(limiter.record_success.call_count, 2)
+        self.assertEqual(limiter.record_failure.call_count, 1)
+
+    def test_cache_hits_bypass_limiter(self):
+        """Test cached clips are neither paced nor fed to the limiter"""
+        from services.dubbing_orchestrator import DubbingOrchestrator
+
+        segments = make_segments(6)
+        for concurrency in (1, 2):
+            with tempfile.TemporaryDirectory() as out_dir:
+                out_dir = Path(out_dir)
+                service = ClipAudioService(concurrency=concurrency)
+                service.cache = AudioClipCache(out_dir / "cache")
+                for segment in segments[:3]:
+                    voice = VoiceConfig(
+                        "Kerry", "Male" if segment.has_male_marker() else "Female"
+                    )
+                    path = service.generate_audio(segment.irish_text, voice, out_dir)
+                    service.cache.put(
+                        service.cache.make_key(segment.irish_text, voice), path
+                    )
+                service.generate_calls = []
+
+                limiter = Mock(aacquire=AsyncMock())
+                orchestrator = DubbingOrchestrator(
+                    service,
+                    Mock(),
+                    Mock(),
+                    Mock(spec=ProgressObserver),
+                    concurrency=concurrency,
+                    rate_limiter=limiter,
+                )
+                orchestrator._generate_dub_track(segments, 10.0, out_dir)
+
+            self.assertEqual(
+                [text for text, _ in service.generate_calls],
+                [segment.irish_text for segment in segments[3:]],
+            )
+            acquire = limiter.aacquire if concurrency > 1 else limiter.acquire
+            self.assertEqual(acquire.call_count, 3)
+            self.assertEqual(limiter.record_success.call_count, 3)
+            self.assertEqual(service.cache.stats()["hits"], 3)
+            self.assertEqual(service.cache.stats()["misses"], 0)
+
+
+class TestRetryAndCircuitBreaker(unittest.TestCase):
+    """Test deferred retries and the circuit breaker"""
+
+    def test_retry_backoff_doubles_and_caps(self):
+        """Test exponential backoff and the retry limit"""
+        from services.retry_queue import RetryQueue
+
+        queue = RetryQueue(max_retries=3, base_delay_sec=2, max_delay_sec=5)
+        self.assertEqual([queue.backoff(n) for n in (1, 2, 3)], [2, 4, 5])
+        self.assertTrue(queue.push("a", retry=3))
+        self.assertFalse(queue.push("b", retry=4))
+
+    def test_retry_queue_pops_in_due_order(self):
+        """Test items come out when due, earliest first"""
+        from services.retry_queue import RetryQueue
+
+        queue = RetryQueue(max_retries=2, base_delay_sec=1)
+        with patch("services.retry_queue.time.sleep") as sleep:
+            queue.push("late", retry=2)
+            queue.push("early", retry=1)
+            self.assertEqual(queue.pop(), ("early", 1))
+            self.assertEqual(queue.pop(), ("late", 2))
+            self.assertIsNone(queue.pop())
+        self.assertEqual(sleep.call_count, 2)
+
+    def test_breaker_opens_and_half_opens(self):
+        """Test the circuit opens at the threshold and lets one trial through"""
+        from services.circuit_breaker import CircuitBreaker
+
+        observer = Mock(spec=ProgressObserver)
+        breaker = CircuitBreaker(
+            failure_threshold=2, cooldown_sec=10, observer=observer
+        )
+        with patch("services.circuit_breaker.time.monotonic", return_value=100):
+            breaker.record_failure()
+            self.assertEqual(breaker.reserve(), 0)
+            breaker.record_failure()
+            self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+            self.assertEqual(breaker.reserve(), 10)
+        observer.on_stats.assert_called_once()
+
+        with patch("services.circuit_breaker.time.monotonic", return_value=111):
+            self.assertEqual(breaker.reserve(), 0)  # Trial request
+            self.assertGreater(breaker.reserve(), 0)  # Others wait for it
+            breaker.record_failure()
+            self.assertEqual(breaker.cooldown_sec, 20)
+            self.assertEqual(breaker.reserve(), 20)
+
+        with patch("services.circuit_breaker.time.monotonic", return_value=132):
+            self.assertEqual(breaker.reserve(), 0)
+            breaker.record_success()
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        self.assertEqual(breaker.cooldown_sec, 10)
+
+    def test_failed_segment_is_patched_into_its_slot(self):
+        """Test a retried clip lands where it would have gone first time"""
+        from services.dubbing_orchestrator import DubbingOrchestrator
+        from services.retry_queue import RetryQueue
+
+        class FlakyAudioService(ClipAudioService):
+            def generate_audio(self, text, voice, output_dir):
+                if text == "Dia duit 1" and text not in self.fail_texts:
+                    self.fail_texts.add(text)
+                    return None
+                self.fail_texts.discard(text)
+                return super().generate_audio(text, voice, output_dir)
+
+        segments = make_segments(4, spacing=2.0)
+        results = []
+        observer = Mock(spec=ProgressObserver)
+        with tempfile.TemporaryDirectory() as out_dir:
+            for service in (ClipAudioService(), FlakyAudioService()):
+                orchestrator = DubbingOrchestrator(
+                    service,
+                    Mock(),
+                    Mock(),
+                    observer,
+                    segment_delay_sec=0,
+                    retry_queue=RetryQueue(base_delay_sec=0),
+                )
+                with patch("services.dubbing_orchestrator.random.choice") as choice:
+                    choice.side_effect = lambda voices: voices[0]
+                    results.append(
+                        orchestrator._generate_dub_track(segments, 10.0, Path(out_dir))
+                    )
+
+        (clean_track, clean_subs), (retried_track, retried_subs) = results
+        self.assertEqual(len(retried_track), len(clean_track))
+        self.assertGreater(retried_track[2000:2350].rms, 0)  # Retried clip
+        self.assertEqual(retried_track[2400:3990].rms, 0)  # Then silence
+        self.assertAlmostEqual(retried_track.rms, clean_track.rms, delta=5)
+        self.assertEqual(retried_subs, clean_subs)
+        self.assertEqual([s.index for s in retried_subs], [1, 2, 3, 4])
+        observer.on_stats.assert_any_call(
+            "Retries", {"failed": 1, "recovered": 1, "truncated": 0, "abandoned": 0}
+        )
+
+
 class TestSubtitleService(unittest.TestCase):
     """Test SubtitleService"""
 
@@ -199,6 +1546,1074 @@ class MockAudioService:
         return None  # Return None to simulate failure
 
 
+class ClipAudioService(AudioService):
+    """Audio service writing a WAV tone whose length depends on the text"""
+
+    def __init__(self, concurrency=1, ms_per_char=40, fail_texts=()):
+        self.concurrency = concurrency
+        self.ms_per_char = ms_per_char
+        self.fail_texts = set(fail_texts)
+        self.generate_calls = []
+
+    @property
+    def max_concurrency(self):
+        return self.concurrency
+
+    def setup(self):
+        pass
+
+    def cleanup(self):
+        pass
+
+    def generate_audio(self, text, voice, output_dir):
+        self.generate_calls.append((text, voice))
+        if text in self.fail_texts:
+            return None
+        frequency = 300 if voice.gender == "Male" else 600
+        clip = Sine(frequency).to_audio_segment(duration=self.ms_per_char * len(text))
+        path = Path(output_dir) / f"clip_{uuid.uuid4().hex}.wav"
+        clip.export(str(path), format="wav")
+        return path
+
+
+def make_segments(count, spacing=1.0, text="Dia duit"):
+    """Build evenly spaced segments, every third one marked male"""
+    return [
+        Segment(
+            start=i * spacing,
+            end=i * spacing + spacing * 0.8,
+            english_text=f"Line {i}" + ("#" if i % 3 == 0 else ""),
+            irish_text=f"{text} {i}",
+            index=i + 1,
+        )
+        for i in range(count)
+    ]
+
+
+class TestAsyncAudioService(unittest.TestCase):
+    """Test the asynchronous AudioService API and orchestrator path"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.out_dir = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_agenerate_many_preserves_order_and_bounds_concurrency(self):
+        """Test results come back in request order within the limit"""
+        service = ClipAudioService(concurrency=8)
+        in_flight = []
+        peak = []
+        original = service.generate_audio
+
+        def tracked(text, voice, output_dir):
+            in_flight.append(text)
+            peak.append(len(in_flight))
+            time.sleep(0.01)
+            in_flight.remove(text)
+            return original(text, voice, output_dir)
+
+        service.generate_audio = tracked
+        voice = VoiceConfig(dialect="Kerry", gender="Female")
+        requests_ = [("a" * (i + 1), voice) for i in range(10)]
+
+        paths = asyncio.run(service.agenerate_many(requests_, self.out_dir, 3))
+
+        lengths = [len(AudioSegment.from_file(str(p))) for p in paths]
+        self.assertEqual(lengths, [40 * (i + 1) for i in range(10)])
+        self.assertLessEqual(max(peak), 3)
+
+    def test_async_orchestrator_matches_sequential_track(self):
+        """Test the concurrent path builds the same track as the serial one"""
+        from services.dubbing_orchestrator import DubbingOrchestrator
+        from services.retry_queue import RetryQueue
+
+        # Clips run longer than the spacing, so later segments lag and skip
+        segments = make_segments(12, spacing=0.3, text="Líne fhada anseo")
+        segments[4].irish_text = "   "
+        results = []
+        for concurrency in (1, 4):
+            service = ClipAudioService(concurrency=4, fail_texts={"Líne fhada anseo 7"})
+            orchestrator = DubbingOrchestrator(
+                service,
+                Mock(),
+                Mock(),
+                Mock(spec=ProgressObserver),
+                segment_delay_sec=0,
+                concurrency=concurrency,
+                retry_queue=RetryQueue(base_delay_sec=0),
+            )
+            results.append(
+                orchestrator._generate_dub_track(segments, 10.0, self.out_dir)
+            )
+
+        (serial_track, serial_segments), (async_track, async_segments) = results
+        self.assertEqual(serial_track.raw_data, async_track.raw_data)
+        self.assertEqual(serial_segments, async_segments)
+        self.assertLess(len(serial_segments), 10)
+
+    def test_out_of_order_completion_gives_sequential_track(self):
+        """Test clips finishing in any order are placed as the serial path does"""
+        from services.dubbing_orchestrator import DubbingOrchestrator
+        from services.retry_queue import RetryQueue
+
+        segments = make_segments(16, spacing=0.5, text="Líne")
+        segments[9].irish_text = "Líne" + " fhada" * 16 + " 9"  # Later lines lag
+        shuffled = list(range(16))
+        random.Random(7).shuffle(shuffled)
+        orderings = {
+            "reversed": lambda n: 0.002 * (16 - n),
+            "shuffled": lambda n: 0.002 * shuffled[n],
+        }
+
+        def run(delay=None, **options):
+            service = ClipAudioService(concurrency=8, fail_texts={"Líne 5"})
+            if delay is not None:
+                original = service.generate_audio
+
+                def generate(text, voice, output_dir):
+                    time.sleep(delay(int(text.split()[-1])))
+                    return original(text, voice, output_dir)
+
+                service.generate_audio = generate
+            observer = Mock(spec=ProgressObserver)
+            orchestrator = DubbingOrchestrator(
+                service,
+                Mock(),
+                Mock(),
+                observer,
+                segment_delay_sec=0,
+                retry_queue=RetryQueue(base_delay_sec=0),
+                **options,
+            )
+            track, subtitles = orchestrator._generate_dub_track(
+                segments, 10.0, self.out_dir
+            )
+            return observer, track, subtitles
+
+        _, serial_track, serial_subtitles = run()
+        self.assertLess(len(serial_subtitles), 15)
+        for name, delay in orderings.items():
+            observer, track, subtitles = run(delay, concurrency=8, lookahead=16)
+
+            self.assertEqual(track.raw_data, serial_track.raw_data, name)
+            self.assertEqual(subtitles, serial_subtitles, name)
+            stats = dict(c[0] for c in observer.on_stats.call_args_list)
+            self.assertGreater(stats["Prefetch"]["out_of_order"], 0, name)
+
+
+class TestRequestCoalescing(unittest.TestCase):
+    """Test that repeated lines are synthesized once per job"""
+
+    def run_job(self, **options):
+        from services.dubbing_orchestrator import DubbingOrchestrator
+
+        segments = make_segments(9, spacing=2.0)
+        for i, segment in enumerate(segments):
+            segment.irish_text = ["Sea.", "Go raibh maith agat", " Sea. "][i % 3]
+
+        service = ClipAudioService(concurrency=4)
+        observer = Mock(spec=ProgressObserver)
+        orchestrator = DubbingOrchestrator(
+            service, Mock(), Mock(), observer, segment_delay_sec=0, **options
+        )
+        with tempfile.TemporaryDirectory() as out_dir:
+            track, subtitles = orchestrator._generate_dub_track(
+                segments, 20.0, Path(out_dir)
+            )
+        return service, observer, track, subtitles
+
+    def test_duplicates_share_one_synthesis(self):
+        """Test serial, async and batch paths coalesce identically"""
+        results = [
+            self.run_job(),
+            self.run_job(concurrency=4),
+            self.run_job(batch_by_voice=True),
+        ]
+        serial_track = results[0][2]
+
+        for service, observer, track, subtitles in results:
+            # "Sea." and " Sea. " share a clip once whitespace is normalized;
+            # segments 0, 3 and 6 are male, giving "Sea." in both voices
+            distinct = {(" ".join(t.split()), v) for t, v in service.generate_calls}
+            self.assertEqual(len(service.generate_calls), len(distinct))
+            self.assertEqual(len(distinct), 3)
+            self.assertEqual(len(subtitles), 9)
+            self.assertEqual(track.raw_data, serial_track.raw_data)
+            observer.on_stats.assert_any_call(
+                "Deduplication", {"segments": 9, "syntheses": 3, "coalesced": 6}
+            )
+
+    def test_failed_synthesis_is_not_shared_with_later_duplicates(self):
+        """Test a failure is retried by the next duplicate, not reused"""
+        from services.dubbing_orchestrator import _ClipCoalescer, _PlannedSegment
+
+        coalescer = _ClipCoalescer()
+        planned = _PlannedSegment(
+            0, make_segments(1)[0], VoiceConfig("Kerry", "Female"), 1.0
+        )
+        clip = AudioSegment.silent(duration=10)
+        results = iter([None, clip])
+
+        self.assertIsNone(coalescer.fetch(planned, lambda: next(results)))
+        self.assertIs(coalescer.fetch(planned, lambda: next(results)), clip)
+        self.assertIs(coalescer.fetch(planned, lambda: None), clip)
+        self.assertEqual(coalescer.syntheses, 2)
+
+
+class TestLookaheadPrefetch(unittest.TestCase):
+    """Test synthesis running a bounded window ahead of track assembly"""
+
+    def test_prefetch_matches_serial_track_within_window(self):
+        """Test prefetching never runs more than `lookahead` segments ahead"""
+        from services.dubbing_orchestrator import DubbingOrchestrator
+
+        segments = make_segments(10)
+        results = []
+        for lookahead in (0, 3):
+            service = ClipAudioService()
+            observer = Mock(spec=ProgressObserver)
+            placing = [0]
+            ahead = []
+            observer.on_progress.side_effect = (
+                lambda current, total, stage, message: placing.__setitem__(0, current)
+            )
+            original = service.generate_audio
+
+            def tracked(text, voice, output_dir):
+                ahead.append(int(text.split()[-1]) - (placing[0] - 1))
+                time.sleep(0.005)
+                return original(text, voice, output_dir)
+
+            service.generate_audio = tracked
+            orchestrator = DubbingOrchestrator(
+                service,
+                Mock(),
+                Mock(),
+                observer,
+                segment_delay_sec=0,
+                lookahead=lookahead,
+            )
+            with tempfile.TemporaryDirectory() as out_dir:
+                results.append(
+                    orchestrator._generate_dub_track(segments, 10.0, Path(out_dir))
+                )
+            self.assertLessEqual(max(ahead), lookahead)
+
+        self.assertGreater(max(ahead), 0)
+        (serial_track, serial_segments), (track, subtitles) = results
+        self.assertEqual(serial_track.raw_data, track.raw_data)
+        self.assertEqual(serial_segments, subtitles)
+        prefetch = observer.on_stats.call_args_list[0][0]
+        self.assertEqual(prefetch[0], "Prefetch")
+        self.assertEqual(prefetch[1]["lookahead"], 3)
+        self.assertLessEqual(prefetch[1]["max_buffered"], 4)
+
+    def test_skipped_segments_never_exceed_service_concurrency(self):
+        """Test a synthesis dropped for lag keeps its slot until it returns"""
+        from services.dubbing_orchestrator import DubbingOrchestrator
+
+        # Cues far shorter than their clips, so the track lags and skips
+        segments = make_segments(30, spacing=0.2, text="Dia duit a chara")
+        service = ClipAudioService()
+        lock = threading.Lock()
+        active = [0, 0]  # Running, peak
+        original = service.generate_audio
+
+        def tracked(text, voice, output_dir):
+            with lock:
+                active[0] += 1
+                active[1] = max(active)
+            try:
+                time.sleep(0.02)
+                return original(text, voice, output_dir)
+            finally:
+                with lock:
+                    active[0] -= 1
+
+        service.generate_audio = tracked
+        observer = Mock(spec=ProgressObserver)
+        orchestrator = DubbingOrchestrator(
+            service, Mock(), Mock(), observer, segment_delay_sec=0, lookahead=4
+        )
+        with tempfile.TemporaryDirectory() as out_dir:
+            orchestrator._generate_dub_track(segments, 10.0, Path(out_dir))
+
+        skipped = [
+            c for c in observer.on_progress.call_args_list if "(lag)" in (c[0][3] or "")
+        ]
+        self.assertGreater(len(skipped), 0)
+        self.assertEqual(active[1], 1)
+
+    def test_coalescer_forgets_clip_after_last_expected_use(self):
+        """Test shared clips are released once every duplicate has taken one"""
+        from collections import Counter
+        from services.dubbing_orchestrator import _ClipCoalescer, _PlannedSegment
+
+        planned = _PlannedSegment(
+            0, make_segments(1)[0], VoiceConfig("Kerry", "Female"), 1.0
+        )
+        coalescer = _ClipCoalescer(Counter({_ClipCoalescer.key(planned): 2}))
+        clip = AudioSegment.silent(duration=10)
+
+        self.assertIs(coalescer.fetch(planned, lambda: clip), clip)
+        self.assertEqual(len(coalescer._clips), 1)
+        self.assertIs(coalescer.fetch(planned, lambda: None), clip)
+        self.assertEqual(coalescer._clips, {})
+        self.assertEqual(coalescer.syntheses, 1)
+
+
+class TestCheckpointResume(unittest.TestCase):
+    """Test checkpointing finished segments and resuming a job"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.out_dir = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_manifest_survives_torn_write(self):
+        """Test a reopened manifest keeps complete entries only"""
+        from services.job_manifest import JobManifest
+
+        segments = make_segments(3)
+        voice = VoiceConfig("Kerry", "Male")
+        clip = Sine(440).to_audio_segment(duration=200)
+        manifest = JobManifest(self.out_dir / "checkpoint")
+        manifest.open()
+        manifest.record(segments[0], voice, clip)
+        manifest.record(segments[1], voice, clip)
+        manifest.close()
+        with open(manifest.path, "a", encoding="utf-8") as f:
+            f.write('{"start": 2.0, "end": 2.8, "irish_te')
+
+        resumed = JobManifest(self.out_dir / "checkpoint")
+        self.assertEqual(resumed.open(resume=True), 2)
+        entry = resumed.lookup(segments[1])
+        self.assertEqual(entry.voice, voice)
+        self.assertEqual(resumed.load_clip(entry).raw_data, clip.raw_data)
+        self.assertIsNone(resumed.lookup(segments[2]))
+        resumed.record(segments[2], voice, clip)
+        resumed.close()
+
+        self.assertEqual(JobManifest(resumed.directory).open(resume=True), 3)
+        self.assertEqual(JobManifest(resumed.directory).open(), 0)
+
+    def test_resumed_job_only_synthesizes_missing_segments(self):
+        """Test an interrupted job resumes to the same track"""
+        from services.dubbing_orchestrator import DubbingOrchestrator
+        from services.job_manifest import JobManifest
+        from services.retry_queue import RetryQueue
+
+        segments = make_segments(8)
+
+        def run(service, manifest=None, **options):
+            orchestrator = DubbingOrchestrator(
+                service,
+                Mock(),
+                Mock(),
+                Mock(spec=ProgressObserver),
+                segment_delay_sec=0,
+                retry_queue=RetryQueue(max_retries=0),
+                **options,
+            )
+            return orchestrator._generate_dub_track(
+                segments, 10.0, self.out_dir, manifest
+            )
+
+        expected_track, expected_subtitles = run(ClipAudioService())
+
+        # The browser dies while synthesizing the sixth segment
+        crashing = ClipAudioService()
+        original = crashing.generate_audio
+
+        def generate(text, voice, output_dir):
+            if len(crashing.generate_calls) == 5:
+                raise RuntimeError("chrome not reachable")
+            return original(text, voice, output_dir)
+
+        crashing.generate_audio = generate
+        manifest = JobManifest(self.out_dir / "checkpoint")
+        manifest.open()
+        with self.assertRaises(RuntimeError):
+            run(crashing, manifest)
+        manifest.close()
+        crashed = manifest.directory
+
+        for n, options in enumerate(({}, {"concurrency": 4})):
+            service = ClipAudioService(concurrency=4)
+            checkpoint = self.out_dir / f"resume_{n}"
+            manifest = JobManifest(shutil.copytree(crashed, checkpoint))
+            self.assertEqual(manifest.open(resume=True), 5)
+            track, subtitles = run(service, manifest, **options)
+            manifest.close()
+
+            self.assertEqual(
+                [text for text, _ in service.generate_calls],
+                ["Dia duit 5", "Dia duit 6", "Dia duit 7"],
+            )
+            self.assertEqual(track.raw_data, expected_track.raw_data)
+            self.assertEqual(subtitles, expected_subtitles)
+
+    def test_redub_only_synthesizes_corrected_lines(self):
+        """Test corrected subtitles reuse unchanged and moved lines"""
+        from services.dubbing_orchestrator import DubbingOrchestrator
+        from services.job_manifest import JobManifest
+        from services.retry_queue import RetryQueue
+
+        def run(service, segments, manifest=None, **options):
+            observer = Mock(spec=ProgressObserver)
+            orchestrator = DubbingOrchestrator(
+                service,
+                Mock(),
+                Mock(),
+                observer,
+                segment_delay_sec=0,
+                retry_queue=RetryQueue(max_retries=0),
+                **options,
+            )
+            track, subtitles = orchestrator._generate_dub_track(
+                segments, 10.0, self.out_dir, manifest
+            )
+            return observer, track, subtitles
+
+        manifest = JobManifest(self.out_dir / "checkpoint")
+        manifest.open()
+        run(ClipAudioService(), make_segments(8), manifest)
+        manifest.close()
+        first_run = manifest.directory
+
+        corrected = make_segments(8)
+        corrected[2].irish_text = "Dia dhuit 2"  # Changed
+        corrected[4].start, corrected[4].end = 4.1, 4.9  # Retimed
+        del corrected[6]  # Removed
+        corrected.append(Segment(8.0, 8.8, "Line 8", "Slán 8", 9))  # Added
+        _, expected_track, expected_subtitles = run(ClipAudioService(), corrected)
+
+        for n, options in enumerate(({}, {"concurrency": 4})):
+            service = ClipAudioService(concurrency=4)
+            checkpoint = self.out_dir / f"redub_{n}"
+            manifest = JobManifest(shutil.copytree(first_run, checkpoint))
+            manifest.open(resume=True)
+            observer, track, subtitles = run(service, corrected, manifest, **options)
+            manifest.close()
+
+            self.assertEqual(
+                [text for text, _ in service.generate_calls],
+                ["Dia dhuit 2", "Slán 8"],
+            )
+            self.assertEqual(track.raw_data, expected_track.raw_data)
+            self.assertEqual(subtitles, expected_subtitles)
+            observer.on_stats.assert_any_call(
+                "Checkpoint",
+                {
+                    "unchanged": 5,
+                    "retimed": 1,
+                    "changed": 1,
+                    "added": 1,
+                    "removed": 2,
+                    "recorded": 2,
+                },
+            )
+
+            # Only the corrected job's entries and clips are kept
+            self.assertEqual(JobManifest(checkpoint).open(resume=True), 8)
+            self.assertEqual(len(list((checkpoint / "clips").iterdir())), 8)
+
+
+class SentenceAudioService(ClipAudioService):
+    """Clip service that pauses between sentences like a real synthesizer"""
+
+    def generate_audio(self, text, voice, output_dir):
+        self.generate_calls.append((text, voice))
+        clip = AudioSegment.silent(duration=0, frame_rate=44100)
+        for n, sentence in enumerate(text.replace(". ", ".|").split("|")):
+            if n:
+                clip += AudioSegment.silent(duration=300, frame_rate=44100)
+            clip += Sine(600).to_audio_segment(duration=40 * len(sentence))
+        path = Path(output_dir) / f"clip_{uuid.uuid4().hex}.wav"
+        clip.export(str(path), format="wav")
+        return path
+
+
+class TestRequestPacking(unittest.TestCase):
+    """Test packing short lines into one synthesis request"""
+
+    def run_job(self, service, **options):
+        from services.dubbing_orchestrator import DubbingOrchestrator
+        from services.request_packer import RequestPacker
+
+        segments = make_segments(6, spacing=3.0)
+        for segment in segments:
+            segment.english_text = segment.english_text.rstrip("#")  # One voice
+        observer = Mock(spec=ProgressObserver)
+        orchestrator = DubbingOrchestrator(
+            service,
+            Mock(),
+            Mock(),
+            observer,
+            segment_delay_sec=0,
+            request_packer=RequestPacker(max_chars=40),
+            **options,
+        )
+        with tempfile.TemporaryDirectory() as out_dir:
+            track, subtitles = orchestrator._generate_dub_track(
+                segments, 20.0, Path(out_dir)
+            )
+        return observer, track, subtitles
+
+    def test_pack_groups_short_same_voice_lines(self):
+        """Test grouping respects voice changes, the budget and long lines"""
+        from services.request_packer import RequestPacker
+
+        female = VoiceConfig("Kerry", "Female")
+        male = VoiceConfig("Kerry", "Male")
+        packer = RequestPacker(max_chars=20, max_line_chars=10)
+        requests = [
+            ("Sea", female),
+            ("Tá", female),
+            ("Níl", male),
+            ("Cinnte", male),
+            ("Abair é", male),
+            ("Líne i bhfad ró-fhada", male),
+            ("Ceart", male),
+        ]
+
+        self.assertEqual(packer.pack(requests), [[0, 1], [2, 3], [4], [5], [6]])
+        self.assertEqual(packer.join(["Sea", "Tá  sé!"]), "Sea. Tá sé!")
+
+    def test_split_on_silences(self):
+        """Test a clip is cut at its pauses into the requested pieces"""
+        from services.audio_dsp import split_on_silences
+
+        tone = Sine(440).to_audio_segment(duration=400)
+        gap = AudioSegment.silent(duration=300, frame_rate=44100)
+        pieces = split_on_silences(tone + gap + tone + gap + tone, 3)
+
+        self.assertEqual(len(pieces), 3)
+        for piece in pieces:
+            self.assertAlmostEqual(len(piece), 450, delta=60)
+        self.assertIsNone(split_on_silences(tone + gap + tone, 3))
+
+    def test_packed_job_makes_fewer_requests(self):
+        """Test serial, async and batch paths share packed requests"""
+        for options in ({}, {"concurrency": 4}, {"batch_by_voice": True}):
+            service = SentenceAudioService(concurrency=4)
+            observer, track, subtitles = self.run_job(service, **options)
+
+            # Six 11-character lines fit three to a 40-character request
+            self.assertEqual(len(service.generate_calls), 2, options)
+            self.assertEqual(len(subtitles), 6)
+            self.assertGreater(track[3000:3400].rms, 0)
+            observer.on_stats.assert_any_call(
+                "Request packing",
+                {"packed_segments": 6, "packed_requests": 2, "split_failures": 0},
+            )
+
+    def test_unsplittable_audio_falls_back_to_single_requests(self):
+        """Test lines are synthesized alone when the pauses are missing"""
+        service = ClipAudioService()
+        observer, track, subtitles = self.run_job(service)
+
+        self.assertEqual(len(service.generate_calls), 2 + 6)
+        self.assertEqual(len(subtitles), 6)
+        observer.on_stats.assert_any_call(
+            "Request packing",
+            {"packed_segments": 6, "packed_requests": 2, "split_failures": 2},
+        )
+
+    def test_skipped_member_releases_its_piece(self):
+        """Test a pack whose middle line is skipped frees its pieces"""
+        from services import dubbing_orchestrator
+        from services.request_packer import RequestPacker
+
+        # The 3.2s first line makes the second one lag past the threshold
+        segments = [
+            Segment(start, start + 1, "Line", text, index=n + 1)
+            for n, (start, text) in enumerate(
+                [(0.0, "a" * 80), (0.1, "b" * 10), (6.0, "c" * 10)]
+            )
+        ]
+        packed_requests = dubbing_orchestrator._PackedRequests
+        packers = []
+
+        def record(*args):
+            packers.append(packed_requests(*args))
+            return packers[-1]
+
+        for options in ({}, {"concurrency": 4}, {"batch_by_voice": True}):
+            service = SentenceAudioService(concurrency=4)
+            orchestrator = dubbing_orchestrator.DubbingOrchestrator(
+                service,
+                Mock(),
+                Mock(),
+                Mock(spec=ProgressObserver),
+                segment_delay_sec=0,
+                request_packer=RequestPacker(max_chars=200, max_line_chars=100),
+                **options,
+            )
+            with patch.object(
+                dubbing_orchestrator, "_PackedRequests", side_effect=record
+            ), tempfile.TemporaryDirectory() as out_dir:
+                _, subtitles = orchestrator._generate_dub_track(
+                    segments, 10.0, Path(out_dir)
+                )
+
+            self.assertEqual(len(service.generate_calls), 1, options)
+            self.assertEqual([s.irish_text[0] for s in subtitles], ["a", "c"])
+            self.assertEqual(packers[-1]._pieces, {}, options)
+
+
+class TestTimeFit(unittest.TestCase):
+    """Test fitting clips into the time before the next segment"""
+
+    def test_fit_trims_then_stretches_within_bounds(self):
+        """Test silence goes first and the tempo never exceeds max_speed"""
+        from services.time_fit import TimeFitter
+
+        silence = AudioSegment.silent(duration=300, frame_rate=44100)
+        clip = silence + Sine(440).to_audio_segment(duration=1000) + silence
+        fitter = TimeFitter(max_speed=1.3)
+
+        self.assertIs(fitter.fit(clip, 2000), clip)
+        self.assertAlmostEqual(len(fitter.fit(clip, 1200)), 1100, delta=20)
+        self.assertAlmostEqual(len(fitter.fit(clip, 1000)), 1000, delta=2)
+        self.assertAlmostEqual(len(fitter.fit(clip, 700)), 1100 / 1.3, delta=20)
+
+        stats = fitter.stats()
+        self.assertEqual(stats["clips"], 4)
+        self.assertEqual(stats["trimmed"], 3)
+        self.assertEqual(stats["stretched"], 2)
+        self.assertEqual(stats["overflowing"], 1)
+        self.assertEqual(stats["max_speed"], 1.3)
+
+    def test_fit_mode_places_lagging_segments(self):
+        """Test fitted clips keep up with the subtitles instead of skipping"""
+        from services.dubbing_orchestrator import DubbingOrchestrator
+        from services.time_fit import TimeFitter
+
+        # Every clip runs 22-27% past its one-second window
+        segments = make_segments(14, text="Líne fhada fhada anseo")
+
+        def run(**options):
+            observer = Mock(spec=ProgressObserver)
+            orchestrator = DubbingOrchestrator(
+                ClipAudioService(concurrency=4, ms_per_char=51),
+                Mock(),
+                Mock(),
+                observer,
+                segment_delay_sec=0,
+                **options,
+            )
+            with tempfile.TemporaryDirectory() as out_dir:
+                track, subtitles = orchestrator._generate_dub_track(
+                    segments, 14.0, Path(out_dir)
+                )
+            return observer, track, subtitles
+
+        _, _, subtitles = run()
+        self.assertLess(len(subtitles), 14)
+
+        _, serial_track, _ = run(time_fitter=TimeFitter())
+        for options in ({}, {"concurrency": 4}):
+            observer, track, subtitles = run(time_fitter=TimeFitter(), **options)
+
+            self.assertEqual(len(subtitles), 14)
+            self.assertEqual(track.raw_data, serial_track.raw_data)
+            self.assertLessEqual(len(track), 14000)
+            # The last line starts on time and ends with the video
+            self.assertGreater(track[13000:13100].rms, 0)
+            stats = dict(c[0] for c in observer.on_stats.call_args_list)["Time fit"]
+            self.assertEqual(stats["stretched"], 14)
+            self.assertEqual(stats["overflowing"], 0)
+            self.assertLessEqual(stats["max_speed"], 1.3)
+
+
+class TestPlacementSolver(unittest.TestCase):
+    """Test placing every clip of a track at once"""
+
+    def test_solver_drops_the_clip_that_blocks_the_rest(self):
+        """Test one long clip is skipped instead of everything after it"""
+        from services.placement import PlacementSolver
+
+        solver = PlacementSolver(max_early_ms=250)
+        placed = solver.solve(
+            [0, 500, 1000, 1500, 2000], [300, 6000, 300, 300, 300], 2500
+        )
+
+        # Placing each clip as soon as possible would skip the last three
+        self.assertEqual(placed, [0, None, 1000, 1500, 2000])
+        self.assertEqual(solver.stats()["skipped"], 1)
+
+    def test_solver_starts_clips_early_to_cut_total_drift(self):
+        """Test a long clip starts early so the clips after it lag less"""
+        from services.placement import PlacementSolver
+
+        solver = PlacementSolver(max_early_ms=250)
+        placed = solver.solve([1000, 2000, 3000], [1500, 900, 900], 2500)
+
+        # As soon as possible: [1000, 2500, 3400], 900 ms of drift in total
+        self.assertEqual(placed, [750, 2250, 3150])
+        self.assertEqual(
+            solver.stats(),
+            {
+                "clips": 3,
+                "skipped": 0,
+                "early": 1,
+                "late": 2,
+                "mean_drift_ms": 217,
+                "max_drift_ms": 250,
+            },
+        )
+
+    def test_solved_placement_in_orchestrator(self):
+        """Test the solver matches greedy placement until clips collide"""
+        from services.dubbing_orchestrator import DubbingOrchestrator
+        from services.placement import PlacementSolver
+
+        def run(segments, **options):
+            observer = Mock(spec=ProgressObserver)
+            orchestrator = DubbingOrchestrator(
+                ClipAudioService(concurrency=4),
+                Mock(),
+                Mock(),
+                observer,
+                segment_delay_sec=0,
+                **options,
+            )
+            with tempfile.TemporaryDirectory() as out_dir:
+                track, subtitles = orchestrator._generate_dub_track(
+                    segments, 10.0, Path(out_dir)
+                )
+            return observer, track, subtitles
+
+        _, greedy_track, _ = run(make_segments(8))
+        _, track, _ = run(make_segments(8), placement_solver=PlacementSolver())
+        self.assertEqual(track.raw_data, greedy_track.raw_data)
+
+        # A 4-second line lags the ones after it past the skip threshold
+        segments = make_segments(12, spacing=0.5, text="Líne")
+        segments[2].irish_text = "Líne" + " fhada" * 16 + " 2"
+        _, _, subtitles = run(segments)
+        self.assertLess(len(subtitles), 10)
+
+        for options in ({}, {"concurrency": 4}):
+            observer, track, subtitles = run(
+                segments, placement_solver=PlacementSolver(), **options
+            )
+            self.assertEqual(len(subtitles), 11)
+            self.assertNotIn(segments[2].irish_text, [s.irish_text for s in subtitles])
+            stats = dict(c[0] for c in observer.on_stats.call_args_list)
+            self.assertEqual(stats["Placement"]["skipped"], 1)
+
+        with self.assertRaises(ValueError):
+            DubbingOrchestrator(
+                Mock(),
+                Mock(),
+                Mock(),
+                overlap_policy="mix",
+                placement_solver=PlacementSolver(),
+            )
+
+
+class TestStageScheduler(unittest.TestCase):
+    """Test running setup stages concurrently"""
+
+    def test_independent_stages_overlap(self):
+        """Test stages run together and get their dependencies' results"""
+        from services.stage_scheduler import StageScheduler
+
+        # Neither stage can pass the barrier unless both run at once
+        barrier = threading.Barrier(2, timeout=5)
+        stages = StageScheduler()
+        stages.add("video", lambda: barrier.wait() or "video")
+        stages.add("browser", lambda: barrier.wait() or "browser")
+        stages.add("duration", lambda video: f"{video} duration", after=["video"])
+        results = stages.run()
+
+        self.assertEqual(results["duration"], "video duration")
+        self.assertEqual(stages.completed, {"video", "browser", "duration"})
+        self.assertEqual(set(stages.stats()), {"video", "browser", "duration", "total"})
+        with self.assertRaises(ValueError):
+            stages.add("encode", lambda: None, after=["audio"])
+
+    def test_failed_stage_stops_its_dependents(self):
+        """Test a failure is raised once running stages finish"""
+        from services.stage_scheduler import StageScheduler
+
+        ran = []
+        stages = StageScheduler()
+        stages.add("subtitles", Mock(side_effect=ValueError("bad srt")))
+        stages.add("browser", lambda: time.sleep(0.05) or ran.append("browser"))
+        stages.add("segments", lambda _: ran.append("segments"), after=["subtitles"])
+
+        with self.assertRaisesRegex(ValueError, "bad srt"):
+            stages.run()
+        self.assertEqual(ran, ["browser"])
+        self.assertEqual(stages.completed, {"browser"})
+
+
+class TestCancellation(unittest.TestCase):
+    """Test cancelling jobs and job deadlines"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.out_dir = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def make_job(self, name="video", **options):
+        video_path = self.out_dir / f"{name}.mp4"
+        video_path.touch()
+        return DubbingJob(
+            video_path, Path(__file__), Path(__file__), f"{name}_ga.mp4", **options
+        )
+
+    def make_orchestrator(self, audio, segments, video=None, **options):
+        from services.dubbing_orchestrator import DubbingOrchestrator
+        from services.retry_queue import RetryQueue
+
+        if video is None:
+            video = Mock()
+        video.get_video_duration.return_value = segments[-1].end + 1
+        subtitle = Mock()
+        subtitle.load_subtitles.side_effect = lambda eng, gael: list(segments)
+        return DubbingOrchestrator(
+            audio,
+            video,
+            subtitle,
+            Mock(spec=ProgressObserver),
+            retry_queue=RetryQueue(max_retries=0),
+            **options,
+        )
+
+    def test_token_wakes_sleepers(self):
+        """Test waits end early on cancellation, a parent's or a deadline"""
+        from services.cancellation import CancellationToken, OperationCancelled
+
+        batch = CancellationToken()
+        job = CancellationToken(parent=batch)
+        timed = CancellationToken(0.05, parent=batch)
+        with self.assertRaises(OperationCancelled):
+            timed.sleep(5)
+        self.assertEqual(timed.reason, "Deadline exceeded")
+        self.assertFalse(job.cancelled)
+
+        threading.Timer(0.05, batch.cancel, args=("Stop",)).start()
+        started = time.monotonic()
+        with self.assertRaises(OperationCancelled):
+            job.sleep(5)
+        self.assertLess(time.monotonic() - started, 1)
+        self.assertEqual(job.reason, "Stop")
+        self.assertTrue(CancellationToken(parent=batch).cancelled)
+
+    def test_cancel_interrupts_pacing_and_keeps_clips(self):
+        """Test a job waiting for the rate limiter stops within a second"""
+        from services.cancellation import CancellationToken
+        from services.job_manifest import JobManifest
+
+        segments = make_segments(5)
+        audio = ClipAudioService()
+        audio.cleanup = Mock()
+        video = Mock()
+        # Ten seconds between requests: the second clip is never reached
+        orchestrator = self.make_orchestrator(
+            audio, segments, video, segment_delay_sec=10
+        )
+        job = self.make_job()
+        cancellation = CancellationToken()
+        threading.Timer(0.2, cancellation.cancel).start()
+
+        started = time.monotonic()
+        result = orchestrator.execute(job, cancellation=cancellation)
+        self.assertLess(time.monotonic() - started, 1.5)
+        self.assertTrue(result.startswith("ERROR: Dubbing cancelled"))
+        audio.cleanup.assert_called_once()
+        video.create_dubbed_video.assert_not_called()
+        self.assertIsNone(orchestrator.cancellation)
+        self.assertEqual(JobManifest(job.checkpoint_dir).open(resume=True), 1)
+
+        # Resuming synthesizes the rest
+        audio = ClipAudioService()
+        orchestrator = self.make_orchestrator(audio, segments, segment_delay_sec=0)
+        self.assertTrue(orchestrator.execute(job, resume=True).startswith("Success"))
+        self.assertEqual(
+            [text for text, _ in audio.generate_calls],
+            [f"Dia duit {i}" for i in range(1, 5)],
+        )
+
+    def test_deadline_stops_concurrent_job(self):
+        """Test a job past its deadline stops on the asynchronous path too"""
+        from services.job_manifest import JobManifest
+
+        segments = make_segments(40)
+        audio = ClipAudioService(concurrency=2)
+        generate = audio.generate_audio
+
+        def slow_generate(text, voice, output_dir):
+            time.sleep(0.1)
+            return generate(text, voice, output_dir)
+
+        audio.generate_audio = slow_generate
+        orchestrator = self.make_orchestrator(
+            audio, segments, segment_delay_sec=0, concurrency=2
+        )
+        job = self.make_job(deadline_sec=0.5)
+
+        started = time.monotonic()
+        result = orchestrator.execute(job)
+        self.assertLess(time.monotonic() - started, 1.5)
+        self.assertIn("Deadline exceeded", result)
+        recorded = JobManifest(job.checkpoint_dir).open(resume=True)
+        self.assertTrue(0 < recorded < 40)
+
+    def test_cancelling_batch_stops_encode_and_later_jobs(self):
+        """Test a cancelled batch stops the running encode and skips the rest"""
+        from services.cancellation import CancellationToken
+
+        segments = make_segments(3)
+        audio = ClipAudioService()
+        audio.cleanup = Mock()
+        video = Mock()
+
+        def endless_encode(clip, track, output_path):
+            while True:
+                video.cancellation.sleep(0.01)
+
+        video.create_dubbed_video.side_effect = endless_encode
+        orchestrator = self.make_orchestrator(
+            audio, segments, video, segment_delay_sec=0
+        )
+        jobs = [self.make_job(f"ep{n}") for n in range(3)]
+        cancellation = CancellationToken()
+        threading.Timer(0.3, cancellation.cancel).start()
+
+        started = time.monotonic()
+        results = orchestrator.execute_many(jobs, cancellation=cancellation)
+        self.assertLess(time.monotonic() - started, 1.5)
+        for result in results:
+            self.assertTrue(result.message.startswith("ERROR: Dubbing cancelled"))
+        self.assertIn("encode_sec", results[0].timings)
+        self.assertNotIn("setup_sec", results[2].timings)
+        audio.cleanup.assert_called_once()
+        self.assertIsNone(video.cancellation)
+
+
+class TestBatchExecution(unittest.TestCase):
+    """Test dubbing several videos with one set of services"""
+
+    def test_batch_shares_services_and_encodes_during_next_job(self):
+        """Test setup runs once and a video encodes while the next job dubs"""
+        from models import JobResult
+        from services.dubbing_orchestrator import DubbingOrchestrator
+
+        audio = ClipAudioService(ms_per_char=5)
+        audio.setup = Mock()
+        audio.cleanup = Mock()
+        synthesized_at = []
+        generate = audio.generate_audio
+
+        def timed_generate(text, voice, output_dir):
+            synthesized_at.append(time.perf_counter())
+            return generate(text, voice, output_dir)
+
+        audio.generate_audio = timed_generate
+
+        encoded = {}
+
+        def encode(video, track, output_path):
+            started = time.perf_counter()
+            time.sleep(0.3)
+            encoded[output_path.name] = (started, time.perf_counter())
+
+        video = Mock()
+        video.get_video_duration.return_value = 5.0
+        video.create_dubbed_video.side_effect = encode
+        subtitle = Mock()
+        subtitle.load_subtitles.side_effect = lambda eng, gael: make_segments(4)
+        orchestrator = DubbingOrchestrator(
+            audio, video, subtitle, Mock(spec=ProgressObserver), segment_delay_sec=0
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            jobs = []
+            for name in ("ep1", "ep2", "missing", "ep3"):
+                video_path = Path(temp_dir) / f"{name}.mp4"
+                if name != "missing":
+                    video_path.touch()
+                jobs.append(
+                    DubbingJob(
+                        video_path, Path(__file__), Path(__file__), f"{name}_ga.mp4"
+                    )
+                )
+            results = orchestrator.execute_many(jobs)
+
+        audio.setup.assert_called_once()
+        audio.cleanup.assert_called_once()
+        self.assertEqual(
+            [result.succeeded for result in results], [True, True, False, True]
+        )
+        self.assertIn("Video file not found", results[2].message)
+        self.assertEqual(
+            results[0].message,
+            f"Success! Output video saved as: {jobs[0].output_path}",
+        )
+
+        # The second job synthesized while the first one was still encoding
+        started, finished = encoded["ep1_ga.mp4"]
+        self.assertTrue(any(started < t < finished for t in synthesized_at))
+
+        # Jobs sharing a folder keep their subtitle files apart
+        self.assertEqual(jobs[0].output_srt_irish.name, "ep1_ga_subtitles_irish.srt")
+
+        table = JobResult.table(results).splitlines()
+        self.assertEqual(len(table), 5)
+        self.assertTrue(table[1].startswith("ep1_ga.mp4") and table[1].endswith("ok"))
+        self.assertIn("Video file not found", table[3])
+
+    def test_failed_job_does_not_stop_batch(self):
+        """Test an encode error is reported for its job only"""
+        from services.dubbing_orchestrator import DubbingOrchestrator
+
+        video = Mock()
+        video.get_video_duration.return_value = 5.0
+        video.create_dubbed_video.side_effect = [RuntimeError("disk full"), None]
+        subtitle = Mock()
+        subtitle.load_subtitles.side_effect = lambda eng, gael: make_segments(2)
+        observer = Mock(spec=ProgressObserver)
+        orchestrator = DubbingOrchestrator(
+            ClipAudioService(ms_per_char=5),
+            video,
+            subtitle,
+            observer,
+            segment_delay_sec=0,
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            jobs = []
+            for name in ("a", "b"):
+                folder = Path(temp_dir) / name
+                folder.mkdir()
+                (folder / "video.mp4").touch()
+                jobs.append(
+                    DubbingJob(
+                        folder / "video.mp4", Path(__file__), Path(__file__), "out.mp4"
+                    )
+                )
+            results = orchestrator.execute_many(jobs)
+
+        self.assertEqual(results[0].message, "ERROR: Dubbing process failed: disk full")
+        self.assertTrue(results[1].succeeded)
+        self.assertIn("encode_sec", results[0].timings)
+        # Separate folders keep the usual subtitle names
+        self.assertEqual(jobs[1].output_srt_irish.name, "subtitles_irish.srt")
+        batch = dict(c[0] for c in observer.on_stats.call_args_list)["Batch"]
+        self.assertEqual((batch["jobs"], batch["succeeded"]), (2, 1))
+
+
 class TestServiceLifecycle(unittest.TestCase):
     """Test service lifecycle management"""
 
@@ -222,24 +2637,55 @@ class TestServiceLifecycle(unittest.TestCase):
             mock_audio, mock_video, mock_subtitle, mock_observer
         )
 
-        # Create a valid job
-        job = DubbingJob(
-            video_path=Path(__file__),  # Use this file as it exists
-            eng_srt_path=Path(__file__),
-            gael_srt_path=Path(__file__),
-            output_filename="test.mp4",
-        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Create a valid job (the checkpoint is written next to the video)
+            video_path = Path(temp_dir) / "video.mp4"
+            video_path.touch()
+            job = DubbingJob(
+                video_path=video_path,
+                eng_srt_path=Path(__file__),
+                gael_srt_path=Path(__file__),
+                output_filename="test.mp4",
+            )
 
-        # Execute (will fail due to missing files, but that's ok for lifecycle test)
-        try:
-            orchestrator.execute(job)
-        except:
-            pass
+            # Execute (will fail due to missing files, but that's ok for lifecycle test)
+            try:
+                orchestrator.execute(job)
+            except:
+                pass
 
         # Verify setup and cleanup were called
         self.assertTrue(mock_audio.setup_called)
         self.assertTrue(mock_audio.cleanup_called)
 
+    def test_cleanup_after_setup_when_other_stage_fails(self):
+        """Test a browser started alongside failed loading is still closed"""
+        from services.dubbing_orchestrator import DubbingOrchestrator
+
+        mock_audio = MockAudioService()
+        mock_subtitle = Mock()
+        mock_subtitle.load_subtitles.side_effect = ValueError("bad srt")
+        observer = Mock(spec=ProgressObserver)
+        orchestrator = DubbingOrchestrator(mock_audio, Mock(), mock_subtitle, observer)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            video_path = Path(temp_dir) / "video.mp4"
+            video_path.touch()
+            job = DubbingJob(
+                video_path=video_path,
+                eng_srt_path=Path(__file__),
+                gael_srt_path=Path(__file__),
+                output_filename="test.mp4",
+            )
+            result = orchestrator.execute(job)
+
+        self.assertEqual(result, "ERROR: Dubbing process failed: bad srt")
+        self.assertTrue(mock_audio.setup_called)
+        self.assertTrue(mock_audio.cleanup_called)
+        stages = dict(c[0] for c in observer.on_stats.call_args_list)["Setup stages"]
+        self.assertIn("audio_setup", stages)
+        self.assertIn("total", stages)
+
 
 if __name__ == "__main__":
     unittest.main()
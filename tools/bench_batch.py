@@ -0,0 +1,101 @@
+"""Benchmark a batch of episodes against dubbing them one run at a time.
+
+The services are stand-ins that sleep for scaled-down setup (browser
+start), synthesis and encode times, so only the scheduling is measured.
+
+Run from the repository root:
+    python tools/bench_batch.py --episodes 20
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pydub import AudioSegment
+
+from models import DubbingJob, JobResult, Segment
+from services import AudioService, NoOpProgressObserver
+from services.dubbing_orchestrator import DubbingOrchestrator
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--episodes", type=int, default=20)
+parser.add_argument("--segments", type=int, default=20, help="Lines per episode")
+parser.add_argument("--setup-sec", type=float, default=0.5, help="Browser start")
+parser.add_argument("--clip-sec", type=float, default=0.01, help="Per synthesis")
+parser.add_argument("--encode-sec", type=float, default=0.25, help="Per video")
+args = parser.parse_args()
+
+
+class SleepingAudioService(AudioService):
+    def setup(self):
+        time.sleep(args.setup_sec)
+
+    def cleanup(self):
+        pass
+
+    def generate_audio(self, text, voice, output_dir):
+        time.sleep(args.clip_sec)
+        path = Path(output_dir) / f"clip_{uuid.uuid4().hex}.wav"
+        AudioSegment.silent(duration=500).export(str(path), format="wav")
+        return path
+
+
+class SleepingVideoService:
+    def load_video(self, video_path):
+        return video_path
+
+    def get_video_duration(self, video):
+        return float(args.segments)
+
+    def create_dubbed_video(self, video, audio_track, output_path):
+        time.sleep(args.encode_sec)
+
+
+class FixedSubtitleService:
+    def load_subtitles(self, eng_srt_path, gael_srt_path):
+        return [
+            Segment(i, i + 0.8, f"Line {i}", f"Líne {i}", i + 1)
+            for i in range(args.segments)
+        ]
+
+    def write_subtitles(self, output_path, segments, language):
+        pass
+
+
+def orchestrator():
+    return DubbingOrchestrator(
+        SleepingAudioService(),
+        SleepingVideoService(),
+        FixedSubtitleService(),
+        NoOpProgressObserver(),
+        segment_delay_sec=0,
+    )
+
+
+with tempfile.TemporaryDirectory() as folder:
+    jobs = []
+    for episode in range(args.episodes):
+        video = Path(folder) / f"episode{episode}.mp4"
+        video.touch()
+        jobs.append(DubbingJob(video, video, video, f"episode{episode}_ga.mp4"))
+
+    began = time.perf_counter()
+    for job in jobs:
+        orchestrator().execute(job)
+    sequential = time.perf_counter() - began
+
+    began = time.perf_counter()
+    results = orchestrator().execute_many(jobs)
+    batch = time.perf_counter() - began
+
+print(JobResult.table(results))
+print()
+print(f"sequential: {args.episodes} episodes in {sequential:6.2f} s")
+print(f"     batch: {args.episodes} episodes in {batch:6.2f} s")
+print(f"   speedup: {sequential / batch:.2f}x")
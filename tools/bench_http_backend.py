@@ -0,0 +1,49 @@
+"""Benchmark HttpAudioService against the local synthesis stand-in.
+
+Run from the repository root:
+    python tools/bench_http_backend.py --lines 200 --latency 0.05 --threads 4
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from models import VoiceConfig
+from services.http_audio_service import HttpAudioService
+from services.synthesis_stand_in import StandInSynthesisServer
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--lines", type=int, default=200)
+parser.add_argument("--latency", type=float, default=0.05)
+parser.add_argument("--threads", type=int, default=4)
+args = parser.parse_args()
+
+voice = VoiceConfig(dialect="Kerry", gender="Female")
+
+with StandInSynthesisServer(latency_sec=args.latency) as server:
+    with tempfile.TemporaryDirectory() as out_dir:
+        service = HttpAudioService(endpoint=server.url, pool_size=args.threads)
+        service.setup()
+        try:
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=args.threads) as pool:
+                results = list(
+                    pool.map(
+                        lambda i: service.generate_audio(
+                            f"Líne {i}", voice, Path(out_dir)
+                        ),
+                        range(args.lines),
+                    )
+                )
+            elapsed = time.perf_counter() - start
+        finally:
+            service.cleanup()
+
+ok = sum(1 for r in results if r)
+print(f"{ok}/{args.lines} clips in {elapsed:.2f}s ({args.lines / elapsed:.1f} lines/s)")
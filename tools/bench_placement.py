@@ -0,0 +1,60 @@
+"""Benchmark global clip placement against placing each clip as soon as possible.
+
+Run from the repository root:
+    python tools/bench_placement.py --segments 50000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from services.placement import PlacementSolver
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--segments", type=int, default=50000)
+parser.add_argument("--spacing-ms", type=int, default=1500, help="Mean cue spacing")
+parser.add_argument("--skip-threshold-ms", type=int, default=2500)
+parser.add_argument("--seed", type=int, default=1)
+args = parser.parse_args()
+
+rng = random.Random(args.seed)
+starts = sorted(
+    rng.randint(0, args.segments * args.spacing_ms) for _ in range(args.segments)
+)
+durations = [rng.randint(200, 4000) for _ in range(args.segments)]
+
+
+def greedy():
+    placed, end = [], 0
+    for start, duration in zip(starts, durations):
+        position = max(start, end)
+        if position - start > args.skip_threshold_ms:
+            placed.append(None)
+            continue
+        placed.append(position)
+        end = position + duration
+    return placed
+
+
+def solved():
+    return PlacementSolver().solve(starts, durations, args.skip_threshold_ms)
+
+
+def bench(name, fn):
+    began = time.perf_counter()
+    placed = fn()
+    elapsed = time.perf_counter() - began
+    kept = [(p, s) for p, s in zip(placed, starts) if p is not None]
+    drift = sum(abs(p - s) for p, s in kept) / max(1, len(kept))
+    print(
+        f"{name:>7}: {args.segments} clips in {elapsed * 1000:7.1f} ms, "
+        f"{placed.count(None):5d} skipped, mean drift {drift:6.0f} ms"
+    )
+
+
+bench("greedy", greedy)
+bench("solved", solved)
@@ -0,0 +1,45 @@
+"""Benchmark the NumPy WSOLA time-stretch against pydub's speedup().
+
+Run from the repository root:
+    python tools/bench_time_stretch.py --seconds 60 --speed 1.4
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pydub.generators import Sine
+
+from services.audio_dsp import change_tempo
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--seconds", type=float, default=60)
+parser.add_argument("--speed", type=float, default=1.4)
+parser.add_argument("--frame-rate", type=int, default=22050)
+parser.add_argument("--repeat", type=int, default=3)
+args = parser.parse_args()
+
+clip = Sine(220, sample_rate=args.frame_rate).to_audio_segment(
+    duration=args.seconds * 1000, volume=-12
+)
+
+
+def bench(name, fn):
+    best = float("inf")
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    expected = len(clip) / args.speed
+    print(
+        f"{name:>14}: {best * 1000:8.1f} ms  "
+        f"(output {len(result)} ms, target {expected:.0f} ms)"
+    )
+
+
+print(f"{args.seconds:.0f}s clip at {args.frame_rate} Hz, speed x{args.speed}")
+bench("pydub speedup", lambda: clip.speedup(playback_speed=args.speed))
+bench("numpy WSOLA", lambda: change_tempo(clip, args.speed))
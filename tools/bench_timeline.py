@@ -0,0 +1,71 @@
+"""Benchmark track assembly: preallocated timeline vs AudioSegment appends.
+
+Run from the repository root:
+    python tools/bench_timeline.py --minutes 120 --cues 2000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pydub import AudioSegment
+from pydub.generators import Sine
+
+from services.timeline import TimelineBuffer, SHIFT
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--minutes", type=float, default=120)
+parser.add_argument("--cues", type=int, default=2000)
+parser.add_argument("--frame-rate", type=int, default=22050)
+parser.add_argument(
+    "--append-minutes",
+    type=float,
+    default=10,
+    help="Track length for the (quadratic) append baseline",
+)
+args = parser.parse_args()
+
+clip = Sine(220, sample_rate=args.frame_rate).to_audio_segment(
+    duration=1500, volume=-12
+)
+
+
+def cue_starts(minutes, cues):
+    spacing = minutes * 60000 / cues
+    return [round(i * spacing) for i in range(cues)]
+
+
+def with_timeline(minutes, cues):
+    timeline = TimelineBuffer(minutes * 60000)
+    end = 0
+    for start in cue_starts(minutes, cues):
+        end = timeline.write(start, clip, SHIFT) + len(clip)
+    return timeline.to_audio_segment(end)
+
+
+def with_appends(minutes, cues):
+    track = AudioSegment.silent(duration=0)
+    for start in cue_starts(minutes, cues):
+        if start > len(track):
+            track += AudioSegment.silent(duration=start - len(track))
+        track += clip
+    return track
+
+
+def bench(name, fn, minutes):
+    cues = max(1, round(args.cues * minutes / args.minutes))
+    start = time.perf_counter()
+    track = fn(minutes, cues)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{name:>9}: {minutes:6.1f} min, {cues:5d} cues in {elapsed * 1000:8.1f} ms "
+        f"(track {len(track) / 60000:.1f} min)"
+    )
+
+
+bench("timeline", with_timeline, args.minutes)
+bench("timeline", with_timeline, args.append_minutes)
+bench("appends", with_appends, args.append_minutes)